@@ -1,5 +1,6 @@
 # built-in libs
-import time
+import os
+import hashlib
 import itertools
 
 # 3rd-party libs
@@ -27,6 +28,80 @@ WT_SQUARE =ss.square(np.linspace(0, 2 * np.pi, 65536))
 WT_SAWTOOTH = ss.sawtooth(np.linspace(0, 2 * np.pi, 65536), 1)
 WT_TRIANGLE = ss.sawtooth(np.linspace(0, 2 * np.pi, 65536), 0.5)
 
+# directory of cached band-limited wavetables (see `get_mipmapped_wavetable`), `None` means no disk cache
+WAVETABLE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__cache__')
+
+# bump this when `_make_mipmapped_wavetable` changes, so that cached wavetables are rebuilt
+WAVETABLE_CACHE_VERSION = 1
+
+
+def _make_mipmapped_wavetable(wt, table_size):
+    """
+        band-limited versions of wavetable `wt` for every octave, by truncating its spectrum, [n_levels, table_size]
+        level k keeps harmonics up to `table_size // 2 >> k`, so it is alias-free for step lengths (see
+        `render_wavetable`) up to 2 ** k, i.e. frequencies up to `SF / table_size * 2 ** k`
+    """
+    n_levels = int(np.log2(table_size // 2)) + 1
+    spectrum = np.fft.rfft(wt) * table_size / len(wt)
+
+    tables = np.zeros((n_levels, table_size))
+    for k in range(n_levels):
+        n_harmonics = min((table_size // 2) >> k, len(spectrum) - 1)
+        spectrum_k = np.zeros(table_size // 2 + 1, dtype=complex)
+        spectrum_k[1:n_harmonics + 1] = spectrum[1:n_harmonics + 1]
+        tables[k] = np.fft.irfft(spectrum_k, table_size)
+
+    return tables
+
+
+# mipmapped wavetables in memory, (id of source wavetable, table size) -> (source wavetable, mipmapped wavetable)
+_MIPMAPPED_WAVETABLES = dict()
+
+
+def get_mipmapped_wavetable(wt, table_size=2048):
+    """
+        band-limited mipmap of wavetable `wt` (1 period), see `_make_mipmapped_wavetable`; it is generated once, then kept
+        in memory and cached to `WAVETABLE_CACHE_DIR` by the contents of `wt`
+    """
+    key = (id(wt), table_size)
+    if key in _MIPMAPPED_WAVETABLES and _MIPMAPPED_WAVETABLES[key][0] is wt:
+        return _MIPMAPPED_WAVETABLES[key][1]
+
+    wt_array = np.asarray(wt, dtype=float)
+    digest = hashlib.sha1(wt_array.tobytes() + repr((WAVETABLE_CACHE_VERSION, table_size)).encode('utf-8')).hexdigest()
+    path = None if WAVETABLE_CACHE_DIR is None else os.path.join(WAVETABLE_CACHE_DIR, f'wavetable_{digest[:16]}.npy')
+
+    # unreadable files are simply ignored, and will be overwritten
+    tables = None
+    if path is not None and os.path.isfile(path):
+        try:
+            tables = np.load(path)
+        except (OSError, ValueError):
+            tables = None
+
+    if tables is None or tables.shape[-1] != table_size:
+        tables = _make_mipmapped_wavetable(wt_array, table_size)
+        if path is not None:
+            # write to a temporary file first, so that an interrupted save never leaves a broken table
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, tables)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
+
+    tables.setflags(write=False)
+    _MIPMAPPED_WAVETABLES[key] = (wt, tables)
+    return tables
+
+
+def get_mipmap_levels(step_lengths, n_levels):
+    # levels of a mipmapped wavetable for step lengths (`wt.shape[-1] * freq / SF`), one level per octave
+    step_lengths = np.maximum(np.asarray(step_lengths, dtype=float), 1e-12)
+    return np.clip(np.ceil(np.log2(step_lengths)), 0, n_levels - 1).astype(int)
+
 
 def wave_generator(nnabs, wt=WT_TRIANGLE):
     wt_length = len(wt)
@@ -56,39 +131,113 @@ def wave_generator(nnabs, wt=WT_TRIANGLE):
         yield amp * values
 
 
+def render_wavetable(wt, poses, step_lengths, n_frames, out=None):
+    """
+        render a block of wavetable oscillators at once, with linear interpolation
+        `wt`:           wavetable, 1 period, or a mipmapped wavetable (see `get_mipmapped_wavetable`), whose levels
+                        are selected by frequencies of voices
+        `poses`:        [V] starting positions of voices (in samples of `wt`)
+        `step_lengths`: [V] position increments per frame (`wt.shape[-1] * freq / SF`)
+        `out`:          optional preallocated [V, n_frames] float array for samples
+        return [V, n_frames] samples and [V] starting positions of the next block (for phase continuity)
+    """
+    wt_length = np.shape(wt)[-1]
+    poses = np.asarray(poses, dtype=float)
+    step_lengths = np.asarray(step_lengths, dtype=float)
+
+    # positions, then fractional parts of positions, are computed in place of samples
+    values = np.empty((len(poses), n_frames)) if out is None else out
+    np.multiply(step_lengths[:, None], np.arange(n_frames), out=values)
+    values += poses[:, None]
+    values %= wt_length
+    xs_left = values.astype(int)
+    values -= xs_left
+
+    # rows of mipmapped wavetables are flattened
+    if np.ndim(wt) == 2:
+        offsets = get_mipmap_levels(step_lengths, len(wt))[:, None] * wt_length
+        wt = wt.ravel()
+    else:
+        offsets = 0
+    values_left = wt[offsets + xs_left]
+    values_right = wt[offsets + (xs_left + 1) % wt_length]
+    values_right -= values_left
+    values *= values_right
+    values += values_left
+
+    return values, (poses + step_lengths * n_frames) % wt_length
+
+
 class WavetableOscillator(object):
     def __init__(self, init_freq=440, init_amp=0.75, init_phase=0):
         self._freq = init_freq
         self._amp = init_amp
         self._phase = init_phase
 
-        self._step = 0
-        self._wt = WT_SAWTOOTH
-        self._wt_length = len(self._wt)
+        # phase accumulator, in samples of wavetable
+        self._pos = 0.0
+        self._wt = get_mipmapped_wavetable(WT_SAWTOOTH)
+        self._wt_length = self._wt.shape[-1]
         self._refresh_step_length()
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        pos = self._step * self._step_length + self._phase * self._wt_length / 360
-        # pos_l = int(pos)
-        # pos_r = pos_l + 1
-        # intp_l = self._wt[pos_l % self._wt_length] * (pos_r - pos)
-        # intp_r = self._wt[pos_r % self._wt_length] * (pos - pos_l)
-
-        self._step = self._step + 1
+        pos = self._pos + self._phase * self._wt_length / 360
+        self._pos = (self._pos + self._step_length) % self._wt_length
 
-        return self._wt[int(pos) % self._wt_length]  # self._amp * (intp_l + intp_r)
+        return self._wt_row[int(pos) % self._wt_length]
 
     def _refresh_step_length(self):
         self._step_length = self._wt_length * self._freq / SF
+        # level of mipmapped wavetable for `__next__`
+        self._wt_row = self._wt[get_mipmap_levels(self._step_length, len(self._wt))] if self._wt.ndim == 2 else self._wt
+
+    def render(self, n_frames):
+        # next `n_frames` samples (interpolated, with amplitude), continuous with previous blocks
+        return WavetableOscillator.render_all([self], n_frames)[0]
+
+    @staticmethod
+    def render_all(oscs, n_frames):
+        """
+            render next `n_frames` samples of all oscillators, oscillators sharing the same wavetable are rendered by
+            a single 2D array operation
+            return [V, n_frames] samples
+        """
+        samples = np.zeros((len(oscs), n_frames))
+        groups = {}
+        for i, osc in enumerate(oscs):
+            groups.setdefault(id(osc._wt), []).append(i)
+
+        for indices in groups.values():
+            wt = oscs[indices[0]]._wt
+            offsets = np.array([oscs[i]._phase * wt.shape[-1] / 360 for i in indices])
+            poses = np.array([oscs[i]._pos for i in indices]) + offsets
+            step_lengths = np.array([oscs[i]._step_length for i in indices])
+            amps = np.array([oscs[i]._amp for i in indices])
+
+            values, poses = render_wavetable(wt, poses, step_lengths, n_frames)
+            samples[indices] = amps[:, None] * values
+            for i, pos in zip(indices, ((poses - offsets) % wt.shape[-1]).tolist()):
+                oscs[i]._pos = pos
+
+        return samples
 
     def set_freq(self, freq):
         self._freq = float(freq)
         self._refresh_step_length()
         return self
 
+    def set_wavetable(self, wt):
+        # a wavetable (1 period) or a mipmapped wavetable, phase is kept
+        wt = np.asarray(wt)
+        self._pos = self._pos * wt.shape[-1] / self._wt_length
+        self._wt = wt
+        self._wt_length = wt.shape[-1]
+        self._refresh_step_length()
+        return self
+
     def set_amp(self, amp):
         self._amp = float(amp)
         return self
@@ -175,13 +324,174 @@ class ADSREnvelope(object):
         return self
 
 
+# stages of `ADSREnvelopeBank`
+ADSR_IDLE, ADSR_ATTACK, ADSR_DECAY, ADSR_SUSTAIN, ADSR_RELEASE = 0, 1, 2, 3, 4
+
+
+class ADSREnvelopeBank(object):
+    def __init__(self, n_voices, attack_time=0.05, decay_time=0.05, sustain_level=0.5, release_time=0.1):
+        """
+            block rendering version of `ADSREnvelope` for `n_voices` voices, per-voice states are kept in arrays, so
+            all envelopes advance in one vectorized call; parameters are scalars or [n_voices] arrays
+        """
+        self._n_voices = n_voices
+        self._attack_time = np.broadcast_to(np.asarray(attack_time, dtype=float), (n_voices, )).copy()
+        self._decay_time = np.broadcast_to(np.asarray(decay_time, dtype=float), (n_voices, )).copy()
+        self._sustain_level = np.broadcast_to(np.asarray(sustain_level, dtype=float), (n_voices, )).copy()
+        self._release_time = np.broadcast_to(np.asarray(release_time, dtype=float), (n_voices, )).copy()
+
+        # stage, value of the next frame, and its increment per frame
+        self._stage = np.full(n_voices, ADSR_IDLE, dtype=int)
+        self._level = np.zeros(n_voices)
+        self._slope = np.zeros(n_voices)
+
+        self._scale = np.ones(n_voices)
+
+    def __len__(self):
+        return self._n_voices
+
+    def _enter(self, indices, stage):
+        # move voices to a stage, stages of zero length (or zero slope) are skipped: attack -> decay -> sustain,
+        # release -> idle
+        indices = np.asarray(indices, dtype=int)
+        if stage == ADSR_ATTACK:
+            has_attack = (self._attack_time[indices] > 0) & (self._level[indices] < 1)
+            attack = indices[has_attack]
+            self._stage[attack] = ADSR_ATTACK
+            self._slope[attack] = (1 - self._level[attack]) / (self._attack_time[attack] * SF)
+            self._level[indices[~has_attack]] = 1
+            self._enter(indices[~has_attack], ADSR_DECAY)
+        elif stage == ADSR_DECAY:
+            has_decay = (self._decay_time[indices] > 0) & (self._level[indices] > self._sustain_level[indices])
+            decay = indices[has_decay]
+            self._stage[decay] = ADSR_DECAY
+            self._slope[decay] = -(1 - self._sustain_level[decay]) / (self._decay_time[decay] * SF)
+            self._enter(indices[~has_decay], ADSR_SUSTAIN)
+        elif stage == ADSR_SUSTAIN:
+            self._stage[indices] = ADSR_SUSTAIN
+            self._level[indices] = self._sustain_level[indices]
+            self._slope[indices] = 0
+        elif stage == ADSR_RELEASE:
+            has_release = (self._release_time[indices] > 0) & (self._level[indices] > 0)
+            release = indices[has_release]
+            self._stage[release] = ADSR_RELEASE
+            self._slope[release] = -self._level[release] / (self._release_time[release] * SF)
+            self._enter(indices[~has_release], ADSR_IDLE)
+        else:
+            self._stage[indices] = ADSR_IDLE
+            self._level[indices] = 0
+            self._slope[indices] = 0
+
+    def _get_stage_lengths(self, indices):
+        # number of frames until voices leave their stages (inf for sustain and idle)
+        stage, level, slope = self._stage[indices], self._level[indices], self._slope[indices]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lengths = np.select(
+                [stage == ADSR_ATTACK, stage == ADSR_DECAY, stage == ADSR_RELEASE],
+                [np.floor((1 - level) / slope) + 1, np.floor((level - self._sustain_level[indices]) / -slope) + 1, np.ceil(level / -slope)],
+                np.inf
+            )
+        # stages whose lengths cannot be computed end at once
+        return np.maximum(np.where(np.isnan(lengths), 0, lengths), 0)
+
+    def render(self, n_frames, note_ons=None, note_offs=None, indices=None, out=None):
+        """
+            values of the next `n_frames` frames of voices `indices` (default: all voices), [len(indices), n_frames]
+            `note_ons`, `note_offs`: frame offsets (aligned with `indices`) in this block where voices start attack or
+            release (-1 for no event), note_on wins if both land on the same frame
+            `out`: optional preallocated [len(indices), n_frames] float array for values
+        """
+        voices = np.arange(self._n_voices) if indices is None else np.asarray(indices, dtype=int)
+        V = len(voices)
+        note_ons = np.full(V, -1) if note_ons is None else np.asarray(note_ons, dtype=int)
+        note_offs = np.full(V, -1) if note_offs is None else np.asarray(note_offs, dtype=int)
+
+        frames = np.arange(n_frames)
+        cursor = np.zeros(V, dtype=int)
+        active = np.arange(V)
+        values = None
+
+        # every pass renders one linear segment of every active voice from its cursor to the end of block, and stops the
+        # voice at the end of stage or the next event; following passes (of fewer voices) overwrite the rest of segments
+        while active.size:
+            av = voices[active]
+            self._enter(av[note_ons[active] == cursor[active]], ADSR_ATTACK)
+            self._enter(av[(note_offs[active] == cursor[active]) & (note_ons[active] != cursor[active])], ADSR_RELEASE)
+
+            events = np.stack([note_ons[active], note_offs[active]])
+            events = np.where(events > cursor[active], events, n_frames).min(axis=0)
+            lengths = self._get_stage_lengths(av)
+            ends = np.minimum(np.minimum(cursor[active] + lengths, events), n_frames).astype(int)
+
+            k = frames[None, :] - cursor[active, None]
+            if values is None:
+                # the first pass covers all voices from frame 0
+                values = np.multiply(self._slope[av, None], k, out=np.empty((V, n_frames)) if out is None else out)
+                values += self._level[av, None]
+            else:
+                segments = self._level[av, None] + self._slope[av, None] * k
+                values[active] = np.where(k >= 0, segments, values[active])
+
+            # advance levels, and move voices whose stages end to the next stages
+            self._level[av] += self._slope[av] * (ends - cursor[active])
+            finished = av[(ends - cursor[active]) >= lengths]
+            stages = self._stage[finished]
+            for stage, next_stage in [(ADSR_ATTACK, ADSR_DECAY), (ADSR_DECAY, ADSR_SUSTAIN), (ADSR_RELEASE, ADSR_IDLE)]:
+                to_next = finished[stages == stage]
+                if stage == ADSR_ATTACK:
+                    self._level[to_next] = 1
+                self._enter(to_next, next_stage)
+
+            cursor[active] = ends
+            active = active[cursor[active] < n_frames]
+
+        if values is None:
+            values = np.empty((V, n_frames)) if out is None else out
+        values *= self._scale[voices, None]
+        return values
+
+    def get_stage(self):
+        return self._stage
+
+    def get_level(self):
+        return self._level
+
+    def set_status(self, indices, status):
+        # immediate note_on (status 1) or note_off (status 0) of voices, like `ADSREnvelope.set_status`
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        if status == 1:
+            self._enter(indices, ADSR_ATTACK)
+        elif status == 0:
+            self._enter(indices[self._stage[indices] != ADSR_IDLE], ADSR_RELEASE)
+        return self
+
+    def reset(self, indices):
+        # silence voices at once (without release)
+        self._enter(np.atleast_1d(np.asarray(indices, dtype=int)), ADSR_IDLE)
+        return self
+
+    def set_scale(self, scale, indices=None):
+        if indices is None:
+            self._scale[:] = scale
+        else:
+            self._scale[indices] = scale
+        return self
+
+
 class PolySynthMono(object):
-    def __init__(self, unison=3, detune_range=3, unison_mix=0.2):
-        self._notes = {}
-        self._oscs = {}
-        self._adsrs = {}
-        self._times = {}
-        self._locks = {}
+    def __init__(self, unison=3, detune_range=3, unison_mix=0.2, max_voices=64, steal_policy='oldest', chunk_size=64):
+        """
+            polyphonic synthesizer, states of all voices live in preallocated arrays (structure of arrays), a note takes
+            one voice slot of `unison` oscillators; voice slots are reused through a free list, when all `max_voices`
+            slots are taken, a new note steals one by `steal_policy`:
+
+            'oldest':   the earliest started note
+            'quietest': the note of the lowest envelope level
+            'released': the earliest released note (the earliest started note if no note is released)
+            None:       no stealing, new notes are dropped
+        """
+        if steal_policy not in ['oldest', 'quietest', 'released', None]:
+            raise ValueError("`steal_policy` should be 'oldest', 'quietest', 'released' or None!")
 
         # for unison
         self._unison = unison
@@ -191,55 +501,124 @@ class PolySynthMono(object):
         # for adsr
         self._adsr_values = [0.005, 0.05, 0.2, 0.2]
 
-    def note_on(self, nnabs):
-        self._notes[nnabs] = Note().from_nnabs(nnabs)
-
-        freq = self._notes[nnabs].get_frequency()
-        freqs = np.linspace(freq - self._detune_range, freq + self._detune_range, self._unison)
-        self._oscs[nnabs] = [WavetableOscillator().set_freq(f) for f in freqs]
-
+        # voice slots
+        self._max_voices = max_voices
+        self._steal_policy = steal_policy
+        self._chunk_size = chunk_size
+        self._frame = 0
+
+        self._slot_nnabs = np.full(max_voices, -1, dtype=int)
+        self._slot_start = np.zeros(max_voices, dtype=int)
+        self._slot_release = np.full(max_voices, -1, dtype=int)
+        self._free_slots = list(range(max_voices - 1, -1, -1))
+        self._active_slots = np.zeros(0, dtype=int)
+        self._nnabs_to_slot = {}
+
+        # oscillators ([max_voices, unison]) and envelopes ([max_voices * unison]), amplitudes of oscillators are
+        # merged into scales of envelopes
+        self._wt = get_mipmapped_wavetable(WT_SAWTOOTH)
+        self._amp = 0.75
+        self._pos = np.zeros((max_voices, unison))
+        self._step_length = np.zeros((max_voices, unison))
+        self._adsrs = ADSREnvelopeBank(max_voices * unison, *self._adsr_values)
         scales = [1 - self._unison_mix if self._unison - 2 <= 2 * i <= self._unison else self._unison_mix for i in range(self._unison)]
-        self._adsrs[nnabs] = [ADSREnvelope(*self._adsr_values).set_status(1).set_scale(scale) for scale in scales]
+        self._adsrs.set_scale(self._amp * np.tile(scales, max_voices))
+
+        # output buffer, and work buffers of oscillators and envelopes ([max_voices * unison, chunk_size])
+        self._samples = np.zeros((chunk_size, ))
+        self._samples_osc = np.zeros((max_voices * unison, chunk_size))
+        self._samples_env = np.zeros((max_voices * unison, chunk_size))
+
+    def _get_voices(self, slots):
+        # indices of oscillators (and envelopes) of voice slots
+        return (np.asarray(slots, dtype=int)[:, None] * self._unison + np.arange(self._unison)).ravel()
+
+    def _steal_slot(self):
+        slots = self._active_slots
+        if self._steal_policy is None or not slots.size:
+            return None
+        elif self._steal_policy == 'quietest':
+            levels = self._adsrs.get_level()[self._get_voices(slots)].reshape(-1, self._unison).sum(axis=-1)
+            slot = int(slots[np.argmin(levels)])
+        elif self._steal_policy == 'released' and np.any(self._slot_release[slots] >= 0):
+            released = slots[self._slot_release[slots] >= 0]
+            slot = int(released[np.argmin(self._slot_release[released])])
+        else:
+            slot = int(slots[np.argmin(self._slot_start[slots])])
+        self._free_slot(slot)
+        return self._free_slots.pop()
+
+    def _free_slot(self, slot):
+        self._nnabs_to_slot.pop(self._slot_nnabs[slot], None)
+        self._slot_nnabs[slot] = -1
+        self._slot_release[slot] = -1
+        self._adsrs.reset(self._get_voices([slot]))
+        self._free_slots.append(slot)
+        self._active_slots = self._active_slots[self._active_slots != slot]
 
-        self._times[nnabs] = time.time()
-        self._locks[nnabs] = True
+    def note_on(self, nnabs):
+        # a held (or releasing) note is retriggered in its own slot
+        slot = self._nnabs_to_slot.get(nnabs)
+        if slot is None:
+            slot = self._free_slots.pop() if self._free_slots else self._steal_slot()
+            if slot is None:
+                return self
+
+            freq = Note().from_nnabs(nnabs).get_frequency()
+            freqs = np.linspace(freq - self._detune_range, freq + self._detune_range, self._unison)
+            self._pos[slot] = 0
+            self._step_length[slot] = self._wt.shape[-1] * freqs / SF
+            self._slot_nnabs[slot] = nnabs
+            self._nnabs_to_slot[nnabs] = slot
+            self._active_slots = np.append(self._active_slots, slot)
+
+        self._slot_start[slot] = self._frame
+        self._slot_release[slot] = -1
+        self._adsrs.set_status(self._get_voices([slot]), 1)
 
         return self
 
     def note_off(self, nnabs):
-        if nnabs in self._notes.keys():
-            for i in range(len(self._adsrs[nnabs])):
-                self._adsrs[nnabs][i].set_status(0)
-            self._times[nnabs] = time.time()
-            self._locks[nnabs] = False
+        slot = self._nnabs_to_slot.get(nnabs)
+        if slot is not None and self._slot_release[slot] < 0:
+            self._adsrs.set_status(self._get_voices([slot]), 0)
+            self._slot_release[slot] = self._frame
+        return self
 
     def countdown_step(self):
-        del_list = []
-        for k, v in self._locks.items():
-            if not v and time.time() - self._times[k] > self._adsr_values[-1]:
-                del_list.append(k)
-
-        for k in del_list:
-            self._notes.pop(k)
-            self._oscs.pop(k)
-            self._adsrs.pop(k)
-            self._times.pop(k)
-            self._locks.pop(k)
+        # free slots of released notes whose envelopes have finished (counted in samples by envelopes)
+        slots = self._active_slots[self._slot_release[self._active_slots] >= 0]
+        if slots.size:
+            stages = self._adsrs.get_stage()[self._get_voices(slots)].reshape(-1, self._unison)
+            for slot in slots[np.all(stages == ADSR_IDLE, axis=-1)].tolist():
+                self._free_slot(slot)
 
         return self
 
+    def get_voice_count(self):
+        return len(self._active_slots)
+
+    def get_chunk_size(self):
+        return self._chunk_size
+
     def get_samples(self):
-        chunk_size = 64
-        samples = np.zeros((chunk_size, ))
-
-        if self._oscs:
-            samples_tmp = []
-            for k, v in self._oscs.items():
-                samples_osc = [np.array([next(vi) for _ in range(chunk_size)]) for vi in v]
-                samples_adsr = [np.array([next(vi) for _ in range(chunk_size)]) for vi in self._adsrs[k]]
-                samples_tmp.append(np.sum([o * a for o, a in zip(samples_osc, samples_adsr)], axis=0))
-            samples = np.sum(samples_tmp, axis=0)
-            samples = samples / 8
+        # the returned buffer is reused by the next call
+        chunk_size = self._chunk_size
+        samples = self._samples
+        samples[:] = 0
+
+        # only oscillators of active voice slots are rendered and mixed
+        slots = self._active_slots
+        if slots.size:
+            n_voices = slots.size * self._unison
+            samples_osc, poses = render_wavetable(self._wt, self._pos[slots].ravel(), self._step_length[slots].ravel(), chunk_size, out=self._samples_osc[:n_voices])
+            self._pos[slots] = poses.reshape(-1, self._unison)
+            samples_osc *= self._adsrs.render(chunk_size, indices=self._get_voices(slots), out=self._samples_env[:n_voices])
+            samples_osc.sum(axis=0, out=samples)
+            samples /= 8
+
+        self._frame += chunk_size
+        self.countdown_step()
 
         return samples
 
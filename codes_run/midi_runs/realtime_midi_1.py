@@ -14,6 +14,7 @@ stream = p.open(format=pyaudio.paFloat32, channels=1, rate=SF, frames_per_buffer
 
 notes = []
 notes_buffer = [Note('C')] * 3
+chord_name_index = get_chord_name_index()
 while(1):
     for msg in port.iter_pending():
         os.system('cls')
@@ -32,7 +33,7 @@ while(1):
 
             # 按照音高整理音符列表，并计算和弦名称
             notes.sort(key=lambda note: note.get_nnabs())
-            print(Chord().set_notes(body=notes).get_sorted_chord().get_name(), ' - ', f'[{", ".join([note.get_name() for note in notes])}]', '-', f'{[note.get_nnrel() for note in notes]}')
+            print((chord_name_index.identify(notes, key_center=note_key_center.get_enharmonic_note_by_key_center('C').get_name()) or ['null'])[0], ' - ', f'[{", ".join([note.get_name() for note in notes])}]', '-', f'{[note.get_nnrel() for note in notes]}')
 
             # 播放音频
             wo = WavetableOscillator()
@@ -51,7 +52,7 @@ while(1):
             notes.pop(idx)
 
             # 计算剩余音符组成的和弦名称
-            print(Chord().set_notes(body=notes).get_sorted_chord().get_name(), ' - ', f'[{", ".join([note.get_name() for note in notes])}]', '-', f'{[note.get_nnrel() for note in notes]}')
+            print((chord_name_index.identify(notes, key_center=note_key_center.get_enharmonic_note_by_key_center('C').get_name()) or ['null'])[0], ' - ', f'[{", ".join([note.get_name() for note in notes])}]', '-', f'{[note.get_nnrel() for note in notes]}')
 
         else:
             continue
@@ -1,22 +1,10 @@
 from theories import *
-from itertools import combinations_with_replacement
 
-accidentals = [''] + [f'#{k}' for k in range(1, 8)] + [f'b{k}' for k in range(1, 8)]
+# all heptatonic scale classes in 12-TET, with their orders and lowest-order scale types (of the canonical mode)
+scale_classes = []
+for steps, order, scale_types in iter_named_scale_classes(Tuning(12, 7, 5)):
+    scale_classes.append(f'C {scale_types[0][1]}')
+    print(steps, order, scale_classes[-1])
 
-lydians = ['F Lydian']
-for acc in combinations_with_replacement(accidentals, 8):
-    cur_altered_notes = f"({', '.join([s for s in acc if s != ''])})"
-    cur_scale_name = f'F Lydian{cur_altered_notes}'
-    cur_ads = AlteredDiatonicScale(cur_scale_name).set_printoptions(ns=0)
-
-    if not cur_ads.if_well_formed():
-        continue
-
-    distances = [cur_ads.distance_0(AlteredDiatonicScale(other_scale)) for other_scale in lydians]
-    if 0 in distances:
-        continue
-    else:
-        lydians.append(cur_scale_name)
-
-print(lydians)
-print(len(lydians))
+print(scale_classes)
+print(len(scale_classes), get_scale_class_count(Tuning(12, 7, 5)))
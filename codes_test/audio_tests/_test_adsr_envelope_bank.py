@@ -0,0 +1,42 @@
+import timeit
+from audio import *
+
+''' 批量 ADSR 包络：与逐样本的 ADSREnvelope 对比（块内 note_off），并测试大量包络同时推进的耗时 '''
+
+chunk_size = 64
+adsr = ADSREnvelope(0.1, 0.1, 0.5, 0.1)
+adsr_bank = ADSREnvelopeBank(1, 0.1, 0.1, 0.5, 0.1).set_status(0, 1)
+
+# note_off at frame 20000, in the middle of a block
+ys = [next(adsr) for _ in range(20000)]
+adsr.set_status(0)
+ys = np.array(ys + [next(adsr) for _ in range(407 * chunk_size - 20000)])
+
+blocks = [adsr_bank.render(chunk_size, note_offs=[20000 - k] if 0 <= 20000 - k < chunk_size else None) for k in range(0, len(ys), chunk_size)]
+ys_bank = np.concatenate(blocks, axis=1)[0]
+print(len(ys), np.abs(ys - ys_bank).max(), adsr_bank.get_stage(), adsr_bank.get_level())
+
+# stages of zero slope are skipped: sustain level 1 (no decay), and note_on right after attack reaches 1
+adsr = ADSREnvelope(0.001, 0.01, 1.0, 0.01)
+ys = np.array([next(adsr) for _ in range(128)])
+adsr_bank = ADSREnvelopeBank(2, 0.001, 0.01, 1.0, 0.01).set_status([0, 1], 1)
+ys_bank = np.concatenate([adsr_bank.render(chunk_size) for _ in range(2)], axis=1)
+print(np.abs(ys - ys_bank[0]).max(), adsr_bank.get_stage())
+
+adsr_bank = ADSREnvelopeBank(1, 0.001, 0.01, 0.5, 0.01).set_status(0, 1)
+adsr_bank.render(49)
+print(adsr_bank.get_level(), adsr_bank.render(chunk_size, note_ons=[0])[0, :3], adsr_bank.get_stage())
+
+# voices of different parameters, note_on and note_off at random frames
+n_voices = 4096
+rng = np.random.default_rng(0)
+adsr_bank = ADSREnvelopeBank(n_voices, rng.uniform(0, 0.01, n_voices), 0.05, rng.uniform(0.2, 0.8, n_voices), 0.01)
+note_ons = rng.integers(-1, chunk_size, n_voices)
+note_offs = rng.integers(-1, chunk_size, n_voices)
+values = adsr_bank.render(chunk_size, note_ons, note_offs)
+print(values.shape, values.min(), values.max(), np.bincount(adsr_bank.get_stage(), minlength=5))
+
+seconds = min(timeit.repeat(lambda: adsr_bank.render(chunk_size), number=100, repeat=3)) / 100
+print(f'{n_voices} envelopes | {seconds / n_voices * 1e6:.3f} us per envelope per {chunk_size}-frame block')
+seconds = min(timeit.repeat(lambda: [next(adsr) for _ in range(chunk_size)], number=100, repeat=3)) / 100
+print(f'1 envelope (per-sample) | {seconds * 1e6:.3f} us per {chunk_size}-frame block')
@@ -0,0 +1,34 @@
+import timeit
+from audio import *
+
+''' 带限多级波表：比较高音处朴素波表与带限波表的混叠能量，检查磁盘缓存，并比较渲染耗时 '''
+
+wt_bl = get_mipmapped_wavetable(WT_SAWTOOTH)
+print(wt_bl.shape, f'{wt_bl.nbytes // 1024} KiB vs {WT_SAWTOOTH.nbytes // 1024} KiB')
+print(os.listdir(WAVETABLE_CACHE_DIR))
+
+# generated once: the same object from memory
+print(get_mipmapped_wavetable(WT_SAWTOOTH) is wt_bl)
+
+
+def get_alias_ratio(samples, freq):
+    # energy out of harmonic bins (1 s of audio, bins of 1 Hz), in dB
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples)))) ** 2
+    bins = np.arange(len(spectrum))
+    harmonic = np.abs((bins + freq / 2) % freq - freq / 2) <= 3
+    return 10 * np.log10(spectrum[~harmonic].sum() / spectrum[harmonic].sum())
+
+
+for nnabs in [45, 69, 93, 105]:
+    freq = round(Note().from_nnabs(nnabs).get_frequency())
+    step_lengths = [WT_SAWTOOTH.shape[-1] * freq / SF, wt_bl.shape[-1] * freq / SF]
+    naive = render_wavetable(WT_SAWTOOTH, [0], step_lengths[:1], SF)[0][0]
+    band_limited = render_wavetable(wt_bl, [0], step_lengths[1:], SF)[0][0]
+    print(f'{freq:>5} Hz | level {get_mipmap_levels(step_lengths[1], len(wt_bl))} | alias: naive {get_alias_ratio(naive, freq):6.1f} dB, band-limited {get_alias_ratio(band_limited, freq):6.1f} dB')
+
+# render time of 256 voices
+freqs = np.geomspace(55, 1760, 256)
+for name, wt in [('naive (65536)', WT_SAWTOOTH), ('band-limited (11 x 2048)', wt_bl)]:
+    step_lengths = wt.shape[-1] * freqs / SF
+    seconds = min(timeit.repeat(lambda: render_wavetable(wt, np.zeros(256), step_lengths, 64), number=100, repeat=3)) / 100
+    print(f'{name:<26} | {seconds * 1e3:.3f} ms per 64-frame block')
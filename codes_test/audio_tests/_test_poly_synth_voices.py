@@ -0,0 +1,35 @@
+import timeit
+from audio import *
+
+''' 复音合成器：声部分配、抢占策略与按样本数计算的释音，并测试 64 个以上声部在 64 帧回调中的耗时 '''
+
+# voice stealing
+for steal_policy in ['oldest', 'quietest', 'released', None]:
+    psm = PolySynthMono(max_voices=4, steal_policy=steal_policy)
+    for nnabs in [48, 52, 55, 59]:
+        psm.note_on(nnabs)
+        psm.get_samples()
+    psm.note_off(52)
+    psm.get_samples()
+    psm.note_on(62)
+    print(steal_policy, sorted(psm._nnabs_to_slot.keys()))
+
+# released notes are freed after release time (0.2 s), counted in samples
+psm = PolySynthMono()
+psm.note_on(60)
+for _ in range(10):
+    psm.get_samples()
+psm.note_off(60)
+n_chunks = 0
+while psm.get_voice_count():
+    psm.get_samples()
+    n_chunks += 1
+print(n_chunks * 64 / SF, 's')
+
+# time of one 64-frame callback
+for max_voices in [16, 64, 128]:
+    psm = PolySynthMono(max_voices=max_voices)
+    for nnabs in range(36, 36 + max_voices):
+        psm.note_on(nnabs)
+    seconds = min(timeit.repeat(psm.get_samples, number=200, repeat=3)) / 200
+    print(f'{max_voices:>3} notes x 3 unison | {seconds * 1e3:.3f} ms per callback ({64 / SF * 1e3:.3f} ms of audio)')
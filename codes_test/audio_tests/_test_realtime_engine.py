@@ -0,0 +1,42 @@
+import time
+from realtime import *
+
+''' 实时音频引擎：用假音频设备驱动回调，检查事件环形缓冲区、和弦分析线程、回调超时与延迟统计 '''
+
+# ring buffer wraps around, and drops events when full
+ring = EventRingBuffer(4)
+out = np.zeros(4, dtype=EVENT_DTYPE)
+for note in range(6):
+    ring.push(EVENT_NOTE_ON, note)
+print(len(ring), ring.get_dropped_count(), ring.pop_into(out), out['note'])
+ring.push(EVENT_NOTE_OFF, 60)
+print(ring.pop_into(out), out['note'][:1])
+
+# engine driven by a fake audio sink, chord names are printed by the analysis thread
+engine = RealtimeEngine(PolySynthMono(), frames_per_buffer=64, on_analysis=lambda name: print('analysis:', name)).start()
+sink = FakeAudioSink(engine.audio_callback, frames_per_buffer=64, record=True).start()
+
+for notes in [[48, 52, 55, 58], [53, 57, 60], [55, 59, 62, 65]]:
+    for note in notes:
+        engine.push_note_on(note)
+    time.sleep(0.3)
+    for note in notes:
+        engine.push_note_off(note)
+    time.sleep(0.1)
+time.sleep(0.3)
+
+sink.stop()
+engine.stop()
+
+stats = engine.get_stats()
+for key in ['callbacks', 'overruns', 'dropped_events', 'latency_percentiles_ms', 'callback_percentiles_ms']:
+    print(key, stats[key])
+samples = sink.get_recorded()
+print(samples.shape, samples.dtype, np.abs(samples).max(), engine._synth.get_voice_count())
+
+# blocks larger than `frames_per_buffer` (or not a multiple of chunk size) are rejected
+for frame_count in [128, 48]:
+    try:
+        engine.render(frame_count)
+    except ValueError as e:
+        print(frame_count, e)
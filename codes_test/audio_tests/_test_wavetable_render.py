@@ -0,0 +1,24 @@
+import timeit
+from audio import *
+
+''' 波表振荡器：逐样本与整块渲染对比，并估计单核可实时运行的声部数 '''
+
+# blocks are continuous: 10 blocks of 64 frames == 1 block of 640 frames
+wo_1, wo_2 = WavetableOscillator().set_freq(440), WavetableOscillator().set_freq(440)
+blocks = np.concatenate([wo_1.render(64) for _ in range(10)])
+print(np.abs(blocks - wo_2.render(640)).max())
+
+chunk_size = 64
+n_chunks = SF // chunk_size
+for n_voices in [1, 16, 64, 256]:
+    freqs = np.geomspace(55, 1760, n_voices)
+    wos = [WavetableOscillator().set_freq(freq) for freq in freqs]
+
+    # one second of audio in 64-frame chunks
+    seconds = min(timeit.repeat(lambda: [WavetableOscillator.render_all(wos, chunk_size) for _ in range(n_chunks // 10)], number=1, repeat=3)) * 10
+    print(f'{n_voices:>4} voices | block: {seconds:.3f} s per second of audio | ~{int(n_voices / seconds)} voices in real time')
+
+# per-sample iteration, for comparison
+wo = WavetableOscillator().set_freq(440)
+seconds = min(timeit.repeat(lambda: [next(wo) for _ in range(SF // 10)], number=1, repeat=3)) * 10
+print(f'   1 voice  | per-sample: {seconds:.3f} s per second of audio | ~{int(1 / seconds)} voices in real time')
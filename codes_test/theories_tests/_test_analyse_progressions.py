@@ -0,0 +1,22 @@
+import time
+import random
+from theories import *
+
+''' 批量分析和弦进行：根音进行、共同音、最小声部进行距离与共同背景音阶，重复的和弦对只计算一次 '''
+
+progression = [Chord(chord_name) for chord_name in ['Dm7', 'G7', 'CM7', 'Am7', 'Bb7', 'EbM7']]
+results = analyse_progressions(progression)
+for key, values in results.items():
+    print(f'{key:<14}', values.tolist())
+
+print(get_voice_leading_distance([0, 4, 7], [11, 2, 5, 7]), get_voice_leading_distance([0, 4, 7], [0, 3, 7]))
+print(get_voice_leading_distance([0, 6, 11], [0, 5, 11], '19.11.8'))
+
+# a corpus of random songs
+random.seed(0)
+chord_names = ['C', 'Dm', 'Em', 'F', 'G7', 'Am', 'Bm7-5', 'CM7', 'FM7']
+songs = [[Chord(random.choice(chord_names)) for _ in range(32)] for _ in range(300)]
+
+t0 = time.time()
+results = analyse_progressions(songs)
+print(f'{len(results["position"])} pairs | {time.time() - t0:.3f}s |', np.bincount(results['voice_leading']))
@@ -0,0 +1,39 @@
+import os
+import time
+import multiprocessing
+from theories import *
+
+''' 持久化分析缓存（SQLite）：第二次计算直接读取缓存，多个进程可以共用同一个缓存文件 '''
+
+cache_path = os.path.join('__cache__', 'analysis_test.sqlite3')
+chord_names = ['CM7', 'Dm7', 'G7', 'Em7-5', 'A7(b9)', 'FM7(9, #11)', 'Bm7-5', 'E7(#9, b13)']
+
+
+def get_scales(chord_name):
+    return chord_name, Chord(chord_name).get_scale(max_order=2)
+
+
+# worker processes re-import this script when they are spawned (e.g. on Windows), so everything runs under main guard
+if __name__ == '__main__':
+    cache = enable_analysis_cache(cache_path, max_entries=1000)
+    cache.clear()
+
+    for k in range(2):
+        t_0 = time.perf_counter()
+        results = [get_scales(chord_name) for chord_name in chord_names]
+        t_1 = time.perf_counter()
+        print(f'round {k}: {(t_1 - t_0) * 1e3:.1f} ms, {len(cache)} cached results')
+
+    # worker processes read and write the same cache
+    cache.clear()
+    with multiprocessing.Pool(3, initializer=enable_analysis_cache, initargs=(cache_path, 1000)) as pool:
+        results_mp = pool.map(get_scales, chord_names)
+    print('same results in worker processes:', results == results_mp, f'{len(cache)} cached results')
+
+    # analysis cache is opt-in
+    disable_analysis_cache()
+    print(get_analysis_cache())
+
+    for path in [cache_path, f'{cache_path}-wal', f'{cache_path}-shm']:
+        if os.path.isfile(path):
+            os.remove(path)
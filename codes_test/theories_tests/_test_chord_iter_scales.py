@@ -0,0 +1,20 @@
+import time
+from itertools import islice
+from theories import *
+
+''' 和弦背景音阶的惰性枚举：只取前 k 个结果，以及 19-TET 下稀疏和弦的枚举耗时 '''
+
+# first 3 background scales of EM9
+print(list(islice(Chord('EM9').iter_scales(), 3)))
+
+for tuning in [Tuning(12, 7, 5), Tuning(19, 11, 8)]:
+    for chord_name in ['C', 'C R.5', 'CM7']:
+        chord = Chord(chord_name, tuning)
+
+        t_0 = time.perf_counter()
+        first_scale = next(chord.iter_scales(max_order=2), None)
+        t_1 = time.perf_counter()
+        scale_names = chord.get_scale(max_order=2)
+        t_2 = time.perf_counter()
+
+        print(f'{tuning.NGS} | {chord_name:<6} | first: {(t_1 - t_0) * 1e3:7.1f} ms | all {len(scale_names):3d}: {(t_2 - t_1) * 1e3:7.1f} ms | {first_scale}')
@@ -0,0 +1,29 @@
+import timeit
+from theories import *
+
+''' 和弦识别索引：由音级集合（位掩码）与低音直接查出排好序的和弦名称，包括转位与斜线和弦 '''
+
+n_ops = 100000
+
+index = get_chord_name_index()
+print(len(index), 'keys |', len(index.get_chord_types()), 'chord types')
+
+# root position, inversion, slash chord, and an unknown set
+voicings = [[60, 64, 67, 71], [64, 67, 71, 72], [62, 64, 67, 71, 72], [57, 60, 64, 67], [60, 63, 66, 69], [60, 62, 64, 66, 67]]
+for voicing in voicings:
+    print(voicing, index.identify(voicing))
+
+# tertian chords (and inversions) go before quartal and exotic types, unnamed types and double accidentals are dropped
+for voicing in [[67, 72, 76], [55, 60, 64, 67], [60, 64, 67, 71, 74], [61, 66, 69], [60, 64, 67, 69]]:
+    print(voicing, index.identify(voicing, key_center='C'))
+
+# notes and key centers
+print(index.identify(Chord('F#m7-5/C').get_notes()), index.identify([66, 70, 73], key_center='F#'), index.identify([66, 70, 73], key_center='Gb'))
+print(index.get(index.get_mask([60, 64, 67]), bass=64))
+
+# 19-TET
+print(get_chord_name_index('19.11.8').identify(Chord('CM7', '19.11.8').get_notes()))
+
+us_index = min(timeit.repeat(lambda: index.identify([64, 67, 71, 72]), number=n_ops, repeat=5)) / n_ops * 1e6
+us_chord = min(timeit.repeat(lambda: Chord().set_notes(body=[Note().from_nnabs(n) for n in [64, 67, 71, 72]]).get_sorted_chord().get_name(), number=n_ops // 100, repeat=5)) / (n_ops // 100) * 1e6
+print(f'index: {us_index:.2f} us/op | get_sorted_chord: {us_chord:.2f} us/op')
@@ -0,0 +1,20 @@
+from theories import *
+
+''' 和弦进行目录：按音阶类分块生成列数据，单进程与多进程结果一致，并流式写入 csv '''
+
+# worker processes re-import this script when they are spawned (e.g. on Windows), so everything runs under main guard
+if __name__ == '__main__':
+    chunks = list(iter_chord_progression_catalogue(ALL_SCALE_TYPES['12.7.5'][:3]))
+    for column in CHORD_PROGRESSION_CATALOGUE_COLUMNS:
+        print(f'{column:<14}', chunks[0][column][:6].tolist())
+
+    # parallel mode (chunks are still in order)
+    chunks_parallel = list(iter_chord_progression_catalogue(ALL_SCALE_TYPES['12.7.5'][:3], processes=3))
+    print(all([all([(c1[k] == c2[k]).all() for k in c1]) for c1, c2 in zip(chunks, chunks_parallel)]))
+
+    # triads in 19-TET
+    chunk = next(iter_chord_progression_catalogue(['C-mode', 'A-mode'], n_notes=3, tuning='19.11.8'))
+    print(chunk['root_movement'][:6].tolist(), chunk['type_next'][:6].tolist())
+
+    print(write_chord_progression_catalogue('_test_chord_progression_catalogue.csv', ALL_SCALE_TYPES['12.7.5'][:3]))
+    os.remove('_test_chord_progression_catalogue.csv')
@@ -0,0 +1,21 @@
+import time
+from theories import *
+
+''' 和弦音阶的避免音查表：12-TET 与 19-TET 下的 ChordScale，以及一次性标注 66 个音阶类 × 7 个调式 '''
+
+for tuning in ['12.7.5', '19.11.8']:
+    for scale_name in ['D Dorian', 'G Mixolydian', 'B Locrian']:
+        cs = ChordScale(scale_name, tuning)
+        print(tuning, scale_name, [note.get_message('avoid') for note in cs], cs.if_fake_dom7(), cs.if_fake_m7())
+    print(cs.get_long_list())
+
+# changing chord notes is a table lookup
+cs = ChordScale('C Altered Dominant').set_chord_notes((0, 2, 4))
+print([note.get_message('avoid') for note in cs], len(get_avoid_note_table()))
+
+# all 66 heptatonic scale classes x 7 modes
+t0 = time.time()
+results = label_chord_scales()
+print(f'{time.time() - t0:.3f}s', results['labels'].shape, results['fake_dom7'].sum(), results['fake_m7'].sum())
+print(ALL_SCALE_TYPES['12.7.5'][results['scale_type'][10]], results['mode'][10], results['labels'][10].tolist())
+print(label_chord_scales(tuning='19.11.8')['labels'].tolist())
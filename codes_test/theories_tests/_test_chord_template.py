@@ -0,0 +1,22 @@
+import timeit
+from theories import *
+
+''' 和弦类型模板：和弦类型编译为音程向量模板，(根音, 类型, 延伸音, 低音) 的音符向量有缓存；检查缓存命中与耗时 '''
+
+n_ops = 10000
+
+print(chord_name_parser('CM7(9, #11)'), compile_chord_type('R.3.5.7', '(9, #11)'))
+
+# notes are fresh copies, changing them will not affect the cache
+chord = Chord('CM7(9, #11)')
+chord[0].add_accidental(1)
+print(chord, Chord('CM7(9, #11)'), Chord('Bb3m7-5(b9)/E').get_notes())
+
+# 19-TET
+print(Chord('CM7(9, #11)', '19.11.8').get_notes())
+
+print(get_parser_cache_info()['chord_type'], get_parser_cache_info()['chord_notes'])
+
+symbols = ['CM7', 'Dm7', 'G7(b9, 13)', 'Bbm7-5/E', 'F#dim7', 'Ebaug']
+us_per_op = min(timeit.repeat(lambda: [Chord(symbol) for symbol in symbols], number=n_ops, repeat=5)) / n_ops / len(symbols) * 1e6
+print(f'Chord(): {us_per_op:.2f} us/op')
@@ -0,0 +1,35 @@
+import timeit
+from copy import copy
+from theories import *
+
+''' 整数数组存储的音阶：音符视图可写回音阶，拷贝得到普通音符；并测试构造与读取耗时 '''
+
+n_ops = 10000
+
+# views write through to the scale
+ads = AlteredDiatonicScale('C Ionian')
+ads[2].add_accidental(-1)
+ads[6].add_accidental(-1)
+print(ads.get_name(), ads, ads.get_nnabs_list())
+
+# copies are ordinary notes
+note = copy(ads[2]).add_accidental(1)
+print(type(note).__name__, note, ads[2], ads[2].get_message('degree'))
+
+# 19-TET
+ads_19 = AlteredDiatonicScale('C Ionian', '19.11.8')
+print(ads_19, [str(interval) for interval in ads_19.get_intervals_seq()])
+
+# the altered scale of the benchmark
+print(AlteredDiatonicScale('G Dorian(#4)').get_name())
+
+benchmarks = {
+    'DiatonicScale()': lambda: DiatonicScale('Eb D-mode'),
+    'AlteredDiatonicScale()': lambda: AlteredDiatonicScale('G Dorian(#4)'),
+    'get_nnabs_list()': ads.get_nnabs_list,
+    'get_intervals_cum()': ads.get_intervals_cum,
+}
+
+for name, func in benchmarks.items():
+    us_per_op = min(timeit.repeat(func, number=n_ops, repeat=5)) / n_ops * 1e6
+    print(f'{name:<24} | {us_per_op:8.2f} us/op')
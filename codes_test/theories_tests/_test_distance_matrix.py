@@ -0,0 +1,32 @@
+import time
+import tracemalloc
+from theories import *
+
+''' 批量计算 66 个七声音阶类之间的结构距离矩阵，与逐对计算的结果比较，并检查度量性质 '''
+
+scales = [AlteredDiatonicScale('C ' + scale_type) for scale_type in ALL_SCALE_TYPES['12.7.5']]
+
+t_0 = time.perf_counter()
+distances, offsets = distance_matrix_0(scales, return_offsets=True)
+t_1 = time.perf_counter()
+distances_pairwise = np.array([[scale_1.distance_0(scale_2) for scale_2 in scales] for scale_1 in scales])
+t_2 = time.perf_counter()
+
+print(f'batched: {(t_1 - t_0) * 1e3:.1f} ms | pairwise: {(t_2 - t_1) * 1e3:.1f} ms')
+print('same results:', (distances == distances_pairwise).all())
+print(distances[:8, :8])
+print(offsets[0, 1], scales[0].distance_0(scales[1], return_offsets=True)[1][0])
+
+asymmetric_pairs, triangle_violations = check_metric(distances)
+print(f'{len(asymmetric_pairs)} asymmetric pairs, {len(triangle_violations)} triangle inequality violations')
+
+# enharmonic distances (`AlteredDiatonicScale.distance_1`)
+print(distance_matrix_1(scales[:5], [AlteredDiatonicScale('B# ' + scale_type) for scale_type in ALL_SCALE_TYPES['12.7.5'][:5]]))
+
+# higher temperaments: blocks are sized by `max_block_bytes`, so peak memory stays bounded
+scales_53 = list(ScaleBank(tonics=[Tuning(53, 31, 22).NAMED_STR_LIN[0]], tuning='53.31.22'))
+tracemalloc.start()
+distances_53 = distance_matrix_0(scales_53, max_block_bytes=2 ** 24)
+peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+tracemalloc.stop()
+print(len(scales_53), 'scales in 53-TET |', f'peak {peak_mb:.1f} MB |', 'same results:', (distances_53[:3, :3] == [[s_1.distance_0(s_2) for s_2 in scales_53[:3]] for s_1 in scales_53[:3]]).all())
@@ -0,0 +1,54 @@
+import timeit
+from theories import *
+
+''' 音程查找表：与查表前实现给出的已知名称比较，检查表内名称可由通用解析算法还原，并比较查表与通用算法的耗时 '''
+
+n_ops = 100000
+
+# (delta_nnabs, delta_lidx) -> names in ns -1/0/1 and r357t, given by the implementation before the tables
+known_names = {
+    Tuning(12, 7, 5): {
+        (0, 0): ['P1', 'M1', 'P1', 'R'], (1, 1): ['m2', 'm2', 'd2', 'b2'], (3, 1): ['A2', 'A2', 'A2', '#2'],
+        (4, 2): ['M3', 'M3', 'P3', '3'], (5, 3): ['P4', 'M4', 'P4', '4'], (6, 3): ['A4', 'A4', 'A4', '#4'],
+        (6, 4): ['d5', 'm5', 'd5', 'b5'], (8, 4): ['A5', 'A5', 'A5', '#5'], (10, 6): ['m7', 'm7', 'd7', 'b7'],
+        (12, 7): ['P8', 'M8', 'P8', '8'], (14, 8): ['M9', 'M9', 'P9', '9'], (17, 10): ['P11', 'M11', 'P11', '11'],
+        (-4, -2): ['-M3', '-M3', '-P3', '-3'], (-7, -4): ['-P5', '-M5', '-P5', '-5'],
+    },
+    Tuning(19, 11, 8): {
+        (1, 1): ['d2', 'd2', 'dd2', 'bb2'], (2, 1): ['m2', 'm2', 'd2', 'b2'], (6, 2): ['M3', 'M3', 'P3', '3'],
+        (9, 3): ['A4', 'A4', 'A4', '#4'], (10, 4): ['d5', 'm5', 'd5', 'b5'], (11, 4): ['P5', 'M5', 'P5', '5'],
+        (17, 6): ['M7', 'M7', 'P7', '7'], (19, 7): ['P8', 'M8', 'P8', '8'],
+    },
+}
+
+for tuning, names in known_names.items():
+    tables = get_interval_tables(tuning)
+    print(tuning, '|', len(tables['vector_to_name']), 'names |', len(tables['r357t_to_vector']), 'r357ts')
+
+    # known names are in the tables, and are returned by table lookups
+    for vector, (name_0, name_1, name_2, r357t) in names.items():
+        for ns, interval_name in zip([-1, 0, 1], [name_0, name_1, name_2]):
+            assert tables['vector_to_name'][(*vector, ns)] == interval_name
+            assert Interval.interval_vector_to_interval_name(*vector, ns, tuning) == interval_name
+            assert Interval.interval_name_to_interval_vector(interval_name, ns, tuning) == vector
+        assert Interval._new(*vector, tuning).get_r357t() == r357t
+
+    # every name in the tables is parsed back to its vector by the general parser
+    for (delta_nnabs, delta_lidx, ns), interval_name in tables['vector_to_name'].items():
+        assert Interval._interval_name_to_interval_vector(interval_name, ns, tuning) == (delta_nnabs, delta_lidx)
+    print('known names OK')
+
+# vectors out of range fall back to the general algorithm
+print(Interval.interval_vector_to_interval_name(4 + 12 * 5, 2 + 7 * 5), Interval('AAAAAAA4'), Interval('M3').get_r357t())
+
+interval = Interval('A4')
+benchmarks = {
+    'table': lambda: Interval.interval_vector_to_interval_name(6, 3),
+    'general': lambda: Interval._interval_vector_to_interval_name(6, 3, -1, DEFAULT_TUNING),
+    'table (r357t)': lambda: interval.get_r357t(),
+    'general (r357t)': lambda: Interval._interval_vector_to_r357t(6, 3, False, DEFAULT_TUNING),
+}
+
+for name, func in benchmarks.items():
+    ns_per_op = min(timeit.repeat(func, number=n_ops, repeat=5)) / n_ops * 1e9
+    print(f'{name:<16} | {ns_per_op:8.1f} ns/op')
@@ -0,0 +1,29 @@
+import time
+from theories import *
+
+''' NoteArray / IntervalArray：与 Note / Interval 逐个计算的结果对比，以及大规模计算耗时 '''
+
+note_names = ['C0', 'C#1', 'Bb2', 'Fbb3', 'E#-1', 'B##2', 'Gb0']
+interval_names = ['P1', 'm2', 'M3', '-P5', 'A4', 'd8', 'M9']
+
+notes = NoteArray(note_names)
+intervals = IntervalArray(interval_names)
+
+print(notes + intervals)
+print([str(Note(n) + Interval(i)) for n, i in zip(note_names, interval_names)])
+print(notes - Note('D1'))
+print(notes.get_enharmonic_note_by_key_center('F#'))
+
+# broadcasting: every note plus every interval, shape [7, 7]
+notes_col = NoteArray().set_vector(*[v[:, None] for v in notes.get_vector()])
+intervals_row = IntervalArray().set_vector(*[v[None, :] for v in intervals.get_vector()])
+print((notes_col + intervals_row).get_name())
+
+# 1,000,000 notes
+notes = NoteArray().from_nnabs(np.random.randint(0, 120, 1000000), key_center='Eb')
+t = time.time()
+notes_new = (notes + Interval('M3')).get_enharmonic_note_by_key_center('Eb')
+gidxs = notes_new.get_gidx()
+frequencies = notes_new.get_frequency()
+names = notes_new.get_name()
+print(f'{time.time() - t:.3f}s')
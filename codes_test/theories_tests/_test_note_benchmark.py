@@ -0,0 +1,42 @@
+import timeit
+import tracemalloc
+from theories import *
+
+''' 测量 `Note` 常用运算的耗时（ns/op）与内存分配（每次运算保留的 bytes 与 blocks） '''
+
+n_ops = 100000
+
+note_1 = Note('Eb2')
+note_2 = Note('G#0')
+interval = Interval('M3')
+
+benchmarks = {
+    'Note + Interval': lambda: note_1 + interval,
+    'Note - Note': lambda: note_1 - note_2,
+    'int(Note)': lambda: int(note_1),
+}
+
+
+def allocations(func, n=10000):
+    # keep the results alive, so that the traced memory is the memory retained by `n` results
+    tracemalloc.start()
+    snapshot_1 = tracemalloc.take_snapshot()
+    results = [func() for _ in range(n)]
+    snapshot_2 = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = snapshot_2.compare_to(snapshot_1, 'filename')
+    size = sum([stat.size_diff for stat in stats])
+    count = sum([stat.count_diff for stat in stats])
+
+    # subtract the list holding the results
+    size = size - results.__sizeof__()
+    count = count - 1
+
+    return size / n, count / n
+
+
+for name, func in benchmarks.items():
+    ns_per_op = min(timeit.repeat(func, number=n_ops, repeat=5)) / n_ops * 1e9
+    bytes_per_op, blocks_per_op = allocations(func)
+    print(f'{name:<16} | {ns_per_op:8.1f} ns/op | {bytes_per_op:6.1f} bytes/op | {blocks_per_op:4.1f} blocks/op')
@@ -0,0 +1,16 @@
+import time
+from theories import *
+
+''' 重复解析相同的名称，观察解析器缓存的命中情况 '''
+
+names = ['C Ionian', 'D Dorian(b2)', 'E Phrygian Dominant', 'F Lydian(b7)', 'G Mixolydian', 'A Harmonic Minor', 'B Locrian']
+
+t = time.time()
+for _ in range(1000):
+    for name in names:
+        AlteredDiatonicScale(name)
+        Chord(f'{name[0]}m7(9, 11)/G')
+print(f'{time.time() - t:.3f}s')
+
+for parser, info in get_parser_cache_info().items():
+    print(f'{parser:<8} | hits: {info.hits:6d} | misses: {info.misses:3d} | size: {info.currsize}/{info.maxsize}')
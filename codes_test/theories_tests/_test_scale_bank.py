@@ -0,0 +1,31 @@
+import time
+from theories import *
+
+''' 音阶库：一次性构造所有主音、调式与变音组合，批量计算和弦与音阶名称，并与逐个构造音阶对象比较耗时 '''
+
+bank = ScaleBank(tonics=['F'])
+print(bank, len(bank))
+
+# scale 10 of the bank, and its materialized `AlteredDiatonicScale`
+print(bank.get_notes()[10], bank[10], bank.get_name()[10], bank.get_order()[10])
+print(bank.get_intervals_cum()[10])
+print(bank.get_chord(0, 4)[10], bank.get_chord_name(0, 4, type_only=True)[10])
+
+# batched
+t0 = time.time()
+names = bank.get_name(type_only=True)
+chord_names = [bank.get_chord_name(deg, 4, type_only=True) for deg in range(7)]
+t1 = time.time()
+
+# one by one
+for k, scale in enumerate(bank):
+    assert scale.get_name(type_only=True) == names[k]
+    for deg in range(7):
+        assert Chord().set_notes(body=scale.get_chord(deg, 4)).get_name(type_only=True) == chord_names[deg][k]
+t2 = time.time()
+
+print(f'batched: {t1 - t0:.3f}s | one by one: {t2 - t1:.3f}s')
+
+# tunings without known scale types: diatonic modes
+bank_19 = ScaleBank(tonics=['C'], tuning='19.11.8')
+print(bank_19, bank_19.get_name()[:3])
@@ -0,0 +1,28 @@
+import time
+from itertools import combinations
+from theories import *
+
+''' 用项链枚举（FKM 算法）列出所有 M 声音阶类，并与暴力枚举 + 规范化的结果比较 '''
+
+# worker processes re-import this script when they are spawned (e.g. on Windows), so everything runs under main guard
+if __name__ == '__main__':
+    for tuning in [Tuning(12, 7, 5), Tuning(17, 10, 7), Tuning(19, 11, 8)]:
+        t_0 = time.perf_counter()
+        scale_classes = list(iter_scale_classes(tuning))
+        t_1 = time.perf_counter()
+        brute_force = set([get_canonical_steps(nnrels, tuning) for nnrels in combinations(range(tuning.N), tuning.M)])
+        t_2 = time.perf_counter()
+
+        print(f'{tuning.NGS} | {len(scale_classes)} scale classes (expected {get_scale_class_count(tuning)}) | same as brute force: {set(scale_classes) == brute_force}')
+        print(f'necklaces: {(t_1 - t_0) * 1e3:.1f} ms | brute force: {(t_2 - t_1) * 1e3:.1f} ms')
+
+    # scale classes of diatonic scale and melodic minor scale
+    print(get_canonical_steps(DiatonicScale('E Ionian').get_nnrel_list()), get_canonical_steps(AlteredDiatonicScale('C Melodic Minor').get_nnrel_list()))
+
+    # names of scale classes can be searched in worker processes
+    for steps, order, scale_types in iter_named_scale_classes(Tuning(12, 7, 5), processes=2):
+        if order <= 1:
+            print(steps, order, [scale_type[1] for scale_type in scale_types])
+
+    # entries searched by workers are merged into the index of this process
+    print(len(get_scale_name_index('12.7.5')) >= get_scale_class_count(Tuning(12, 7, 5)))
@@ -0,0 +1,19 @@
+import time
+from theories import *
+
+''' 音阶类索引：首次命名时搜索并写入索引，之后命名只需查表（索引在退出时保存到 __cache__/） '''
+
+scale_names = [f'{tonic} {scale_type}' for tonic in ['C', 'F#', 'Bb'] for scale_type in ALL_SCALE_TYPES['12.7.5']]
+scales = [AlteredDiatonicScale(scale_name) for scale_name in scale_names]
+
+index = get_scale_name_index()
+print(f'{len(index)} scale classes loaded from {index.get_path()}')
+
+for k in range(2):
+    t_0 = time.perf_counter()
+    names = [scale.get_name() for scale in scales]
+    t_1 = time.perf_counter()
+    print(f'round {k}: {(t_1 - t_0) / len(scales) * 1e6:.1f} us per scale, {len(index)} scale classes in index')
+
+print(scales[-1].get_scale_class_key(), names[-1])
+print(index.get(scales[-1].get_scale_class_key()))
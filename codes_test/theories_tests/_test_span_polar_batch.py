@@ -0,0 +1,49 @@
+import timeit
+from theories import *
+
+''' 批量计算和弦的跨度、两极音与质心，检查与逐个计算的结果一致，并比较耗时 '''
+
+chords = [Chord(f'{root} {chord_type}') for root in ['C', 'F#', 'Bb', 'Ab'] for chord_types in CHORD_TYPE_NS0_TO_NS1['12.7.5'].values() for chord_type in chord_types[:1]]
+gidxs, mask = get_gidx_batch(chords)
+print(gidxs.shape, mask.sum())
+
+for enharmonic in [False, True]:
+    spans = get_span_batch(gidxs, mask, enharmonic)
+    bottoms, tops = get_polar_batch(gidxs, mask, enharmonic)
+    for b, chord in enumerate(chords):
+        assert spans[b] == get_span(chord, enharmonic)
+        polar = [(chord[i], chord[j]) for i, j in zip(bottoms[b], tops[b]) if i >= 0]
+        assert polar == get_polar(chord, enharmonic)
+print('batch OK')
+
+chord = Chord('C M7')
+# other tunings: pass the tuning of the chords, gidxs are taken mod its `N`
+chords_19 = [[Note(name, '19.11.8') for name in names] for names in [['C', 'E', 'G'], ['B', 'D', 'F', 'A'], ['C', 'Gb']]]
+gidxs_19, mask_19 = get_gidx_batch(chords_19)
+spans_19 = get_span_batch(gidxs_19, mask_19, enharmonic=True, tuning='19.11.8')
+assert spans_19.tolist() == [get_span(chord, enharmonic=True) for chord in chords_19]
+assert all([[(chord[i], chord[j]) for i, j in zip(*[p[b] for p in get_polar_batch(gidxs_19, mask_19, True, '19.11.8')]) if i >= 0] == get_polar(chord, enharmonic=True) for b, chord in enumerate(chords_19)])
+print(spans_19, '19-TET OK')
+
+print(chord.get_name(), get_span(chord, enharmonic=True), get_polar(chord, enharmonic=True), get_mass_center_batch(gidxs[:3], mask[:3]))
+
+# candidate tension notes against every chord at once: append one column
+notes = [Note('Gb').add_gidx(k) for k in range(2 * 12 - 7)]
+tension_gidxs = np.array([note.get_gidx() for note in notes])
+B, L = gidxs.shape
+gidxs_ex = np.concatenate([np.repeat(gidxs[:, None, :], len(notes), axis=1), np.broadcast_to(tension_gidxs[None, :, None], (B, len(notes), 1))], axis=-1)
+mask_ex = np.concatenate([np.repeat(mask[:, None, :], len(notes), axis=1), np.ones((B, len(notes), 1), dtype=bool)], axis=-1)
+new_spans = get_span_batch(gidxs_ex.reshape(-1, L + 1), mask_ex.reshape(-1, L + 1), enharmonic=True).reshape(B, len(notes))
+assert all([new_spans[b, k] == get_span([*chord, note], enharmonic=True) for b, chord in enumerate(chords) for k, note in enumerate(notes)])
+print(new_spans.shape, 'tension spans OK')
+
+benchmarks = {
+    'get_span (loop)': lambda: [get_span(chord, enharmonic=True) for chord in chords],
+    'get_span_batch': lambda: get_span_batch(gidxs, mask, enharmonic=True),
+    'get_polar (loop)': lambda: [get_polar(chord, enharmonic=True) for chord in chords],
+    'get_polar_batch': lambda: get_polar_batch(gidxs, mask, enharmonic=True),
+}
+
+for name, func in benchmarks.items():
+    us_per_chord = min(timeit.repeat(func, number=10, repeat=3)) / 10 / len(chords) * 1e6
+    print(f'{name:<18} | {us_per_chord:8.2f} us/chord')
@@ -0,0 +1,29 @@
+import time
+from theories import *
+
+''' 和弦 tension 分类表（T0 ~ T5）：统计各类数量，并检查与逐个计算的跨度一致 '''
+
+tab = get_tension_table()
+print(len(tab['chord_name']), 'rows')
+print({tension_type: int((tab['tension_type'] == tension_type).sum()) for tension_type in ['T0', 'T1', 'T2', 'T3', 'T4', 'T5']})
+
+# rows of C7
+for k in np.nonzero(tab['chord_name'] == 'C7')[0]:
+    print(tab['tension_note'][k], tab['tension_position'][k], tab['new_span'][k], tab['tension_type'][k])
+
+# spans agree with `get_span`
+for k in range(0, len(tab['chord_name']), 997):
+    chord = [Note(name) for name in tab['chord_notes'][k].split(', ')]
+    assert tab['chord_span'][k] == get_span(chord, enharmonic=True)
+    assert tab['new_span'][k] == get_span([*chord, Note(tab['tension_note'][k])], enharmonic=True)
+print('span OK')
+
+# a full sweep of all named chord types, written chunk by chunk
+start = time.time()
+n_rows = write_tension_table('diatonic_tensions_all.csv')
+print(n_rows, f'{time.time() - start:.2f} s')
+os.remove('diatonic_tensions_all.csv')
+
+# other tunings, half tone (m2) is taken from the tuning
+tab_19 = get_tension_table(tuning='19.11.8')
+print(len(tab_19['chord_name']), 'rows (19-TET)', {tension_type: int((tab_19['tension_type'] == tension_type).sum()) for tension_type in ['T0', 'T1', 'T2', 'T3', 'T4', 'T5']})
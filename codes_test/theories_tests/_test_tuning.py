@@ -0,0 +1,27 @@
+from theories import *
+
+''' 在同一个进程中同时使用 12-TET、19-TET 与 53-TET '''
+
+tunings = [Tuning(12, 7, 5), Tuning(19, 11, 8), Tuning(53, 31, 22)]
+
+for tuning in tunings:
+    print(tuning)
+    ds = DiatonicScale(tuning=tuning)
+    tonic = ds[0]
+    print(ds.get_name(), ds, ds.get_nnabs_list())
+    print([str(interval) for interval in ds.get_intervals_cum()])
+    print([f'{note.get_frequency():.2f}' for note in ds])
+    print(Chord().set_notes(body=ds.get_chord(0, 4)).get_name(), tonic + Interval('M3', tuning))
+    print()
+
+# tunings are cached per NGS
+print(Tuning(19, 11, 8) is Tuning.from_ngs('19.11.8'))
+
+# notes of different tunings cannot be mixed
+try:
+    Note('C') - Note('C', '19.11.8')
+except ValueError as e:
+    print(e)
+
+# intervals (like notes) of different tunings are never equal
+print(Interval('P1', '12.7.5') == Interval('P1', '19.11.8'), Interval('P1', '12.7.5') != Interval('P1', '19.11.8'), Interval('M3') != Interval('M3'), Interval('M3') != Interval('A3'))
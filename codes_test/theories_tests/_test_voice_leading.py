@@ -0,0 +1,29 @@
+import time
+import random
+import itertools
+from theories import *
+
+''' 最小声部进行：对候选排列做动态规划，求总移动量最小的声部排列；与穷举结果比较，并测试长和弦序列的耗时 '''
+
+progression = [Chord(chord_name) for chord_name in ['D m7', 'G 7', 'C M7', 'A m7(9)', 'F/A', 'Bb 7(#11)', 'Eb M7', 'C']]
+voicings, cost = solve_voice_leading(progression, n_voices=4, low='C2', high='C4', return_cost=True)
+for chord, voicing in zip(progression, voicings):
+    print(f'{chord.get_name():<10}', voicing)
+print(cost)
+
+# brute force on the first 4 chords
+candidates = [get_voicing_candidates(chord) for chord in progression[:4]]
+motions = [sum([sum([abs(int(n1) - int(n2)) for n1, n2 in zip(v1, v2)]) for v1, v2 in zip(path[:-1], path[1:])]) for path in itertools.product(*candidates)]
+print(min(motions), solve_voice_leading(progression[:4], return_cost=True)[1])
+
+# 19-TET, 3 voices
+print(solve_voice_leading([Chord('C', '19.11.8'), Chord('F', '19.11.8'), Chord('G 7', '19.11.8')], n_voices=3, keep_bass=False))
+
+# long sequences (linear time)
+random.seed(0)
+chord_names = ['C', 'D m7', 'E m', 'F', 'G 7', 'A m', 'B m7-5', 'C M7', 'F M7', 'E 7', 'A 7']
+song = [Chord(random.choice(chord_names)) for _ in range(5000)]
+for beam_width in [None, 16]:
+    t0 = time.time()
+    voicings, cost = solve_voice_leading(song, beam_width=beam_width, return_cost=True)
+    print(f'beam_width: {beam_width} | {len(voicings)} chords | cost: {cost} | {time.time() - t0:.3f}s')
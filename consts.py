@@ -20,14 +20,9 @@ N = 12  # `N`-tone equal temperament (`N`-TET)
 G = 7   # generator (step length)
 S = 5   # starter (starting point)
 
-# most basic calculations
-M = pow(G, -1, N)                            # number of tones in diatonic scale
-T = 2 ** (1 / N)                             # ratio of semi-tone frequencies
-C3 = 440 * (T ** (36 - 45))                  # frequency of C3
-NGS = '.'.join([str(k) for k in [N, G, S]])  # NGS for dict indexing
-
-# define named note names in linear order, e.g. '12.7.5' -> 'CDEFGAB'
-NAMED_STR_LIN = {
+# define named note names in linear order for every NGS, e.g. '12.7.5' -> 'CDEFGAB'
+# (greek letters are used for NGSs not listed here, see `Tuning`)
+NAMED_STR_LIN_TABLE = {
     '12.5.4': 'CDEGA',
     '12.7.0': 'cdeFgab',  # F == f#
     '12.7.5': 'CDEFGAB',
@@ -35,39 +30,18 @@ NAMED_STR_LIN = {
     '19.11.0': 'cdeFgab',  # F == f#
     '19.11.8': 'CDEFGAB',
     '53.31.22': 'cCdDefFgGaAb',  # C == c#, D == d#, F == f#, G == g#, A == a#
-    '97.56.0': str().join([chr(ord('A')+j) for j in range(M)]),  # 26-tone diatonic scale
-}.get(NGS, str().join([chr(int('03B1', 16)+j) for j in range(M)]))
-
-# relative note numbers (nnrels) in generative order, e.g. [5, 0, 7, 2, 9, 4, 11]
-NAMED_NNREL_GEN = [(S + i * G) % N for i in range(M)]
-
-# relative note numbers (nnrels) in linear order, e.g. [0, 2, 4, 5, 7, 9, 11]
-NAMED_NNREL_LIN = sorted(NAMED_NNREL_GEN)
-
-# nnrel/str convertors, e.g. [0, 2, 4, 5, 7, 9, 11] -> 'CDEFGAB'
-NNREL_TO_STR = {nnrel: NAMED_STR_LIN[i] for i, nnrel in enumerate(NAMED_NNREL_LIN)}
-STR_TO_NNREL = dict((v, k) for k, v in NNREL_TO_STR.items())
-
-# change `NAMED_STR_LIN` into generative order, e.g. 'CDEFGAB' -> 'FCGDAEB'
-NAMED_STR_GEN = ''.join([NNREL_TO_STR[k] for k in NAMED_NNREL_GEN])
+    '97.56.0': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',  # 26-tone diatonic scale
+}
 
 # offset of gidx, will affect `Note.get_gidx` method
 GIDX_OFFSET = 0
 
-# generative step length of 2nd degree interval
-# STEP_LENGTH_2ND_GEN = [(i * G) % N for i in range(M)].index(min([(i * G) % N for i in range(1, M)]))  # [old method]
-STEP_LENGTH_2ND_GEN = M - (N % M)  # [new method] found in 2022-06-29
-
 # TODO: how to define the most reasonable interval for stacked chord in any TET system?
 # linear step length of stacked chord interval
 STEP_LENGTH_CHD_LIN = 2
 
-# defaults
-DEFAULT_NOTE_NAME = f'{NAMED_STR_LIN[0]}0'
-DEFAULT_KEY_CENTER = f'{NAMED_STR_LIN[0]}0'
+# defaults (other defaults depend on NGS, see `Tuning`)
 DEFAULT_INTERVAL_NAME = 'P1'
-DEFAULT_DIATONIC_SCALE_NAME = f'{NAMED_STR_LIN[0]} {NAMED_STR_LIN[0]}-mode'
-DEFAULT_CHORD_NAME = f'{NAMED_STR_LIN[0]}0'
 
 
 ''' ----------------------------------------------------------------------------------------- '''
@@ -138,7 +112,15 @@ class ngs_checker(object):
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            assert NGS in self._ngs_list, f'`{func.__name__}` works properly only when NGS in {self._ngs_list}!'
+            # NGS of a `Tuning` argument, then NGS of the instance (methods), then the default NGS
+            tunings = [arg for arg in list(args) + list(kwargs.values()) if isinstance(arg, Tuning)]
+            if tunings:
+                ngs = tunings[0].NGS
+            elif args and isinstance(getattr(args[0], '_tuning', None), Tuning):
+                ngs = args[0]._tuning.NGS
+            else:
+                ngs = NGS
+            assert ngs in self._ngs_list, f'`{func.__name__}` works properly only when NGS in {self._ngs_list}!'
             return func(*args, **kwargs)
         return wrapper
 
@@ -156,9 +138,6 @@ DELTA_LIDX_TO_NS = {
     '19.11.8': [1, 0, 0, 1, 1, 0, 0]
 }
 
-# major delta nnrels for interval
-DELTA_NNREL_MAJOR = sorted([(i * G) % N for i in range(M)])
-
 # for the sake of perfect 4th (P5(ns1) = M5(ns0), but P4(ns1) = m4(ns0) in traditional music theory)
 DELTA_NNREL_OFFSET = {
     '12.7.5': [0, 0, 0, -1, 0, 0, 0],
@@ -198,11 +177,11 @@ SCALE_TYPE_NS0_TO_NS1 = {
 # scale type converter, change naming scheme 1 to naming scheme 0, e.g. 'Ionian' -> 'C-mode'
 SCALE_TYPE_NS1_TO_NS0 = dict((ngs, dict((v, k) for k, vs in d.items() for v in vs)) for ngs, d in SCALE_TYPE_NS0_TO_NS1.items())
 
-# default diatonic scale ns
-DEFAULT_DIATONIC_SCALE_NS = {
+# default diatonic scale ns for every NGS (0 for NGSs not listed here)
+DEFAULT_DIATONIC_SCALE_NS_TABLE = {
     '12.7.5': 1,
     '19.11.8': 1,
-}.get(NGS, 0)
+}
 
 
 ''' ----------------------------------------------------------------------------------------- '''
@@ -355,25 +334,26 @@ SCALE_TYPE_NS0_TO_NS2 = {
 # altered scale type converter, change naming scheme 2 to naming scheme 0, e.g. 'HmP5b' -> 'E-mode(#3)'
 SCALE_TYPE_NS2_TO_NS0 = dict((ngs, dict((v, k) for k, vs in d.items() for v in vs)) for ngs, d in SCALE_TYPE_NS0_TO_NS2.items())
 
-# default altered diatonic scale ns
-DEFAULT_ALTERED_DIATONIC_SCALE_NS = {
+# default altered diatonic scale ns for every NGS (0 for NGSs not listed here)
+DEFAULT_ALTERED_DIATONIC_SCALE_NS_TABLE = {
     '12.7.5': 2,
     '19.11.8': 2,
-}.get(NGS, 0)
+}
 
 
-def scale_type_convertor(scale_type, ns_old, ns_new):
+def scale_type_convertor(scale_type, ns_old, ns_new, ngs=None):
+    ngs = NGS if ngs is None else ngs
     if ns_old == 0 and ns_new == 1:
-        mapping = SCALE_TYPE_NS0_TO_NS1.get(NGS, {})
+        mapping = SCALE_TYPE_NS0_TO_NS1.get(ngs, {})
         return mapping.get(scale_type, [scale_type])[0]
     elif ns_old == 1 and ns_new == 0:
-        mapping = SCALE_TYPE_NS1_TO_NS0.get(NGS, {})
+        mapping = SCALE_TYPE_NS1_TO_NS0.get(ngs, {})
         return mapping.get(scale_type, scale_type)
     elif ns_old == 0 and ns_new == 2:
-        mapping = SCALE_TYPE_NS0_TO_NS2.get(NGS, {})
+        mapping = SCALE_TYPE_NS0_TO_NS2.get(ngs, {})
         return mapping.get(scale_type, [scale_type])[0]
     elif ns_old == 2 and ns_new == 0:
-        mapping = SCALE_TYPE_NS2_TO_NS0.get(NGS, {})
+        mapping = SCALE_TYPE_NS2_TO_NS0.get(ngs, {})
         return mapping.get(scale_type, scale_type)
     else:
         raise ValueError('[`ns_old`, `ns_new`] must be [0, 1], [1, 0], [0, 2] or [2, 0]!')
@@ -597,24 +577,166 @@ CHORD_TYPE_NS0_TO_NS1 = {
 # chord type converter, change naming scheme 1 to naming scheme 0, e.g. '7' -> 'R.3.5.b7'
 CHORD_TYPE_NS1_TO_NS0 = dict((ngs, dict((v, k) for k, vs in d.items() for v in vs)) for ngs, d in CHORD_TYPE_NS0_TO_NS1.items())
 
-# default chord ns
-DEFAULT_CHORD_NS = {
+# default chord ns for every NGS (0 for NGSs not listed here)
+DEFAULT_CHORD_NS_TABLE = {
     '12.7.5': 1,
     '19.11.8': 1,
-}.get(NGS, 0)
+}
 
 
-def chord_type_convertor(chord_type, ns_old, ns_new):
+def chord_type_convertor(chord_type, ns_old, ns_new, ngs=None):
+    ngs = NGS if ngs is None else ngs
     if ns_old == 0 and ns_new == 1:
-        mapping = CHORD_TYPE_NS0_TO_NS1.get(NGS, {})
+        mapping = CHORD_TYPE_NS0_TO_NS1.get(ngs, {})
         return mapping.get(chord_type, [chord_type])[0]
     elif ns_old == 1 and ns_new == 0:
-        mapping = CHORD_TYPE_NS1_TO_NS0.get(NGS, {})
+        mapping = CHORD_TYPE_NS1_TO_NS0.get(ngs, {})
         return mapping.get(chord_type, chord_type)
     else:
         raise ValueError('[`ns_old`, `ns_new`] must be [0, 1] or [1, 0]!')
 
 
+''' ----------------------------------------------------------------------------------------- '''
+''' ********************************** for all Classes: Tuning ****************************** '''
+''' all NGS dependent constants live in a `Tuning` instance, classes in `theories.py` accept a '''
+''' `tuning` argument, so that several temperaments can be used in the same process          '''
+''' ----------------------------------------------------------------------------------------- '''
+
+
+class Tuning(object):
+    """
+    constants and lookup tables of `N`-TET, generated from starting point `S` using step length `G`
+
+    instances are cached per NGS, i.e. `Tuning(19, 11, 8) is Tuning(19, 11, 8)`, so that tables are only
+    calculated once and tunings can be compared by identity
+    """
+    _instances = dict()
+
+    def __new__(cls, n=12, g=7, s=5):
+        ngs = '.'.join([str(k) for k in [n, g, s]])
+        if ngs not in cls._instances:
+            tuning = super().__new__(cls)
+            tuning._build(n, g, s)
+            cls._instances[ngs] = tuning
+        return cls._instances[ngs]
+
+    @classmethod
+    def from_ngs(cls, ngs):
+        # e.g. '19.11.8' -> Tuning(19, 11, 8)
+        return cls(*[int(k) for k in ngs.split('.')])
+
+    def _build(self, n, g, s):
+        # most basic constants
+        self.N = n  # `N`-tone equal temperament (`N`-TET)
+        self.G = g  # generator (step length)
+        self.S = s  # starter (starting point)
+
+        # most basic calculations
+        self.M = pow(g, -1, n)                        # number of tones in diatonic scale
+        self.T = 2 ** (1 / n)                         # ratio of semi-tone frequencies
+        self.C3 = 440 * (self.T ** (36 - 45))         # frequency of C3
+        self.NGS = '.'.join([str(k) for k in [n, g, s]])  # NGS for dict indexing
+        ngs, m = self.NGS, self.M
+
+        # named note names in linear order, e.g. '12.7.5' -> 'CDEFGAB'
+        self.NAMED_STR_LIN = NAMED_STR_LIN_TABLE.get(ngs, str().join([chr(int('03B1', 16)+j) for j in range(m)]))
+
+        # relative note numbers (nnrels) in generative and linear order, e.g. [5, 0, 7, 2, 9, 4, 11] and [0, 2, 4, 5, 7, 9, 11]
+        self.NAMED_NNREL_GEN = [(s + i * g) % n for i in range(m)]
+        self.NAMED_NNREL_LIN = sorted(self.NAMED_NNREL_GEN)
+
+        # nnrel/str and nnrel/lidx convertors, e.g. [0, 2, 4, 5, 7, 9, 11] -> 'CDEFGAB'
+        self.NNREL_TO_STR = {nnrel: self.NAMED_STR_LIN[i] for i, nnrel in enumerate(self.NAMED_NNREL_LIN)}
+        self.STR_TO_NNREL = dict((v, k) for k, v in self.NNREL_TO_STR.items())
+        self.NNREL_TO_LIDX = {nnrel: i for i, nnrel in enumerate(self.NAMED_NNREL_LIN)}
+
+        # `NAMED_STR_LIN` in generative order, e.g. 'CDEFGAB' -> 'FCGDAEB'
+        self.NAMED_STR_GEN = ''.join([self.NNREL_TO_STR[k] for k in self.NAMED_NNREL_GEN])
+
+        # step lengths
+        self.GIDX_OFFSET = GIDX_OFFSET
+        self.STEP_LENGTH_2ND_GEN = m - (n % m)
+        self.STEP_LENGTH_CHD_LIN = STEP_LENGTH_CHD_LIN
+
+        # defaults
+        self.DEFAULT_NOTE_NAME = f'{self.NAMED_STR_LIN[0]}0'
+        self.DEFAULT_KEY_CENTER = f'{self.NAMED_STR_LIN[0]}0'
+        self.DEFAULT_INTERVAL_NAME = DEFAULT_INTERVAL_NAME
+        self.DEFAULT_DIATONIC_SCALE_NAME = f'{self.NAMED_STR_LIN[0]} {self.NAMED_STR_LIN[0]}-mode'
+        self.DEFAULT_CHORD_NAME = f'{self.NAMED_STR_LIN[0]}0'
+        self.DEFAULT_DIATONIC_SCALE_NS = DEFAULT_DIATONIC_SCALE_NS_TABLE.get(ngs, 0)
+        self.DEFAULT_ALTERED_DIATONIC_SCALE_NS = DEFAULT_ALTERED_DIATONIC_SCALE_NS_TABLE.get(ngs, 0)
+        self.DEFAULT_CHORD_NS = DEFAULT_CHORD_NS_TABLE.get(ngs, 0)
+
+        # tables for `Interval` class (`None` if not defined for this NGS)
+        self.DELTA_LIDX_TO_NS = DELTA_LIDX_TO_NS.get(ngs)
+        self.DELTA_NNREL_MAJOR = sorted([(i * g) % n for i in range(m)])
+        self.DELTA_NNREL_OFFSET = DELTA_NNREL_OFFSET.get(ngs)
+
+        # all possible altered diatonic scale types (empty if not defined for this NGS)
+        self.ALL_SCALE_TYPES = ALL_SCALE_TYPES.get(ngs, [])
+
+    def scale_type_convertor(self, scale_type, ns_old, ns_new):
+        return scale_type_convertor(scale_type, ns_old, ns_new, self.NGS)
+
+    def chord_type_convertor(self, chord_type, ns_old, ns_new):
+        return chord_type_convertor(chord_type, ns_old, ns_new, self.NGS)
+
+    # tunings are singletons, copies (and unpickled tunings) must stay identical
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return Tuning, (self.N, self.G, self.S)
+
+    def __str__(self):
+        return f'{self.N}-TET | {self.M}-tone | step length: {self.G} | starting: {self.S}'
+
+    def __repr__(self):
+        return f'Tuning({self.N}, {self.G}, {self.S})'
+
+
+# return a `Tuning` from `None` (default tuning), a `Tuning` or a NGS string, e.g. '19.11.8'
+def get_tuning(tuning=None):
+    if tuning is None:
+        return DEFAULT_TUNING
+    elif isinstance(tuning, Tuning):
+        return tuning
+    elif isinstance(tuning, str):
+        return Tuning.from_ngs(tuning)
+    else:
+        raise TypeError('`tuning` should be `None`, a `Tuning` or a NGS string (e.g. \'19.11.8\')!')
+
+
+# default tuning
+DEFAULT_TUNING = Tuning(N, G, S)
+
+# constants of default tuning (module level shortcuts)
+M = DEFAULT_TUNING.M
+T = DEFAULT_TUNING.T
+C3 = DEFAULT_TUNING.C3
+NGS = DEFAULT_TUNING.NGS
+NAMED_STR_LIN = DEFAULT_TUNING.NAMED_STR_LIN
+NAMED_NNREL_GEN = DEFAULT_TUNING.NAMED_NNREL_GEN
+NAMED_NNREL_LIN = DEFAULT_TUNING.NAMED_NNREL_LIN
+NNREL_TO_STR = DEFAULT_TUNING.NNREL_TO_STR
+STR_TO_NNREL = DEFAULT_TUNING.STR_TO_NNREL
+NNREL_TO_LIDX = DEFAULT_TUNING.NNREL_TO_LIDX
+NAMED_STR_GEN = DEFAULT_TUNING.NAMED_STR_GEN
+STEP_LENGTH_2ND_GEN = DEFAULT_TUNING.STEP_LENGTH_2ND_GEN
+DEFAULT_NOTE_NAME = DEFAULT_TUNING.DEFAULT_NOTE_NAME
+DEFAULT_KEY_CENTER = DEFAULT_TUNING.DEFAULT_KEY_CENTER
+DEFAULT_DIATONIC_SCALE_NAME = DEFAULT_TUNING.DEFAULT_DIATONIC_SCALE_NAME
+DEFAULT_CHORD_NAME = DEFAULT_TUNING.DEFAULT_CHORD_NAME
+DEFAULT_DIATONIC_SCALE_NS = DEFAULT_TUNING.DEFAULT_DIATONIC_SCALE_NS
+DEFAULT_ALTERED_DIATONIC_SCALE_NS = DEFAULT_TUNING.DEFAULT_ALTERED_DIATONIC_SCALE_NS
+DEFAULT_CHORD_NS = DEFAULT_TUNING.DEFAULT_CHORD_NS
+DELTA_NNREL_MAJOR = DEFAULT_TUNING.DELTA_NNREL_MAJOR
+
+
 ''' -----------------------------------------------------------------------------------------'''
 ''' ************************************* for `audio.py` ************************************'''
 ''' -----------------------------------------------------------------------------------------'''
@@ -706,7 +828,7 @@ if use_vocaloid:
 ''' -----------------------------------------------------------------------------------------'''
 
 
-out_str_1 = f'{N}-TET | {M}-tone | step length: {G} | starting: {S}'
+out_str_1 = str(DEFAULT_TUNING)
 out_str_2 = 'named notes: ' + str().join([f'{nnrel}={name} ' for nnrel, name in NNREL_TO_STR.items()])
 n_hyphens = max(len(out_str_1), len(out_str_2))
 print('-' * n_hyphens)
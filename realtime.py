@@ -0,0 +1,297 @@
+# built-in libs
+import time
+import threading
+
+# project libs
+from audio import *
+
+
+''' ----------------------------------------------------------------------------------------- '''
+''' ************************************* event transport *********************************** '''
+''' ----------------------------------------------------------------------------------------- '''
+
+
+# kinds of events in `EventRingBuffer`
+EVENT_NOTE_OFF, EVENT_NOTE_ON = 0, 1
+EVENT_DTYPE = np.dtype([('kind', 'i1'), ('note', 'i2'), ('velocity', 'i2'), ('time', 'i8')])
+
+
+class EventRingBuffer(object):
+    def __init__(self, capacity=256):
+        """
+            bounded single-producer single-consumer ring buffer of note events, no locks: the producer only writes
+            `_head` and the consumer only writes `_tail`, an event is published by moving `_head` after its slot is
+            written; events pushed into a full buffer are dropped (and counted)
+        """
+        # capacity is rounded up to a power of 2
+        self._capacity = 1 << max(capacity - 1, 1).bit_length()
+        self._mask = self._capacity - 1
+        self._events = np.zeros(self._capacity, dtype=EVENT_DTYPE)
+
+        self._head = 0
+        self._tail = 0
+        self._n_dropped = 0
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def get_capacity(self):
+        return self._capacity
+
+    def get_dropped_count(self):
+        return self._n_dropped
+
+    def push(self, kind, note, velocity=64, t=None):
+        # called by the producer only, `t` is the arrival time (`time.perf_counter_ns()`)
+        head = self._head
+        if head - self._tail >= self._capacity:
+            self._n_dropped += 1
+            return False
+
+        self._events[head & self._mask] = (kind, note, velocity, time.perf_counter_ns() if t is None else t)
+        self._head = head + 1
+        return True
+
+    def pop_into(self, out):
+        # called by the consumer only, moves pending events into the preallocated array `out`, returns their number
+        tail = self._tail
+        n = min(self._head - tail, len(out))
+        start = tail & self._mask
+        n_1 = min(n, self._capacity - start)
+        out[:n_1] = self._events[start:start + n_1]
+        out[n_1:n] = self._events[:n - n_1]
+        self._tail = tail + n
+        return n
+
+
+''' ----------------------------------------------------------------------------------------- '''
+''' ************************************* realtime engine *********************************** '''
+''' ----------------------------------------------------------------------------------------- '''
+
+
+def get_chord_name_of_nnabs_list(nnabs_list):
+    # default analysis of `RealtimeEngine`, the best chord name of held notes ('' for no notes)
+    names = get_chord_name_index().identify(sorted(nnabs_list))
+    return names[0] if names else ''
+
+
+class RealtimeEngine(object):
+    def __init__(self, synth=None, frames_per_buffer=64, capacity=256, analysis=get_chord_name_of_nnabs_list,
+                 on_analysis=None, histogram_bins=(0.1, 200)):
+        """
+            callback driven realtime pipeline around `PolySynthMono`:
+
+            midi thread:     `on_midi` (or `push_note_on`, `push_note_off`) time stamps note events and pushes them into
+                             two `EventRingBuffer`s, one for audio and one for analysis
+            audio thread:    `audio_callback` (a pyaudio stream callback) only consumes events and renders one block
+            analysis thread: `analysis(held nnabs list)` runs off the audio path, results go to `on_analysis(result)`
+
+            overruns (callbacks longer than their buffers) are counted; latencies (from arrival of an event to the end
+            of the callback that renders it) and callback durations go to histograms of `histogram_bins` =
+            (bin width in ms, number of bins), see `get_stats`
+        """
+        self._synth = PolySynthMono() if synth is None else synth
+        self._frames_per_buffer = frames_per_buffer
+        if frames_per_buffer % self._synth.get_chunk_size():
+            raise ValueError('`frames_per_buffer` should be a multiple of chunk size of `synth`!')
+
+        # audio side, buffers are preallocated
+        self._audio_events = EventRingBuffer(capacity)
+        self._pending = np.zeros(self._audio_events.get_capacity(), dtype=EVENT_DTYPE)
+        self._out = np.zeros(frames_per_buffer, dtype=np.float32)
+
+        # analysis side
+        self._analysis = analysis
+        self._on_analysis = on_analysis
+        self._analysis_events = EventRingBuffer(capacity)
+        self._analysis_pending = np.zeros(self._analysis_events.get_capacity(), dtype=EVENT_DTYPE)
+        self._analysis_wakeup = threading.Event()
+        self._analysis_thread = None
+        self._analysis_result = None
+        self._held = []
+        self._running = False
+
+        # statistics
+        self._bin_width, n_bins = histogram_bins
+        self._latency_hist = np.zeros(n_bins, dtype=int)
+        self._callback_hist = np.zeros(n_bins, dtype=int)
+        self._n_callbacks = 0
+        self._n_overruns = 0
+
+    ''' midi side '''
+
+    def push_note_on(self, note, velocity=64, t=None):
+        t = time.perf_counter_ns() if t is None else t
+        self._audio_events.push(EVENT_NOTE_ON, note, velocity, t)
+        self._analysis_events.push(EVENT_NOTE_ON, note, velocity, t)
+        self._analysis_wakeup.set()
+        return self
+
+    def push_note_off(self, note, velocity=64, t=None):
+        t = time.perf_counter_ns() if t is None else t
+        self._audio_events.push(EVENT_NOTE_OFF, note, velocity, t)
+        self._analysis_events.push(EVENT_NOTE_OFF, note, velocity, t)
+        self._analysis_wakeup.set()
+        return self
+
+    def on_midi(self, msg):
+        # callback of `mido.open_input(callback=...)`, note_on with velocity 0 is note_off
+        if msg.type == 'note_on' and msg.velocity > 0:
+            self.push_note_on(msg.note, msg.velocity)
+        elif msg.type in ['note_on', 'note_off']:
+            self.push_note_off(msg.note, msg.velocity)
+
+    ''' audio side '''
+
+    def render(self, frame_count=None):
+        """
+            consume pending events and render one block, returns the (reused) float32 output buffer; events take effect at
+            the start of the block; `frame_count` should be a multiple of chunk size of `synth`, at most `frames_per_buffer`
+        """
+        start = time.perf_counter_ns()
+        frame_count = self._frames_per_buffer if frame_count is None else frame_count
+        if frame_count > self._frames_per_buffer or frame_count % self._synth.get_chunk_size():
+            raise ValueError('`frame_count` should be a multiple of chunk size of `synth`, at most `frames_per_buffer`!')
+
+        n_events = self._audio_events.pop_into(self._pending)
+        for k in range(n_events):
+            event = self._pending[k]
+            if event['kind'] == EVENT_NOTE_ON:
+                self._synth.note_on(int(event['note']))
+            else:
+                self._synth.note_off(int(event['note']))
+
+        out = self._out[:frame_count]
+        chunk_size = self._synth.get_chunk_size()
+        for k in range(0, frame_count, chunk_size):
+            out[k:k + chunk_size] = self._synth.get_samples()
+
+        end = time.perf_counter_ns()
+        self._record(self._callback_hist, end - start)
+        for k in range(n_events):
+            self._record(self._latency_hist, end - int(self._pending[k]['time']))
+        self._n_callbacks += 1
+        if end - start > frame_count / SF * 1e9:
+            self._n_overruns += 1
+
+        return out
+
+    def audio_callback(self, in_data, frame_count, time_info, status):
+        # stream callback of `pyaudio.PyAudio().open(..., stream_callback=...)`, 0 is `pyaudio.paContinue`
+        return self.render(frame_count).tobytes(), 0
+
+    def _record(self, hist, duration_ns):
+        hist[min(int(duration_ns / 1e6 / self._bin_width), len(hist) - 1)] += 1
+
+    ''' analysis side '''
+
+    def _analysis_loop(self):
+        while self._running:
+            self._analysis_wakeup.wait(timeout=0.1)
+            self._analysis_wakeup.clear()
+
+            n_events = self._analysis_events.pop_into(self._analysis_pending)
+            if not n_events:
+                continue
+            for kind, note, velocity, t in self._analysis_pending[:n_events].tolist():
+                if kind == EVENT_NOTE_ON and note not in self._held:
+                    self._held.append(note)
+                elif kind == EVENT_NOTE_OFF and note in self._held:
+                    self._held.remove(note)
+
+            self._analysis_result = self._analysis(list(self._held))
+            if self._on_analysis is not None:
+                self._on_analysis(self._analysis_result)
+
+    def start(self):
+        # start the analysis thread, the audio thread is driven by the audio device (or `FakeAudioSink`); `analysis` is
+        # called once here, so that lazy setup (e.g. building the chord name index) does not delay the first result
+        if not self._running:
+            self._analysis([])
+            self._running = True
+            self._analysis_thread = threading.Thread(target=self._analysis_loop, daemon=True)
+            self._analysis_thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._analysis_wakeup.set()
+        if self._analysis_thread is not None:
+            self._analysis_thread.join()
+            self._analysis_thread = None
+        return self
+
+    ''' statistics '''
+
+    def get_analysis_result(self):
+        return self._analysis_result
+
+    def get_stats(self):
+        """
+            callback and overrun counts, dropped events, and histograms (bin edges in ms, counts) with a few percentiles
+            (upper bin edges) of latencies and callback durations
+        """
+        edges = self._bin_width * np.arange(len(self._latency_hist) + 1)
+
+        def _percentiles(hist):
+            cdf = np.cumsum(hist)
+            if not cdf[-1]:
+                return {}
+            return {q: float(edges[np.searchsorted(cdf, q / 100 * cdf[-1]) + 1]) for q in [50, 90, 99]}
+
+        return {
+            'callbacks': self._n_callbacks,
+            'overruns': self._n_overruns,
+            'dropped_events': self._audio_events.get_dropped_count(),
+            'latency_ms': (edges, self._latency_hist.copy()),
+            'latency_percentiles_ms': _percentiles(self._latency_hist),
+            'callback_ms': (edges, self._callback_hist.copy()),
+            'callback_percentiles_ms': _percentiles(self._callback_hist),
+        }
+
+
+class FakeAudioSink(object):
+    def __init__(self, callback, frames_per_buffer=64, realtime=True, record=False):
+        """
+            stand-in of an audio device for tests: calls a stream callback (like `RealtimeEngine.audio_callback`) once per
+            buffer, paced in real time (or as fast as possible), and optionally records the output
+        """
+        self._callback = callback
+        self._frames_per_buffer = frames_per_buffer
+        self._realtime = realtime
+        self._record = record
+        self._recorded = []
+        self._thread = None
+        self._running = False
+
+    def run(self, n_buffers):
+        period = self._frames_per_buffer / SF
+        start = time.perf_counter()
+        for k in range(n_buffers):
+            if not self._running and self._thread is not None:
+                break
+            data, flag = self._callback(None, self._frames_per_buffer, None, 0)
+            if self._record:
+                self._recorded.append(np.frombuffer(data, dtype=np.float32).copy())
+            if self._realtime:
+                delay = start + (k + 1) * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return self
+
+    def start(self, n_buffers=2 ** 62):
+        # run in a background thread
+        self._running = True
+        self._thread = threading.Thread(target=self.run, args=(n_buffers, ), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self
+
+    def get_recorded(self):
+        return np.concatenate(self._recorded) if self._recorded else np.zeros(0, dtype=np.float32)
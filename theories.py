@@ -1,7 +1,17 @@
 # built-in libs
+import os
 import re
+import csv
+import json
+import time
+import sqlite3
+import atexit
+import hashlib
+import multiprocessing
 from copy import copy
-from itertools import product
+from functools import lru_cache, wraps
+from inspect import signature
+from itertools import product, combinations, combinations_with_replacement
 from fractions import Fraction
 
 # 3rd-party libs
@@ -16,87 +26,338 @@ from consts import *
 ''' ----------------------------------------------------------------------------------------- '''
 
 
-# for `Note`
-def note_name_parser(note_name):
-    # `note_name` is a string, examples: 'C#3', 'Bb1', 'Fbb3', etc.
-    pattern_1 = r'(?P<named_str>[' + NAMED_STR_LIN + r'])'
-    pattern_2 = r'(?P<accidental_str>[b#]*)(?P<register_str>-?\d*)'
+# maximum number of names remembered by every parser cache (see `get_parser_cache_info`)
+PARSER_CACHE_SIZE = 4096
+
+# precompiled patterns (independent of tuning)
+INTERVAL_NAME_PATTERN = re.compile(r'(?P<negative_str>-{0,1})(?P<interval_type>[dmPMA]+)(?P<degree_str>[\d]+)')
+SCALE_TYPE_PATTERN = re.compile(r'(?P<scale_type>[\w#b+-]*)(?P<altered_note>(\([^ac-z]*\)){0,1})')
+ALTERED_NOTE_PATTERN = re.compile(r'[#b]+\d+')
+TENSION_TYPE_PATTERN = re.compile(r'[#b]*\d+')
+
 
-    pattern = pattern_1 + pattern_2
+@lru_cache(maxsize=None)
+def _get_name_patterns(tuning):
+    # precompiled patterns of a tuning, named notes are given by `tuning.NAMED_STR_LIN`
+    named_str_lin = tuning.NAMED_STR_LIN
+    return dict(
+        note=re.compile(r'(?P<named_str>[' + named_str_lin + r'])(?P<accidental_str>[b#]*)(?P<register_str>-?\d*)'),
+        scale_tonic=re.compile(r'(?P<scale_tonic_name>[' + named_str_lin + r'][#b]*-{0,1}\d*) '),
+        mode_tonic=re.compile('(?P<mode_tonic_name>[' + named_str_lin + r'][#b]*-{0,1}\d*)(?=(-mode))'),
+        chord=re.compile(
+            r'(?P<root_name>[' + named_str_lin + r'][#b]*-{0,1}\d*) ?'
+            r'(?P<chord_type>[\w.#b+-]*)'
+            r'(?P<tension_type>(\([^ac-z]*\)){0,1})'
+            '/?(?P<bass_name>([' + named_str_lin + r'][#b]*-{0,1}\d*){0,1})'
+        ),
+    )
 
-    search_obj = re.search(pattern, note_name)
+
+# for `Note`
+def note_name_parser(note_name, tuning=None):
+    # `note_name` is a string, examples: 'C#3', 'Bb1', 'Fbb3', etc.
+    search_obj = _get_name_patterns(get_tuning(tuning))['note'].search(note_name)
     return search_obj.groupdict()
 
 
 # for `Interval`
 def interval_name_parser(interval_name):
     # `interval_name` is a string, examples: 'm2', 'M3', 'P4', etc.
-    search_obj = re.search(r'(?P<negative_str>-{0,1})(?P<interval_type>[dmPMA]+)(?P<degree_str>[\d]+)', interval_name)
+    search_obj = INTERVAL_NAME_PATTERN.search(interval_name)
     return search_obj.groupdict()
 
 
 # for `DiatonicScale`
-def scale_name_parser(scale_name):
-    # `scale_name` is a string, examples: 'C C-mode', 'D C-mode(b6)', 'E Phrygian(#3, #7)', etc.
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _scale_name_parser(scale_name, tuning):
+    # first we should make sure that `scale_type` is written in naming scheme 0
+    scale_tonic_pattern = _get_name_patterns(tuning)['scale_tonic']
+    scale_type = scale_tonic_pattern.sub('', scale_name)
 
-    # basic patterns
-    pattern_1 = r'(?P<scale_tonic_name>[' + NAMED_STR_LIN + r'][#b]*-{0,1}\d*) '
-    pattern_2 = r'(?P<scale_type>[\w#b+-]*)'
-    pattern_3 = r'(?P<altered_note>(\([^ac-z]*\)){0,1})'
+    scale_type = tuning.scale_type_convertor(scale_type, 2, 0)
+    scale_type = tuning.scale_type_convertor(scale_type, 1, 0)
 
-    # first we should make sure that `scale_name` is written in naming scheme 0
-    scale_type = re.sub(pattern_1, '', scale_name)
+    # parse scale tonic and scale type separately (no need to match the joined name again)
+    scale_tonic_name = scale_tonic_pattern.match(scale_name).group('scale_tonic_name')
+    search_obj = SCALE_TYPE_PATTERN.match(scale_type)
 
-    scale_type = scale_type_convertor(scale_type, 2, 0)
-    scale_type = scale_type_convertor(scale_type, 1, 0)
+    return scale_tonic_name, search_obj.group('scale_type'), search_obj.group('altered_note')
 
-    scale_name = re.match(pattern_1, scale_name).group() + scale_type
 
-    # parse `scale_name`
-    pattern = pattern_1 + pattern_2 + pattern_3
-    search_obj = re.search(pattern, scale_name)
-
-    return search_obj.groupdict()
+def scale_name_parser(scale_name, tuning=None):
+    # `scale_name` is a string, examples: 'C C-mode', 'D C-mode(b6)', 'E Phrygian(#3, #7)', etc.
+    scale_tonic_name, scale_type, altered_note = _scale_name_parser(scale_name, get_tuning(tuning))
+    return dict(scale_tonic_name=scale_tonic_name, scale_type=scale_type, altered_note=altered_note)
 
 
-def scale_type_parser(scale_type):
+def scale_type_parser(scale_type, tuning=None):
     # `scale_type` is a string, examples: 'D-mode', 'E-mode', 'α-mode', etc.
-    pattern = '(?P<mode_tonic_name>[' + NAMED_STR_LIN + r'][#b]*-{0,1}\d*)(?=(-mode))'
-    search_obj = re.search(pattern, scale_type)
+    search_obj = _get_name_patterns(get_tuning(tuning))['mode_tonic'].search(scale_type)
     return search_obj.groupdict()
 
 
 # for `AlteredDiatonicScale`
 def altered_note_parser(altered_note):
     # `altered note` is a string, examples: '(b3)', '(b3, b7)', '(#5)', etc.
-    return re.findall(r'[#b]+\d+', altered_note)
+    return ALTERED_NOTE_PATTERN.findall(altered_note)
 
 
 # for `Chord`
-def chord_name_parser(chord_name):
-    # `chord_name` is a string, examples: 'CM7', 'Dm7(9, 11, 13)', 'Bm7-5/F', etc.
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _chord_name_parser(chord_name, tuning):
+    search_obj = _get_name_patterns(tuning)['chord'].search(chord_name)
+    root_name, chord_type, tension_type, bass_name = search_obj.group('root_name', 'chord_type', 'tension_type', 'bass_name')
 
-    # basic patterns
-    pattern_1 = r'(?P<root_name>[' + NAMED_STR_LIN + r'][#b]*-{0,1}\d*) ?'
-    pattern_2 = r'(?P<chord_type>[\w.#b+-]*)'
-    pattern_3 = r'(?P<tension_type>(\([^ac-z]*\)){0,1})'
-    pattern_4 = '/?(?P<bass_name>([' + NAMED_STR_LIN + r'][#b]*-{0,1}\d*){0,1})'
-
-    # parse `scale_name`
-    pattern = pattern_1 + pattern_2 + pattern_3 + pattern_4
-    search_obj = re.search(pattern, chord_name)
+    # make sure that `chord_type` is written in naming scheme 0
+    chord_type = tuning.chord_type_convertor(chord_type, 1, 0)
 
-    results = search_obj.groupdict()
+    return root_name, chord_type, tension_type, bass_name
 
-    # make sure that `chord_type` is written in naming scheme 0
-    results['chord_type'] = chord_type_convertor(results['chord_type'], 1, 0)
 
-    return results
+def chord_name_parser(chord_name, tuning=None):
+    # `chord_name` is a string, examples: 'CM7', 'Dm7(9, 11, 13)', 'Bm7-5/F', etc.
+    root_name, chord_type, tension_type, bass_name = _chord_name_parser(chord_name, get_tuning(tuning))
+    return dict(root_name=root_name, chord_type=chord_type, tension_type=tension_type, bass_name=bass_name)
 
 
 def tension_type_parser(tension_type):
     # `tension_type` is a string, examples: '(9)', '(b9, #11)', '(9, 11, 13)', '(9, 13)', etc.
-    return re.findall(r'[#b]*\d+', tension_type)
+    return TENSION_TYPE_PATTERN.findall(tension_type)
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _compile_chord_type(chord_type, tension_type, tuning):
+    """
+    compile a chord type (naming scheme 0) and a tension type into interval vector templates (with br357t), e.g.
+
+    (in '12.7.5') ('R.3.5.7', '(9, #11)') -> ((0, 0, 'R'), (4, 2, '3'), (7, 4, '5'), (11, 6, '7')), ((14, 8, '9'), (18, 10, '#11'))
+    """
+    body = [Interval(tuning=tuning).from_r357t(r357) for r357 in chord_type.split('.')]
+    tension = [Interval(tuning=tuning).from_r357t(r357t) for r357t in tension_type_parser(tension_type)] if tension_type else []
+    return tuple([(*interval.get_vector(), interval.get_r357t()) for interval in body]), \
+        tuple([(*interval.get_vector(), interval.get_r357t()) for interval in tension])
+
+
+def compile_chord_type(chord_type, tension_type='', tuning=None):
+    # `chord_type` is in naming scheme 0, examples: 'R.3.5.7', 'R.b3.b5.b7', etc.; `tension_type` is like '(b9, #11)'
+    return _compile_chord_type(chord_type, tension_type, get_tuning(tuning))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _chord_to_note_vectors(root_name, chord_type, tension_type, bass_name, tuning):
+    # note vectors (with br357t) of bass, body and tension notes: templates of chord type are transposed to the root
+    t = tuning
+    named_nnrel, accidental, register = Note.note_name_to_note_vector(root_name, t)
+    lidx = t.NNREL_TO_LIDX[named_nnrel] + register * t.M
+    nnabs = named_nnrel + accidental + register * t.N
+
+    def _transpose(template):
+        vectors = []
+        for delta_nnabs, delta_lidx, br357t in template:
+            new_named_nnrel = t.NAMED_NNREL_LIN[(lidx + delta_lidx) % t.M]
+            new_register = (lidx + delta_lidx) // t.M
+            vectors.append((new_named_nnrel, nnabs + delta_nnabs - new_named_nnrel - t.N * new_register, new_register, br357t))
+        return tuple(vectors)
+
+    body_template, tension_template = _compile_chord_type(chord_type, tension_type, t)
+
+    # bass note is an octave lower than its name
+    if bass_name:
+        bass_named_nnrel, bass_accidental, bass_register = Note.note_name_to_note_vector(bass_name, t)
+        bass = ((bass_named_nnrel, bass_accidental, bass_register - 1, 'B'), )
+    else:
+        bass = ()
+
+    return bass, _transpose(body_template), _transpose(tension_template)
+
+
+# for monitoring parser caches
+def get_parser_cache_info():
+    # hits, misses, maxsize and currsize of every parser cache (shared by all tunings)
+    return {
+        'note': Note._note_name_to_note_vector.cache_info(),
+        'interval': Interval._interval_name_to_interval_vector.cache_info(),
+        'scale': _scale_name_parser.cache_info(),
+        'chord': _chord_name_parser.cache_info(),
+        'chord_type': _compile_chord_type.cache_info(),
+        'chord_notes': _chord_to_note_vectors.cache_info(),
+    }
+
+
+def clear_parser_caches():
+    Note._note_name_to_note_vector.cache_clear()
+    Interval._interval_name_to_interval_vector.cache_clear()
+    _scale_name_parser.cache_clear()
+    _chord_name_parser.cache_clear()
+    _compile_chord_type.cache_clear()
+    _chord_to_note_vectors.cache_clear()
+
+
+''' ----------------------------------------------------------------------------------------- '''
+''' ************************************ analysis cache ************************************** '''
+''' ----------------------------------------------------------------------------------------- '''
+
+
+class AnalysisCache(object):
+    """
+    persistent cache of analysis results (SQLite based), which can be shared by processes, e.g.
+
+    enable_analysis_cache('__cache__/analysis.sqlite3')
+    Chord('CM7').get_scale()  # searched, then stored
+    Chord('CM7').get_scale()  # loaded
+
+    only methods whose uncached cost clearly exceeds a SQLite round trip (tens of us) are worth decorating
+
+    results are keyed by (NGS, fingerprint of naming tables, input vector, method, arguments), when there are more than
+    `max_entries` results, least recently used ones are evicted
+    """
+    # bump this when the schema, or results of cached methods are changed
+    SCHEMA_VERSION = 1
+    # `last_used` of a result is refreshed at most once per `TOUCH_INTERVAL` seconds, so most hits are read-only
+    TOUCH_INTERVAL = 60
+
+    def __init__(self, path, max_entries=100000):
+        self._path = path
+        self._max_entries = max_entries
+        self._conn = None
+        self._pid = None
+        self._n_inserts = 0
+
+    def _connect(self):
+        # connections cannot be shared by forked processes, so every process opens its own connection
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        if os.path.dirname(self._path):
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+
+        # results of older schema versions are dropped
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS results')
+                conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            conn.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(*parts):
+        return hashlib.sha1(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key, default=None):
+        conn = self._connect()
+        row = conn.execute('SELECT value, last_used FROM results WHERE key = ?', (key, )).fetchone()
+        if row is None:
+            return default
+        now = time.time()
+        if now - row[1] > self.TOUCH_INTERVAL:
+            conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        conn = self._connect()
+        conn.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?)', (key, json.dumps(value), time.time()))
+
+        # check the size every 1% of `max_entries` insertions
+        self._n_inserts += 1
+        if self._n_inserts >= max(1, self._max_entries // 100):
+            self._n_inserts = 0
+            self.evict()
+
+        return self
+
+    def evict(self):
+        # evict least recently used results, down to 90% of `max_entries`
+        conn = self._connect()
+        n_entries = len(self)
+        if n_entries > self._max_entries:
+            n_evicted = n_entries - self._max_entries * 9 // 10
+            conn.execute('DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)', (n_evicted, ))
+        return self
+
+    def clear(self):
+        self._connect().execute('DELETE FROM results')
+        return self
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn, self._pid = None, None
+        return self
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+
+# the analysis cache is disabled by default, see `enable_analysis_cache`
+_ANALYSIS_CACHE = None
+
+
+def enable_analysis_cache(path=None, max_entries=100000):
+    global _ANALYSIS_CACHE
+    disable_analysis_cache()
+    path = os.path.join(SCALE_NAME_INDEX_DIR or '__cache__', 'analysis.sqlite3') if path is None else path
+    _ANALYSIS_CACHE = AnalysisCache(path, max_entries)
+    return _ANALYSIS_CACHE
+
+
+def disable_analysis_cache():
+    global _ANALYSIS_CACHE
+    if _ANALYSIS_CACHE is not None:
+        _ANALYSIS_CACHE.close()
+    _ANALYSIS_CACHE = None
+
+
+def get_analysis_cache():
+    return _ANALYSIS_CACHE
+
+
+# default of `AnalysisCache.get` in `analysis_cached`, so that stored `None` results are hits
+_MISSING = object()
+
+
+def analysis_cached(get_input_vector):
+    """
+    decorator of analysis methods, results are stored in the analysis cache (if enabled), e.g.
+
+    @analysis_cached(lambda self: [[note.get_vector() for note in notes] for notes in [self._bass, self._body, self._tension]])
+    def get_scale(self, use_bass=True, max_order=2, ns=None):
+        ...
+
+    `get_input_vector` should return a JSON serializable canonical form of everything (except arguments and tuning)
+    the result depends on, and results should be JSON serializable too (tuples will be loaded as lists)
+    """
+    def decorator(method):
+        method_signature = signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = _ANALYSIS_CACHE
+            if cache is None:
+                return method(self, *args, **kwargs)
+
+            arguments = method_signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            arguments = [[k, v] for k, v in list(arguments.arguments.items())[1:]]
+
+            t = self._tuning
+            key = cache.make_key(t.NGS, get_scale_name_index(t).get_fingerprint(), get_input_vector(self), method.__qualname__, arguments)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = method(self, *args, **kwargs)
+                cache.set(key, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 ''' ----------------------------------------------------------------------------------------- '''
@@ -105,16 +366,27 @@ def tension_type_parser(tension_type):
 
 
 class Note(object):
+    __slots__ = ('_named_nnrel', '_accidental', '_register', '_message', '_tuning')
+
+    # flyweight table of message-less notes, see `Note.get_interned`
+    _interned_notes = dict()
+
     @staticmethod
-    def note_name_to_note_vector(note_name):
-        par = note_name_parser(note_name)
+    def note_name_to_note_vector(note_name, tuning=None):
+        return Note._note_name_to_note_vector(note_name, get_tuning(tuning))
+
+    @staticmethod
+    @lru_cache(maxsize=PARSER_CACHE_SIZE)
+    def _note_name_to_note_vector(note_name, tuning):
+        # cached by (`note_name`, `tuning`), see `get_parser_cache_info`
+        par = note_name_parser(note_name, tuning)
 
         named_str = par['named_str']
         accidental_str = par['accidental_str']
         register_str = par['register_str']
 
         # get named nnrel, integer in `NAMED_NNREL_LIN`
-        named_nnrel = STR_TO_NNREL[named_str]
+        named_nnrel = tuning.STR_TO_NNREL[named_str]
 
         # get number of accidentals, integer in (-\infty, \infty)
         accidental = 0 + accidental_str.count('#') - accidental_str.count('b')
@@ -127,16 +399,37 @@ class Note(object):
 
         return named_nnrel, accidental, register
 
-    def __init__(self, note_name=DEFAULT_NOTE_NAME):
-        # Note in Note
+    @classmethod
+    def _new(cls, named_nnrel, accidental, register, message=None, tuning=DEFAULT_TUNING):
+        # create a note from a (valid) note vector directly, without parsing any note name
+        note = object.__new__(cls)
+        note._named_nnrel = named_nnrel
+        note._accidental = accidental
+        note._register = register
+        note._message = message
+        note._tuning = tuning
+        return note
+
+    def __init__(self, note_name=None, tuning=None):
+        # Note in Note (keeps the tuning of given note unless `tuning` is given)
         if isinstance(note_name, Note):
+            tuning = note_name._tuning if tuning is None else tuning
             note_name = note_name.get_name(show_register=True)
 
-        # get note vector
-        self._named_nnrel, self._accidental, self._register = self.note_name_to_note_vector(note_name)
+        self._tuning = get_tuning(tuning)
+
+        if note_name is None:
+            note_name = self._tuning.DEFAULT_NOTE_NAME
+
+        # get note vector, `note_name` can also be a note vector, e.g. (2, 1, 1) = 'D#1'
+        if isinstance(note_name, tuple):
+            self._named_nnrel, self._accidental, self._register = 0, 0, 0
+            self.set_vector(*note_name)
+        else:
+            self._named_nnrel, self._accidental, self._register = self._note_name_to_note_vector(note_name, self._tuning)
 
-        # additional message dict
-        self._message = dict()
+        # additional message dict (allocated when the first message is set)
+        self._message = None
 
     def __str__(self):
         return self.get_name()
@@ -145,11 +438,16 @@ class Note(object):
         return f"Note('{self.get_name()}')"
 
     def __sub__(self, other):
+        t = self._tuning
         # `Note` - `Note` = `Interval`
         if isinstance(other, Note):
-            lidx1 = NAMED_NNREL_LIN.index(self._named_nnrel) + self._register * M
-            lidx2 = NAMED_NNREL_LIN.index(other._named_nnrel) + other._register * M
-            return Interval().set_vector(int(self) - int(other), lidx1 - lidx2)
+            if other._tuning is not t:
+                raise ValueError('Notes of different tunings cannot be subtracted!')
+            lidx1 = t.NNREL_TO_LIDX[self._named_nnrel] + self._register * t.M
+            lidx2 = t.NNREL_TO_LIDX[other._named_nnrel] + other._register * t.M
+            nnabs1 = self._named_nnrel + self._accidental + self._register * t.N
+            nnabs2 = other._named_nnrel + other._accidental + other._register * t.N
+            return Interval._new(nnabs1 - nnabs2, lidx1 - lidx2, t)
         # `Note` - `Interval` = `Note`
         if isinstance(other, Interval):
             return self + (-other)
@@ -157,14 +455,17 @@ class Note(object):
             raise TypeError('`Note` can only subtract a `Note` or an `Interval`!')
 
     def __add__(self, other):
+        t = self._tuning
         # `Note` + `Interval` = `Note`
         if isinstance(other, Interval):
-            delta_nnabs, delta_lidx = other.get_vector()
-            new_lidx = NAMED_NNREL_LIN.index(self._named_nnrel) + delta_lidx
-            new_named_nnrel = NAMED_NNREL_LIN[new_lidx % M]
-            new_register = self._register + new_lidx // M
-            new_accidental = int(self) + delta_nnabs - new_named_nnrel - N * new_register
-            return Note().set_vector(new_named_nnrel, new_accidental, new_register).set_message_dict(**self.get_message_dict())
+            if other._tuning is not t:
+                raise ValueError('`Note` can only add an `Interval` of the same tuning!')
+            new_lidx = t.NNREL_TO_LIDX[self._named_nnrel] + other._delta_lidx
+            new_named_nnrel = t.NAMED_NNREL_LIN[new_lidx % t.M]
+            new_register = self._register + new_lidx // t.M
+            new_accidental = self._named_nnrel + self._accidental + t.N * (self._register - new_register) + other._delta_nnabs - new_named_nnrel
+            message = dict(self._message) if self._message else None
+            return Note._new(new_named_nnrel, new_accidental, new_register, message, t)
         else:
             raise TypeError('`Note` can only add an `Interval`!')
 
@@ -175,7 +476,7 @@ class Note(object):
 
         :return: absolute note number, integer in (-\infty, \infty)
         """
-        return self._named_nnrel + self._accidental + self._register * N
+        return self._named_nnrel + self._accidental + self._register * self._tuning.N
 
     def __lt__(self, other):
         if isinstance(other, Note):
@@ -183,7 +484,7 @@ class Note(object):
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) < other
         elif isinstance(other, str):
-            return int(self) < int(Note(other))
+            return int(self) < int(Note(other, self._tuning))
         else:
             raise TypeError('`Note` can only compare with `Note`, `int`, `float` or `str`!')
 
@@ -193,7 +494,7 @@ class Note(object):
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) <= other
         elif isinstance(other, str):
-            return int(self) <= int(Note(other))
+            return int(self) <= int(Note(other, self._tuning))
         else:
             raise TypeError('`Note` can only compare with `Note`, `int`, `float` or `str`!')
 
@@ -203,13 +504,14 @@ class Note(object):
                 [
                     self._named_nnrel == other._named_nnrel,
                     self._accidental == other._accidental,
-                    self._register == other._register
+                    self._register == other._register,
+                    self._tuning is other._tuning
                 ]
             )
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) == other
         elif isinstance(other, str):
-            tmp = Note(other)
+            tmp = Note(other, self._tuning)
             return all(
                 [
                     self._named_nnrel == tmp._named_nnrel,
@@ -226,13 +528,14 @@ class Note(object):
                 [
                     self._named_nnrel != other._named_nnrel,
                     self._accidental != other._accidental,
-                    self._register != other._register
+                    self._register != other._register,
+                    self._tuning is not other._tuning
                 ]
             )
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) != other
         elif isinstance(other, str):
-            tmp = Note(other)
+            tmp = Note(other, self._tuning)
             return any(
                 [
                     self._named_nnrel != tmp._named_nnrel,
@@ -249,7 +552,7 @@ class Note(object):
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) > other
         elif isinstance(other, str):
-            return int(self) > int(Note(other))
+            return int(self) > int(Note(other, self._tuning))
         else:
             raise TypeError('`Note` can only compare with `Note`, `int`, `float` or `str`!')
 
@@ -259,14 +562,17 @@ class Note(object):
         elif isinstance(other, int) or isinstance(other, float):
             return int(self) >= other
         elif isinstance(other, str):
-            return int(self) >= int(Note(other))
+            return int(self) >= int(Note(other, self._tuning))
         else:
             raise TypeError('`Note` can only compare with `Note`, `int`, `float` or `str`!')
 
+    def get_tuning(self):
+        return self._tuning
+
     def set_vector(self, named_nnrel=None, accidental=None, register=None):
         # set note vector (named_nnrel, accidental, register) manually
         if named_nnrel is not None:
-            if named_nnrel not in NAMED_NNREL_LIN:
+            if named_nnrel not in self._tuning.NNREL_TO_LIDX:
                 raise ValueError('Given `named_nnrel` does not correspond to a named note. Please choose another one!')
             else:
                 self._named_nnrel = named_nnrel
@@ -295,7 +601,8 @@ class Note(object):
         return self._register
 
     def get_gidx(self):
-        return ((self._named_nnrel - S) * M) % N + self._accidental * M + GIDX_OFFSET
+        t = self._tuning
+        return ((self._named_nnrel - t.S) * t.M) % t.N + self._accidental * t.M + t.GIDX_OFFSET
 
     def get_frequency(self):
         """
@@ -305,7 +612,8 @@ class Note(object):
 
         :return: frequency of current note (float type)
         """
-        return C3 * (T ** (int(self) - N * 3))
+        t = self._tuning
+        return t.C3 * (t.T ** (int(self) - t.N * 3))
 
     def get_name(self, show_register=True, use_latex=False):
         # get name of `Note`, e.g. Note('C0').get_name() = 'C0', Note('C0').get_name(show_register=False) = 'C', etc.
@@ -314,7 +622,7 @@ class Note(object):
 
         name_out = (
             (r'\mathrm{' if use_latex else '') +
-            NNREL_TO_STR[self._named_nnrel] +
+            self._tuning.NNREL_TO_STR[self._named_nnrel] +
             ('}' if use_latex else '') +
             ('^{' if use_latex and self._accidental else '') +
             (self._accidental * sharp_mark if self._accidental > 0 else -self._accidental * flat_mark) +
@@ -327,24 +635,27 @@ class Note(object):
         return name_out
 
     def from_name(self, note_name):
-        self._named_nnrel, self._accidental, self._register = self.note_name_to_note_vector(note_name)
+        self._named_nnrel, self._accidental, self._register = self._note_name_to_note_vector(note_name, self._tuning)
         return self
 
-    def from_nnabs(self, nnabs, key_center=DEFAULT_KEY_CENTER):
-        nnrel = nnabs % N
+    def from_nnabs(self, nnabs, key_center=None):
+        t = self._tuning
+        nnrel = nnabs % t.N
 
-        named_nnrel = NAMED_NNREL_LIN[0]
+        named_nnrel = t.NAMED_NNREL_LIN[0]
         accidental = nnrel - named_nnrel
-        register = nnabs // N
+        register = nnabs // t.N
 
-        self._named_nnrel, self._accidental, self._register = Note().set_vector(named_nnrel, accidental, register).get_enharmonic_note_by_key_center(key_center).get_vector()
+        note = Note._new(named_nnrel, accidental, register, tuning=t)
+        self._named_nnrel, self._accidental, self._register = note.get_enharmonic_note_by_key_center(key_center).get_vector()
 
         return self
 
     def add_gidx(self, n=0):
+        t = self._tuning
         gidx = self.get_gidx() + n
-        accidental = (gidx - GIDX_OFFSET) // M
-        named_nnrel = (G * (gidx - GIDX_OFFSET - accidental * M) + S) % N
+        accidental = (gidx - t.GIDX_OFFSET) // t.M
+        named_nnrel = (t.G * (gidx - t.GIDX_OFFSET - accidental * t.M) + t.S) % t.N
         self._accidental = accidental
         self._named_nnrel = named_nnrel
         return self
@@ -360,11 +671,14 @@ class Note(object):
         return self
 
     def set_message(self, **kwargs):
-        self._message = {**self._message, **kwargs}
+        if self._message is None:
+            self._message = {**kwargs}
+        else:
+            self._message = {**self._message, **kwargs}
         return self
 
     def get_message(self, key):
-        if key in self._message.keys():
+        if self._message is not None and key in self._message.keys():
             return self._message[key]
         else:
             return None
@@ -374,8 +688,28 @@ class Note(object):
         return self
 
     def get_message_dict(self):
+        if self._message is None:
+            self._message = dict()
         return self._message
 
+    def get_interned(self):
+        """
+        return the shared read-only note with the same note vector (flyweight), e.g.
+        Note('C#1').get_interned() is Note('Db1').get_enharmonic_note().get_interned() -> True
+
+        interned notes cannot carry messages, use `copy` to get a modifiable note from an interned one
+        """
+        if self._message:
+            raise ValueError('Only notes without messages can be interned!')
+
+        key = (self._named_nnrel, self._accidental, self._register, self._tuning)
+        note = Note._interned_notes.get(key)
+        if note is None:
+            note = _InternedNote._new(self._named_nnrel, self._accidental, self._register, tuning=self._tuning)
+            Note._interned_notes[key] = note
+
+        return note
+
     def get_enharmonic_note(self, direction='auto'):
         """
         enharmonic note examples:
@@ -389,6 +723,7 @@ class Note(object):
         (in '19.11.8' diatonic scale) [C, _, _, D, _, _, E, _, F, _, _, G, _, _, A, _, _, B, _]
         C#0 -> Dbb0; C##0 -> Db0; C###0 -> D0; D0 -> D0, etc.
         """
+        t = self._tuning
         nnabs = int(self)
 
         if direction == 'up':
@@ -400,42 +735,90 @@ class Note(object):
         else:
             raise ValueError("Illegal direction! Please choose from ['up', 'down', 'auto']!")
 
-        lidx = NAMED_NNREL_LIN.index(self._named_nnrel)
+        lidx = t.NNREL_TO_LIDX[self._named_nnrel]
         new_lidx = lidx + offset
 
-        new_named_nnrel = NAMED_NNREL_LIN[new_lidx % M]
-        new_register = self._register + new_lidx // M
-        new_accidental = nnabs - new_named_nnrel - new_register * N
+        new_named_nnrel = t.NAMED_NNREL_LIN[new_lidx % t.M]
+        new_register = self._register + new_lidx // t.M
+        new_accidental = nnabs - new_named_nnrel - new_register * t.N
 
-        return Note().set_vector(new_named_nnrel, new_accidental, new_register)
+        return Note._new(new_named_nnrel, new_accidental, new_register, tuning=t)
 
-    def get_enharmonic_note_by_key_center(self, key_center=DEFAULT_KEY_CENTER):
-        gidx_left = Note(key_center).get_gidx() - (N - 1) // 2
+    def get_enharmonic_note_by_key_center(self, key_center=None):
+        t = self._tuning
+        key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
+        gidx_left = Note(key_center, t).get_gidx() - (t.N - 1) // 2
         gidx_self = self.get_gidx()
-        span = (gidx_self - gidx_left) // N * N
+        span = (gidx_self - gidx_left) // t.N * t.N
 
-        note_out = Note().set_vector(*self.get_vector()).add_gidx(-span)
+        note_out = Note._new(*self.get_vector(), tuning=t).add_gidx(-span)
 
         # when key_center = C: B#0 -> C1 (not C0)
         # when key_center = B#: C1 -> B#0 (not B#1)
         if span == 0:
             register_change = 0
         else:
-            register_change = self.get_nnrel() // N - note_out.get_nnrel() // N
+            register_change = self.get_nnrel() // t.N - note_out.get_nnrel() // t.N
 
         return note_out.add_register(register_change)
 
 
+class _InternedNote(Note):
+    """
+    read-only note shared by `Note.get_interned`, modifying methods will raise an error
+    """
+    __slots__ = ()
+
+    def __copy__(self):
+        return Note._new(self._named_nnrel, self._accidental, self._register, tuning=self._tuning)
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Interned `Note` is read-only! Please use `copy` to get a modifiable note.')
+
+    set_vector = _read_only
+    from_name = _read_only
+    from_nnabs = _read_only
+    add_gidx = _read_only
+    add_accidental = _read_only
+    add_register = _read_only
+    set_message = _read_only
+    set_message_dict = _read_only
+
+    def get_message_dict(self):
+        return dict()
+
+
 class Interval(object):
+    __slots__ = ('_delta_nnabs', '_delta_lidx', '_tuning')
+
     @staticmethod
-    def interval_name_to_interval_vector(interval_name, ns=-1):
+    def interval_name_to_interval_vector(interval_name, ns=-1, tuning=None):
         """
         when NGS in `DELTA_LIDX_TO_NS.keys()`, will choose naming scheme according to `DELTA_LIDX_TO_NS`
         when NGS not in `DELTA_LIDX_TO_NS.keys()`, will use naming scheme 0
 
         :param interval_name: interval name, e.g. 'P1', 'M2', etc.
         :param ns: interval naming scheme, -1 = auto, 0 = dmMA, 1 = dPA
+        :param tuning: `Tuning` instance, NGS string or `None` (default tuning)
         """
+        t = get_tuning(tuning)
+
+        # look up precomputed names first (see `get_interval_tables`)
+        vector = get_interval_tables(t)['name_to_vector'].get((interval_name, ns))
+        if vector is None:
+            vector = Interval._interval_name_to_interval_vector(interval_name, ns, t)
+
+        return vector
+
+    @staticmethod
+    @lru_cache(maxsize=PARSER_CACHE_SIZE)
+    def _interval_name_to_interval_vector(interval_name, ns, tuning):
+        # cached by (`interval_name`, `ns`, `tuning`), see `get_parser_cache_info`
+        t = tuning
         par = interval_name_parser(interval_name)
 
         # negative or positive (will add this at the end)
@@ -452,7 +835,7 @@ class Interval(object):
 
         # get naming scheme automatically
         if ns == -1:
-            ns = DELTA_LIDX_TO_NS.get(NGS, [1] + [0] * (M - 1))[delta_lidx % M]
+            ns = (t.DELTA_LIDX_TO_NS or [1] + [0] * (t.M - 1))[delta_lidx % t.M]
 
         if ns == 0:
             if 'd' in interval_type:
@@ -465,17 +848,17 @@ class Interval(object):
             raise ValueError(f'No naming scheme {ns}! Please choose from [0, 1]!')
 
         # calculate `delta_nnabs`
-        delta_lidx_rel = delta_lidx % M
-        delta_register = delta_lidx // M
+        delta_lidx_rel = delta_lidx % t.M
+        delta_register = delta_lidx // t.M
 
-        delta_nnrel = DELTA_NNREL_MAJOR[delta_lidx_rel] + DELTA_NNREL_OFFSET.get(NGS, [0] * M)[delta_lidx_rel]
-        delta_nnabs = delta_nnrel_0 + delta_nnrel + N * delta_register
+        delta_nnrel = t.DELTA_NNREL_MAJOR[delta_lidx_rel] + (t.DELTA_NNREL_OFFSET or [0] * t.M)[delta_lidx_rel]
+        delta_nnabs = delta_nnrel_0 + delta_nnrel + t.N * delta_register
 
         # get interval vector
         return sgn * delta_nnabs, sgn * delta_lidx
 
     @staticmethod
-    def interval_vector_to_interval_name(delta_nnabs, delta_lidx, ns=-1):
+    def interval_vector_to_interval_name(delta_nnabs, delta_lidx, ns=-1, tuning=None):
         """
         there only exists 2 types of interval that contain same number of named notes in diatonic scale
 
@@ -501,20 +884,33 @@ class Interval(object):
 
         :return: interval name (type: str)
         """
+        t = get_tuning(tuning)
+
+        # look up precomputed names first (see `get_interval_tables`)
+        interval_name = get_interval_tables(t)['vector_to_name'].get((delta_nnabs, delta_lidx, ns))
+        if interval_name is None:
+            interval_name = Interval._interval_vector_to_interval_name(delta_nnabs, delta_lidx, ns, t)
+
+        return interval_name
+
+    @staticmethod
+    def _interval_vector_to_interval_name(delta_nnabs, delta_lidx, ns, tuning):
+        # general algorithm of `Interval.interval_vector_to_interval_name`, used for vectors out of the lookup tables
+        t = tuning
         sgn = sign(delta_lidx)
 
         if sgn < 0:
             delta_nnabs, delta_lidx = -delta_nnabs, -delta_lidx
 
-        delta_lidx_rel = delta_lidx % M
-        delta_register = delta_lidx // M
+        delta_lidx_rel = delta_lidx % t.M
+        delta_register = delta_lidx // t.M
 
-        delta_nnrel = DELTA_NNREL_MAJOR[delta_lidx_rel] + DELTA_NNREL_OFFSET.get(NGS, [0] * M)[delta_lidx_rel]
-        delta_nnrel_0 = delta_nnabs - N * delta_register - delta_nnrel
+        delta_nnrel = t.DELTA_NNREL_MAJOR[delta_lidx_rel] + (t.DELTA_NNREL_OFFSET or [0] * t.M)[delta_lidx_rel]
+        delta_nnrel_0 = delta_nnabs - t.N * delta_register - delta_nnrel
 
         # get naming scheme automatically
         if ns == -1:
-            ns = DELTA_LIDX_TO_NS.get(NGS, [1] + [0] * (M - 1))[delta_lidx % M]
+            ns = (t.DELTA_LIDX_TO_NS or [1] + [0] * (t.M - 1))[delta_lidx % t.M]
 
         if ns == 0:
             if delta_nnrel_0 > 0:
@@ -537,8 +933,18 @@ class Interval(object):
 
         return -sgn * '-' + itv_type + f'{delta_lidx + 1}'
 
-    def __init__(self, interval_name=DEFAULT_INTERVAL_NAME):
-        self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name)
+    @classmethod
+    def _new(cls, delta_nnabs, delta_lidx, tuning=DEFAULT_TUNING):
+        # create an interval from an interval vector directly, without parsing any interval name
+        interval = object.__new__(cls)
+        interval._delta_nnabs = delta_nnabs
+        interval._delta_lidx = delta_lidx
+        interval._tuning = tuning
+        return interval
+
+    def __init__(self, interval_name=DEFAULT_INTERVAL_NAME, tuning=None):
+        self._tuning = get_tuning(tuning)
+        self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name, tuning=self._tuning)
 
     def __str__(self):
         return self.get_name()
@@ -552,35 +958,39 @@ class Interval(object):
             return other + self
         # `Interval` + `Interval` = `Interval`
         elif isinstance(other, Interval):
-            return Interval().set_vector(self._delta_nnabs + other._delta_nnabs, self._delta_lidx + other._delta_lidx)
+            if other._tuning is not self._tuning:
+                raise ValueError('Intervals of different tunings cannot be added!')
+            return Interval._new(self._delta_nnabs + other._delta_nnabs, self._delta_lidx + other._delta_lidx, self._tuning)
         else:
             raise TypeError('`Interval` can only add a `Note` or an `Interval`!')
 
     def __sub__(self, other):
         # `Interval` - `Interval` = `Interval`
         if isinstance(other, Interval):
-            return Interval().set_vector(self._delta_nnabs - other._delta_nnabs, self._delta_lidx - other._delta_lidx)
+            if other._tuning is not self._tuning:
+                raise ValueError('Intervals of different tunings cannot be subtracted!')
+            return Interval._new(self._delta_nnabs - other._delta_nnabs, self._delta_lidx - other._delta_lidx, self._tuning)
         else:
             raise TypeError('`Interval` can only subtract an `Interval`!')
 
     def __mul__(self, other):
         if isinstance(other, int):
-            return Interval().set_vector(self._delta_nnabs * other, self._delta_lidx * other)
+            return Interval._new(self._delta_nnabs * other, self._delta_lidx * other, self._tuning)
         else:
             raise TypeError('`Interval` can only multiply an integer!')
 
     def __rmul__(self, other):
         if isinstance(other, int):
-            return Interval().set_vector(other * self._delta_nnabs, other * self._delta_lidx)
+            return Interval._new(other * self._delta_nnabs, other * self._delta_lidx, self._tuning)
         else:
             raise TypeError('`Interval` can only multiply an integer!')
 
     def __neg__(self):
-        return Interval().set_vector(-self._delta_nnabs, -self._delta_lidx)
+        return Interval._new(-self._delta_nnabs, -self._delta_lidx, self._tuning)
 
     def __abs__(self):
         sgn = sign(self._delta_lidx)
-        return Interval().set_vector(sgn * self._delta_nnabs, sgn * self._delta_lidx)
+        return Interval._new(sgn * self._delta_nnabs, sgn * self._delta_lidx, self._tuning)
 
     def __int__(self):
         return self._delta_nnabs
@@ -591,7 +1001,7 @@ class Interval(object):
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs < other
         elif isinstance(other, str):
-            return self._delta_nnabs < int(Interval(other))
+            return self._delta_nnabs < int(Interval(other, self._tuning))
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
 
@@ -601,28 +1011,28 @@ class Interval(object):
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs <= other
         elif isinstance(other, str):
-            return self._delta_nnabs <= int(Interval(other))
+            return self._delta_nnabs <= int(Interval(other, self._tuning))
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
 
     def __eq__(self, other):
         if isinstance(other, Interval):
-            return all([self._delta_nnabs == other._delta_nnabs, self._delta_lidx == other._delta_lidx])
+            return all([self._delta_nnabs == other._delta_nnabs, self._delta_lidx == other._delta_lidx, self._tuning is other._tuning])
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs == other
         elif isinstance(other, str):
-            tmp_delta_nnabs, tmp_delta_lidx = Interval(other).get_vector()
+            tmp_delta_nnabs, tmp_delta_lidx = Interval(other, self._tuning).get_vector()
             return all([self._delta_nnabs == tmp_delta_nnabs, self._delta_lidx == tmp_delta_lidx])
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
 
     def __ne__(self, other):
         if isinstance(other, Interval):
-            return all([self._delta_nnabs != other._delta_nnabs, self._delta_lidx != other._delta_lidx])
+            return any([self._delta_nnabs != other._delta_nnabs, self._delta_lidx != other._delta_lidx, self._tuning is not other._tuning])
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs != other
         elif isinstance(other, str):
-            tmp_delta_nnabs, tmp_delta_lidx = Interval(other).get_vector()
+            tmp_delta_nnabs, tmp_delta_lidx = Interval(other, self._tuning).get_vector()
             return any([self._delta_nnabs != tmp_delta_nnabs, self._delta_lidx != tmp_delta_lidx])
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
@@ -633,7 +1043,7 @@ class Interval(object):
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs > other
         elif isinstance(other, str):
-            return self._delta_nnabs > int(Interval(other))
+            return self._delta_nnabs > int(Interval(other, self._tuning))
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
 
@@ -643,10 +1053,13 @@ class Interval(object):
         elif isinstance(other, int) or isinstance(other, float):
             return self._delta_nnabs >= other
         elif isinstance(other, str):
-            return self._delta_nnabs >= int(Interval(other))
+            return self._delta_nnabs >= int(Interval(other, self._tuning))
         else:
             raise TypeError('`Interval` can only compare with `Interval`, `int`, `float` or `str`!')
 
+    def get_tuning(self):
+        return self._tuning
+
     def set_vector(self, delta_nnabs=None, delta_lidx=None):
         # set interval vector (delta_nnabs, delta_lidx) manually
         if delta_nnabs is not None:
@@ -665,93 +1078,251 @@ class Interval(object):
         return self._delta_lidx
 
     def get_name(self):
-        return self.interval_vector_to_interval_name(self._delta_nnabs, self._delta_lidx)
+        return self.interval_vector_to_interval_name(self._delta_nnabs, self._delta_lidx, tuning=self._tuning)
 
     def from_name(self, interval_name):
-        self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name)
+        self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name, tuning=self._tuning)
         return self
 
-    def get_r357t(self, use_latex=False):
+    @staticmethod
+    def _interval_vector_to_r357t(delta_nnabs, delta_lidx, use_latex, tuning):
         # (when `NGS` == '12.7.5') P2 -> 2, d2 -> b2, A2 -> #2, etc.
         sharp_mark = r'\sharp' if use_latex else '#'
         flat_mark = r'\flat' if use_latex else 'b'
 
-        r357t = self.interval_vector_to_interval_name(self._delta_nnabs, self._delta_lidx, ns=1)
+        r357t = Interval._interval_vector_to_interval_name(delta_nnabs, delta_lidx, 1, tuning)
         r357t = r357t.replace('P', '').replace('d', flat_mark).replace('A', sharp_mark)
         r357t = 'R' if r357t == '1' else r357t
         r357t = f'${r357t}$' if use_latex else r357t
 
         return r357t
 
+    def get_r357t(self, use_latex=False):
+        # look up precomputed r357ts first (see `get_interval_tables`)
+        r357t = get_interval_tables(self._tuning)['vector_to_r357t'].get((self._delta_nnabs, self._delta_lidx, use_latex))
+        if r357t is None:
+            r357t = self._interval_vector_to_r357t(self._delta_nnabs, self._delta_lidx, use_latex, self._tuning)
+
+        return r357t
+
     def from_r357t(self, r357t):
         # this is similar to interval naming scheme 1, 'P' -> '', 'd' -> 'b', 'A' -> '#'
-        if r357t in ['', 'R']:
+        vector = get_interval_tables(self._tuning)['r357t_to_vector'].get(r357t)
+
+        if vector is not None:
+            self._delta_nnabs, self._delta_lidx = vector
+        elif r357t in ['', 'R']:
             self._delta_nnabs, self._delta_lidx = 0, 0
-            return self
         else:
             interval_name = 'P' + r357t.replace('b', 'd').replace('#', 'A')
-            self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name, ns=1)
+            self._delta_nnabs, self._delta_lidx = self.interval_name_to_interval_vector(interval_name, ns=1, tuning=self._tuning)
 
         return self
 
     def normalize(self):
-        delta_register = self._delta_lidx // M
-        self._delta_lidx = self._delta_lidx % M
-        self._delta_nnabs = self._delta_nnabs - N * delta_register
+        t = self._tuning
+        delta_register = self._delta_lidx // t.M
+        self._delta_lidx = self._delta_lidx % t.M
+        self._delta_nnabs = self._delta_nnabs - t.N * delta_register
         return self
 
 
+# range of precomputed interval names, up to `INTERVAL_TABLE_ACCIDENTAL_RANGE` 'A's or 'd's and
+# `INTERVAL_TABLE_REGISTER_SPAN` registers in both directions (see `set_interval_table_range`)
+INTERVAL_TABLE_ACCIDENTAL_RANGE = 3
+INTERVAL_TABLE_REGISTER_SPAN = 2
+
+
+@lru_cache(maxsize=None)
+def get_interval_tables(tuning):
+    """
+    bidirectional lookup tables between interval vectors and interval names (or r357ts) of a tuning, e.g.
+
+    vector_to_name[(4, 2, -1)] = 'M3'; vector_to_r357t[(3, 2, False)] = 'b3'
+    name_to_vector[('M3', -1)] = (4, 2); r357t_to_vector['b3'] = (3, 2)
+
+    vectors and names out of range are not in the tables, and will be handled by the general algorithms
+    """
+    t = tuning
+    vector_to_name, name_to_vector = dict(), dict()
+    vector_to_r357t, r357t_to_vector = dict(), dict()
+
+    for delta_lidx in range(-INTERVAL_TABLE_REGISTER_SPAN * t.M, INTERVAL_TABLE_REGISTER_SPAN * t.M + 1):
+        # major (or perfect) interval of current `delta_lidx`, then add accidentals
+        sgn = -1 if delta_lidx < 0 else 1
+        delta_lidx_rel = abs(delta_lidx) % t.M
+        delta_nnrel = t.DELTA_NNREL_MAJOR[delta_lidx_rel] + (t.DELTA_NNREL_OFFSET or [0] * t.M)[delta_lidx_rel]
+        delta_nnabs_major = delta_nnrel + t.N * (abs(delta_lidx) // t.M)
+
+        for accidental in range(-INTERVAL_TABLE_ACCIDENTAL_RANGE - 1, INTERVAL_TABLE_ACCIDENTAL_RANGE + 1):
+            vector = (sgn * (delta_nnabs_major + accidental), delta_lidx)
+
+            for ns in [-1, 0, 1]:
+                interval_name = Interval._interval_vector_to_interval_name(*vector, ns, t)
+                vector_to_name[(*vector, ns)] = interval_name
+                name_to_vector[(interval_name, ns)] = vector
+
+            for use_latex in [False, True]:
+                vector_to_r357t[(*vector, use_latex)] = Interval._interval_vector_to_r357t(*vector, use_latex, t)
+
+            # r357ts are only used for upward intervals
+            if delta_lidx >= 0:
+                r357t_to_vector[vector_to_r357t[(*vector, False)]] = vector
+
+    r357t_to_vector[''] = (0, 0)
+
+    return dict(
+        vector_to_name=vector_to_name,
+        name_to_vector=name_to_vector,
+        vector_to_r357t=vector_to_r357t,
+        r357t_to_vector=r357t_to_vector,
+    )
+
+
+def set_interval_table_range(accidental_range=3, register_span=2):
+    # change the range of precomputed interval names, tables will be rebuilt on next use
+    global INTERVAL_TABLE_ACCIDENTAL_RANGE, INTERVAL_TABLE_REGISTER_SPAN
+    INTERVAL_TABLE_ACCIDENTAL_RANGE = accidental_range
+    INTERVAL_TABLE_REGISTER_SPAN = register_span
+    get_interval_tables.cache_clear()
+
+
+class _NoteView(Note):
+    """
+    a note of `DiatonicScale`, its note vector and messages are read from (and written to) integer lists of the scale,
+    so changes of a view will affect the scale; copies of a view are ordinary notes
+    """
+    __slots__ = ('_scale', '_k')
+
+    def __init__(self, scale, k):
+        self._scale = scale
+        self._k = k
+
+    def __copy__(self):
+        return Note._new(self._named_nnrel, self._accidental, self._register, self._message, self._tuning)
+
+    def __deepcopy__(self, memo):
+        message = dict(self._message) if self._message else None
+        return Note._new(self._named_nnrel, self._accidental, self._register, message, self._tuning)
+
+    def __reduce__(self):
+        return Note._new, (self._named_nnrel, self._accidental, self._register, self._message, self._tuning)
+
+    @property
+    def _named_nnrel(self):
+        return self._scale._meta_named_nnrels[self._k]
+
+    @_named_nnrel.setter
+    def _named_nnrel(self, value):
+        self._scale._meta_named_nnrels[self._k] = value
+
+    @property
+    def _accidental(self):
+        return self._scale._meta_accidentals[self._k]
+
+    @_accidental.setter
+    def _accidental(self, value):
+        self._scale._meta_accidentals[self._k] = value
+
+    @property
+    def _register(self):
+        return self._scale._meta_registers[self._k]
+
+    @_register.setter
+    def _register(self, value):
+        self._scale._meta_registers[self._k] = value
+
+    @property
+    def _message(self):
+        return self._scale._meta_messages[self._k]
+
+    @_message.setter
+    def _message(self, value):
+        self._scale._meta_messages[self._k] = value
+
+    @property
+    def _tuning(self):
+        return self._scale._tuning
+
+
 class DiatonicScale(object):
-    def __init__(self, scale_name=DEFAULT_DIATONIC_SCALE_NAME):
+    def __init__(self, scale_name=None, tuning=None):
         """
         Create a note list, which has diatonic property in `N`-TET system
-        `self._meta_notes` are the notes in sequence of generative order
+        meta notes are the notes in sequence of generative order, stored as integer lists (see `_NoteView`)
         `scale_name` should be ST MT-mode: ST = scale tonic, MT = mode tonic
+        `tuning` can be a `Tuning` instance, a NGS string or `None` (default tuning)
         """
+        self._tuning = t = get_tuning(tuning)
+
+        if scale_name is None:
+            scale_name = t.DEFAULT_DIATONIC_SCALE_NAME
 
         # parse `scale_name`, get `scale_tonic_name` and `scale_type`
-        par1 = scale_name_parser(scale_name)
+        par1 = scale_name_parser(scale_name, t)
         scale_tonic_name = par1['scale_tonic_name']
         scale_type = par1['scale_type']
 
         # parse `scale_tonic_name`
-        st_named_nnrel, st_accidental, st_register = Note.note_name_to_note_vector(scale_tonic_name)
+        st_named_nnrel, st_accidental, st_register = Note.note_name_to_note_vector(scale_tonic_name, t)
 
         # parse `scale_type`, and get `mode_tonic_name`
-        mode_tonic_name = scale_type_parser(scale_type)['mode_tonic_name']
+        mode_tonic_name = scale_type_parser(scale_type, t)['mode_tonic_name']
 
         # parse `mode_tonic_name`
-        mt_named_nnrel, mt_accidental, mt_register = Note.note_name_to_note_vector(mode_tonic_name)
+        mt_named_nnrel, mt_accidental, mt_register = Note.note_name_to_note_vector(mode_tonic_name, t)
 
         # [!] get scale tonic index in `NAMED_GEN_NNREL` and number of accidentals
-        st_gidx = NAMED_NNREL_GEN.index(st_named_nnrel)
-        mt_gidx = NAMED_NNREL_GEN.index(mt_named_nnrel)
-        accidentals = st_gidx - mt_gidx + M * (st_accidental + mt_accidental)
-        self._st_gidx = st_gidx
+        st_gidx = t.NAMED_NNREL_GEN.index(st_named_nnrel)
+        mt_gidx = t.NAMED_NNREL_GEN.index(mt_named_nnrel)
+        accidentals = st_gidx - mt_gidx + t.M * (st_accidental + mt_accidental)
+        self._set_st_gidx(st_gidx)
         self._accidentals = accidentals
 
-        # get meta notes (generative order)
-        self._meta_notes = [Note(f'{s}{st_register}') for s in NAMED_STR_GEN]
-
-        # put accidental(s) on meta notes
-        for k in range(0, accidentals) if accidentals > 0 else range(accidentals, 0):
-            if accidentals > 0:
-                self._meta_notes[k % M].add_accidental(1)
-            else:
-                self._meta_notes[k % M].add_accidental(-1)
+        # get meta notes (generative order), `accidentals` sharps (or flats) are put on them one by one, i.e.
+        # meta note k gets q + 1 of them when k < r, else q, where `accidentals` = q * M + r
+        q, r = divmod(accidentals, t.M)
+        self._meta_named_nnrels = list(t.NAMED_NNREL_GEN)
+        self._meta_accidentals = [q + 1 if k < r else q for k in range(t.M)]
+        self._meta_registers = [st_register] * t.M
+        self._meta_messages = [None] * t.M
 
         self._refresh_register()
         self._refresh_messages()
 
         # print options initialization
-        self._printoptions = dict(ns=DEFAULT_DIATONIC_SCALE_NS, show_register=False)
+        self._printoptions = dict(ns=t.DEFAULT_DIATONIC_SCALE_NS, show_register=False)
 
     def __getitem__(self, item):
         """
-        linear view of `self._meta_notes` (remember that `self._meta_notes` is of generative order)
-        changes will affect `self._meta_notes`
+        linear view of meta notes (remember that meta notes are of generative order)
+        changes will affect meta notes
         """
-        return [self._meta_notes[(self._st_gidx + STEP_LENGTH_2ND_GEN * k) % M] for k in range(M)][item]
+        if isinstance(item, slice):
+            return [_NoteView(self, k) for k in self._perm[item]]
+        else:
+            return _NoteView(self, self._perm[item])
+
+    def __iter__(self):
+        return iter([_NoteView(self, k) for k in self._perm])
+
+    def __len__(self):
+        return self._tuning.M
+
+    def _set_st_gidx(self, st_gidx):
+        # set scale tonic index, and cache the permutation from linear order to generative order
+        t = self._tuning
+        self._st_gidx = st_gidx
+        self._perm = [(st_gidx + t.STEP_LENGTH_2ND_GEN * k) % t.M for k in range(t.M)]
+
+    def _get_nnabs(self, k):
+        # nnabs of meta note k
+        return self._meta_named_nnrels[k] + self._meta_accidentals[k] + self._meta_registers[k] * self._tuning.N
+
+    def _get_lidx(self, k):
+        # absolute linear index of meta note k
+        t = self._tuning
+        return t.NNREL_TO_LIDX[self._meta_named_nnrels[k]] + self._meta_registers[k] * t.M
 
     def __str__(self):
         note_names = [note.get_name(self._printoptions['show_register']) for note in self]
@@ -761,40 +1332,46 @@ class DiatonicScale(object):
         return f"DiatonicScale('{self.get_name()}')"
 
     def _refresh_register(self, st_register=None):
+        st = self._perm[0]
         if st_register is None:
-            st_register = self[0].get_register()
+            st_register = self._meta_registers[st]
         else:
-            self[0].set_vector(register=st_register)
+            self._meta_registers[st] = st_register
 
-        for note in self[1:]:
-            if note.get_nnrel() < self[0].get_nnrel():
-                note.set_vector(register=st_register + 1)
+        st_nnrel = self._meta_named_nnrels[st] + self._meta_accidentals[st]
+        for k in self._perm[1:]:
+            if self._meta_named_nnrels[k] + self._meta_accidentals[k] < st_nnrel:
+                self._meta_registers[k] = st_register + 1
             else:
-                note.set_vector(register=st_register)
+                self._meta_registers[k] = st_register
 
     def _refresh_messages(self):
         # add degree message for every note
-        for k, note in enumerate(self):
-            note.set_message(degree=k)
+        for degree, k in enumerate(self._perm):
+            message = self._meta_messages[k]
+            self._meta_messages[k] = {'degree': degree} if message is None else {**message, 'degree': degree}
+
+    def get_tuning(self):
+        return self._tuning
 
     def get_nnabs_list(self):
         """
         return a list of absolute note numbers `nnabs` of current scale in linear order
         e.g. (in '12.7.5' diatonic scale) [C0, D0, E0, F0, G0, A0, B0] = [0, 2, 4, 5, 7, 9, 11]
         """
-        return [int(note) for note in self]
+        return [self._get_nnabs(k) for k in self._perm]
 
     def get_named_nnrel_list(self):
-        return [note.get_named_nnrel() for note in self]
+        return [self._meta_named_nnrels[k] for k in self._perm]
 
     def get_nnrel_list(self):
-        return [note.get_nnrel() for note in self]
+        return [self._meta_named_nnrels[k] + self._meta_accidentals[k] for k in self._perm]
 
     def get_accidental_list(self):
-        return [note.get_accidental() for note in self]
+        return [self._meta_accidentals[k] for k in self._perm]
 
     def get_register_list(self):
-        return [note.get_register() for note in self]
+        return [self._meta_registers[k] for k in self._perm]
 
     def set_printoptions(self, ns=None, show_register=None):
         if ns is not None:
@@ -807,8 +1384,8 @@ class DiatonicScale(object):
 
     def set_scale_tonic_str(self, scale_tonic_name):
         # the default scale tonic note is in inputting `scale_name`, e.g. `C# Ionian` -> 'C#'
-        st_named_nnrel, _, st_register = Note.note_name_to_note_vector(scale_tonic_name)
-        self._st_gidx = NAMED_NNREL_GEN.index(st_named_nnrel)
+        st_named_nnrel, _, st_register = Note.note_name_to_note_vector(scale_tonic_name, self._tuning)
+        self._set_st_gidx(self._tuning.NAMED_NNREL_GEN.index(st_named_nnrel))
 
         self._refresh_register(st_register)
         self._refresh_messages()
@@ -817,9 +1394,9 @@ class DiatonicScale(object):
 
     def set_scale_tonic_deg(self, degree=0, st_register=0):
         # set `degree` note of current diatonic scale as new scale tonic note
-        st_new_named_nnrel = self[degree % M].get_named_nnrel()
+        st_new_named_nnrel = self._meta_named_nnrels[self._perm[degree % self._tuning.M]]
 
-        self._st_gidx = NAMED_NNREL_GEN.index(st_new_named_nnrel)
+        self._set_st_gidx(self._tuning.NAMED_NNREL_GEN.index(st_new_named_nnrel))
 
         self._refresh_register(st_register)
         self._refresh_messages()
@@ -833,15 +1410,16 @@ class DiatonicScale(object):
         else:
             scale_tonic_name = self[0].get_name(show_register=False)
 
-        st_named_nnrel, st_accidental, st_register = Note.note_name_to_note_vector(scale_tonic_name)
+        t = self._tuning
+        st_named_nnrel, st_accidental, st_register = Note.note_name_to_note_vector(scale_tonic_name, t)
 
-        st_gidx = NAMED_NNREL_GEN.index(st_named_nnrel)
-        mt_gidx = st_gidx + M * st_accidental - self._accidentals
+        st_gidx = t.NAMED_NNREL_GEN.index(st_named_nnrel)
+        mt_gidx = st_gidx + t.M * st_accidental - self._accidentals
 
-        scale_type = NAMED_STR_GEN[mt_gidx] + '-mode'
+        scale_type = t.NAMED_STR_GEN[mt_gidx] + '-mode'
 
         if self._printoptions['ns'] == 1:
-            scale_type = scale_type_convertor(scale_type, 0, 1)
+            scale_type = t.scale_type_convertor(scale_type, 0, 1)
 
         if type_only:
             return scale_type
@@ -850,43 +1428,51 @@ class DiatonicScale(object):
 
     def get_intervals_seq(self):
         # example of interval vector: [C, D, E, F, G, A, B] -> [M2, M2, m2, M2, M2, M2, m2]
-        notes = [*self, self[0] + Interval().set_vector(N, M)]
-        return [n2 - n1 for n1, n2 in zip(notes[:-1], notes[1:])]
+        t = self._tuning
+        nnabs_list = [self._get_nnabs(k) for k in self._perm]
+        lidx_list = [self._get_lidx(k) for k in self._perm]
+        nnabs_list.append(nnabs_list[0] + t.N)
+        lidx_list.append(lidx_list[0] + t.M)
+        return [Interval._new(nnabs_list[k + 1] - nnabs_list[k], lidx_list[k + 1] - lidx_list[k], t) for k in range(t.M)]
 
     def get_intervals_cum(self):
         # example of interval vector: [C, D, E, F, G, A, B] -> [P1, M2, M3, P4, P5, M6, M7]
-        return [note - self[0] for note in self]
+        t = self._tuning
+        st = self._perm[0]
+        return [Interval._new(self._get_nnabs(k) - self._get_nnabs(st), self._get_lidx(k) - self._get_lidx(st), t) for k in self._perm]
 
     def add_accidental(self, n=0):
         r = (self._accidentals + (0 if n >= 0 else n), self._accidentals + (n if n >= 0 else 0))
         for k in range(*r):
-            self._meta_notes[k % M].add_accidental(sign(n))
+            self._meta_accidentals[k % self._tuning.M] += sign(n)
         self._accidentals += n
 
         return self
 
     def add_accidentals_for_all(self, n=0):
-        for note in self._meta_notes:
-            note.add_accidental(n)
-        self._accidentals += M * n
+        for k in range(self._tuning.M):
+            self._meta_accidentals[k] += n
+        self._accidentals += self._tuning.M * n
 
         return self
 
     def add_register(self, n=0):
-        for note in self._meta_notes:
-            note.add_register(n)
+        for k in range(self._tuning.M):
+            self._meta_registers[k] += n
         return self
 
-    def get_chord(self, root_degree, n_notes, step_length=STEP_LENGTH_CHD_LIN):
+    def get_chord(self, root_degree, n_notes, step_length=None):
         """
-        notice: this method will return copies of `self._meta_notes` elements
+        notice: this method will return copies of meta notes
         """
-        root_degree = root_degree % M
+        m = self._tuning.M
+        step_length = self._tuning.STEP_LENGTH_CHD_LIN if step_length is None else step_length
+        root_degree = root_degree % m
 
         notes = []
         for i in range(n_notes):
             idx = root_degree + step_length * i
-            notes.append(copy(self[idx % M]) if idx < M else copy(self[idx % M]).add_register(idx // M))
+            notes.append(copy(self[idx % m]) if idx < m else copy(self[idx % m]).add_register(idx // m))
 
         for note in notes:
             br357t = (note - notes[0]).get_r357t()
@@ -896,11 +1482,11 @@ class DiatonicScale(object):
 
     def get_chord_ex(self, degrees=(0, )):
         """
-        notice: this method will return copies of `self._meta_notes` elements
+        notice: this method will return copies of meta notes
         """
         notes = []
         for i, deg in enumerate(degrees):
-            cur_note = copy(self[deg % M])
+            cur_note = copy(self[deg % self._tuning.M])
             if i == 0:
                 notes.append(cur_note)
             else:
@@ -919,13 +1505,13 @@ class DiatonicScale(object):
 
 
 class AlteredDiatonicScale(DiatonicScale):
-    def __init__(self, scale_name):
-        par = scale_name_parser(scale_name)
+    def __init__(self, scale_name, tuning=None):
+        par = scale_name_parser(scale_name, tuning)
 
         scale_tonic_name = par['scale_tonic_name']
         base_scale_type = par['scale_type']
 
-        super().__init__(scale_tonic_name + ' ' + base_scale_type)
+        super().__init__(scale_tonic_name + ' ' + base_scale_type, tuning)
 
         # get altered notes
         if par['altered_note']:
@@ -939,14 +1525,26 @@ class AlteredDiatonicScale(DiatonicScale):
 
             # alter base scale
             for a, d in zip(accidentals, altered_degrees):
-                self[d % M].add_accidental(a)
+                self[d % self._tuning.M].add_accidental(a)
 
         # print options default value
-        self._printoptions['ns'] = DEFAULT_ALTERED_DIATONIC_SCALE_NS
+        self._printoptions['ns'] = self._tuning.DEFAULT_ALTERED_DIATONIC_SCALE_NS
 
     def __repr__(self):
         return '\n'.join([f"AlteredDiatonicScale('{scale_name}')" for scale_name in self.get_name()])
 
+    @staticmethod
+    def _distances_0(nnabs_list_1, nnabs_list_2, N):
+        # [N, N] distances of all rotations of 2 scales
+        a = np.expand_dims(np.array(nnabs_list_1), axis=-1)  # [M, 1]
+        b = np.expand_dims(np.array(nnabs_list_2), axis=-1)  # [M, 1]
+        x = np.expand_dims(np.arange(N), axis=0)  # [1, N]
+
+        ax = np.expand_dims(np.sort((a + x) % N, axis=0), axis=-1)  # [M, N, 1]
+        bx = np.expand_dims(np.sort((b + x) % N, axis=0), axis=-2)  # [M, 1, N]
+
+        return np.sum((N - np.abs(2 * np.abs(ax - bx) - N)) // 2, axis=0)  # [N, N]
+
     # TODO: `AlteredDiatonicScale.distance_0` documentations
     def distance_0(self, other, return_offsets=False):
         """
@@ -961,15 +1559,10 @@ class AlteredDiatonicScale(DiatonicScale):
         # instance type check
         if not isinstance(other, DiatonicScale):
             raise TypeError('`other` must be of type `DiatonicScale`!')
+        if other._tuning is not self._tuning:
+            raise ValueError('Scales of different tunings cannot be compared!')
 
-        a = np.expand_dims(np.array(self.get_nnabs_list()), axis=-1)  # [M, 1]
-        b = np.expand_dims(np.array(other.get_nnabs_list()), axis=-1)  # [M, 1]
-        x = np.expand_dims(np.arange(N), axis=0)  # [1, N]
-
-        ax = np.expand_dims(np.sort((a + x) % N, axis=0), axis=-1)  # [M, N, 1]
-        bx = np.expand_dims(np.sort((b + x) % N, axis=0), axis=-2)  # [M, 1, N]
-
-        ds = np.sum((N - np.abs(2 * np.abs(ax - bx) - N)) // 2, axis=0)  # [N, N]
+        ds = self._distances_0(self.get_nnabs_list(), other.get_nnabs_list(), self._tuning.N)
         d = np.min(ds)
 
         if return_offsets:
@@ -992,6 +1585,10 @@ class AlteredDiatonicScale(DiatonicScale):
         # instance type check
         if not isinstance(other, DiatonicScale):
             raise TypeError('`other` must be of type `DiatonicScale`!')
+        if other._tuning is not self._tuning:
+            raise ValueError('Scales of different tunings cannot be compared!')
+
+        N, M = self._tuning.N, self._tuning.M
 
         def _nnrel_pair_to_accidental(nnrel_1, nnrel_2):
             # convert nnrel pair to accidental, e.g. (11, 1) -> 2, (0, 11) -> -1, etc.
@@ -1028,6 +1625,8 @@ class AlteredDiatonicScale(DiatonicScale):
         # instance type check
         if not isinstance(other, DiatonicScale):
             raise TypeError('`other` must be of type `DiatonicScale`!')
+        if other._tuning is not self._tuning:
+            raise ValueError('Scales of different tunings cannot be compared!')
 
         named_nnrel_list_self, accidental_list_self = self.get_named_nnrel_list(), self.get_accidental_list()
         named_nnrel_list_other, accidental_list_other = other.get_named_nnrel_list(), other.get_accidental_list()
@@ -1048,12 +1647,19 @@ class AlteredDiatonicScale(DiatonicScale):
         else:
             return d
 
+    def get_scale_class_key(self):
+        # transposition-normalized nnrels in degree order, e.g. (in '12.7.5') [Cb, Db, Eb, F, G, Ab, Bb] -> (0, 2, 4, 6, 8, 9, 11)
+        N = self._tuning.N
+        nnrel_list = self.get_nnrel_list()
+        return tuple([(nnrel - nnrel_list[0]) % N for nnrel in nnrel_list])
+
     def get_order(self):
-        return self.distance_0(DiatonicScale())
+        order, scale_types, offsets = get_scale_name_index(self._tuning).get(self.get_scale_class_key())
+        return order
 
     def if_well_formed(self):
         nnabs_list = self.get_nnabs_list()
-        nnabs_list.append(nnabs_list[0] + N)
+        nnabs_list.append(nnabs_list[0] + self._tuning.N)
 
         smis = []  # strictly monotone increasing
         for prev, next in zip(nnabs_list[:-1], nnabs_list[1:]):
@@ -1088,6 +1694,45 @@ class AlteredDiatonicScale(DiatonicScale):
         scale_tonic                -> Cb, but (b1) in scale_type, so it's C
         scale_name                 -> C E-mode(b1)
         """
+        scale_types = self._get_scale_types(self.get_scale_class_key(), self[0].get_nnrel(), self._tuning)
+
+        ns = self._printoptions['ns'] if self._printoptions['ns'] in [1, 2] else 0
+
+        # get scale tonic
+        scale_tonic = copy(self[0])
+
+        if self._printoptions['show_register']:
+            scale_tonic_name = scale_tonic.get_name()
+        else:
+            scale_tonic_name = scale_tonic.get_name(show_register=False)
+
+        # if `type_only`
+        if type_only:
+            scale_names = [scale_type[ns] for scale_type in scale_types]
+        else:
+            scale_names = [scale_tonic_name + ' ' + scale_type[ns] for scale_type in scale_types]
+
+        return unique(scale_names)
+
+    @staticmethod
+    def _get_scale_types(scale_class_key, tonic_nnrel, tuning):
+        # lowest-order scale types are looked up in the scale-class index of current tuning (see `ScaleNameIndex`),
+        # their offsets are transposed back to scale tonic, so that names are listed in the searching order
+        N = tuning.N
+        order, scale_types, offsets = get_scale_name_index(tuning).get(scale_class_key)
+
+        first_offsets = dict()
+        for offset_0, offset_1, k in offsets:
+            offset = ((offset_0 - tonic_nnrel) % N, offset_1)
+            first_offsets[k] = min(first_offsets.get(k, offset), offset)
+        return [scale_types[k] for k in sorted(first_offsets, key=lambda k: first_offsets[k])]
+
+    @staticmethod
+    def _search_scale_types(scale_class_key, tuning):
+        # find all lowest-order scale types (ns 0/1/2) of a scale class by searching rotations, see `get_name`
+        # `offsets` are (offset of scale class, offset of diatonic scale, index of scale type) triples
+        t = tuning
+        N, M = t.N, t.M
 
         def _nnrel_pair_to_accidental(nnrel_1, nnrel_2):
             # convert nnrel pair to accidental, e.g. (11, 1) -> 2, (0, 11) -> -1, etc.
@@ -1095,19 +1740,21 @@ class AlteredDiatonicScale(DiatonicScale):
             sgn_2 = sign(nnrel_2 - nnrel_1)
             return sgn_1 * sgn_2 * (N - abs(2 * abs(nnrel_1 - nnrel_2) - N)) // 2
 
-        ds = DiatonicScale()
-        order, offsets = self.distance_0(ds, return_offsets=True)
+        ds_nnrel_list = DiatonicScale(tuning=t).get_nnrel_list()
+        ds = AlteredDiatonicScale._distances_0(scale_class_key, ds_nnrel_list, N)
+        order = int(np.min(ds))
+        offsets = np.stack(np.where(ds == order), axis=-1)
 
-        scale_names = []
+        scale_types, type_offsets = [], dict()
         for offset in offsets:
-            scale_1_nnrels_offset = [(nnrel + offset[0]) % N for nnrel in self.get_nnrel_list()]
-            scale_2_nnrels_offset = [(nnrel + offset[1]) % N for nnrel in ds.get_nnrel_list()]
+            scale_1_nnrels_offset = [(nnrel + offset[0]) % N for nnrel in scale_class_key]
+            scale_2_nnrels_offset = [(nnrel + offset[1]) % N for nnrel in ds_nnrel_list]
 
             # get mode tonic
             a = scale_1_nnrels_offset.index(min(scale_1_nnrels_offset))
             b = scale_2_nnrels_offset.index(min(scale_2_nnrels_offset))
             mode_tonic_idx = (0 - a + b) % M
-            mode_tonic_name = NAMED_STR_LIN[mode_tonic_idx]
+            mode_tonic_name = t.NAMED_STR_LIN[mode_tonic_idx]
 
             # get altered notes
             scale_1_nnrels_offset.sort()
@@ -1138,65 +1785,167 @@ class AlteredDiatonicScale(DiatonicScale):
                 altered_notes_str = ''
 
             scale_type_ns0 = scale_type + altered_notes_str
-            scale_type_ns1 = scale_type_convertor(scale_type, 0, 1) + altered_notes_str
-            scale_type_ns2 = scale_type_convertor(scale_type + altered_notes_str, 0, 2)
+            scale_type_ns1 = t.scale_type_convertor(scale_type, 0, 1) + altered_notes_str
+            scale_type_ns2 = t.scale_type_convertor(scale_type + altered_notes_str, 0, 2)
 
-            if self._printoptions['ns'] == 1:
-                scale_type_out = scale_type_ns1
-            elif self._printoptions['ns'] == 2:
-                scale_type_out = scale_type_ns2
-            else:
-                scale_type_out = scale_type_ns0
+            # only the first offset (of every `offset[0]`) of every scale type is needed for sorting
+            scale_type = (scale_type_ns0, scale_type_ns1, scale_type_ns2)
+            if scale_type not in scale_types:
+                scale_types.append(scale_type)
+            type_offsets.setdefault((int(offset[0]), scale_types.index(scale_type)), int(offset[1]))
 
-            # get scale tonic
-            scale_tonic = copy(self[0])
+        offsets = [(offset_0, offset_1, k) for (offset_0, k), offset_1 in type_offsets.items()]
 
-            if self._printoptions['show_register']:
-                scale_tonic_name = scale_tonic.get_name()
-            else:
-                scale_tonic_name = scale_tonic.get_name(show_register=False)
+        return order, scale_types, offsets
 
-            # if `type_only`
-            if type_only:
-                scale_names.append(scale_type_out)
-            else:
-                scale_names.append(scale_tonic_name + ' ' + scale_type_out)
 
-        return unique(scale_names)
+# directory of persisted scale-class indexes (see `ScaleNameIndex`), `None` means no persistence
+SCALE_NAME_INDEX_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__cache__')
+
+# bump this when `AlteredDiatonicScale._search_scale_types` changes, so that persisted indexes are rebuilt
+SCALE_NAME_INDEX_VERSION = 1
+
+
+class ScaleNameIndex(object):
+    """
+    scale-class index of a tuning, maps scale class keys (see `AlteredDiatonicScale.get_scale_class_key`) to
+    scale orders, all lowest-order scale types in ns 0/1/2 and their offsets, e.g. (in '12.7.5')
+
+    (0, 1, 3, 4, 6, 8, 10) -> (1, [('B-mode(b4)', 'Locrian(b4)', 'Super Locrian'), ('Cb-mode(#1)', ...)], [(0, 1, 0), ...])
+
+    entries are searched on first use, then persisted to `SCALE_NAME_INDEX_DIR` at exit; a persisted index is
+    ignored when NGS or naming tables in consts.py are changed
+    """
+    def __init__(self, tuning=None):
+        self._tuning = get_tuning(tuning)
+        self._index = dict()
+        self._dirty = False
+        self._fingerprint = self._compute_fingerprint()
+        self.load()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, scale_class_key):
+        return tuple(scale_class_key) in self._index
+
+    def get(self, scale_class_key):
+        scale_class_key = tuple(scale_class_key)
+        entry = self._index.get(scale_class_key)
+        if entry is None:
+            entry = AlteredDiatonicScale._search_scale_types(scale_class_key, self._tuning)
+            self._index[scale_class_key] = entry
+            self._dirty = True
+        return entry
+
+    def add(self, scale_class_key, entry):
+        # merge an entry searched elsewhere (e.g. in a worker process), known entries are kept
+        scale_class_key = tuple(scale_class_key)
+        if scale_class_key not in self._index:
+            self._index[scale_class_key] = entry
+            self._dirty = True
+        return self
+
+    def get_fingerprint(self):
+        # computed once per index, it is a part of every analysis cache key
+        return self._fingerprint
+
+    def _compute_fingerprint(self):
+        # hash of everything that scale types depend on
+        t = self._tuning
+        tables = (
+            SCALE_NAME_INDEX_VERSION, t.NGS, t.NAMED_STR_LIN, t.DELTA_NNREL_MAJOR, t.DELTA_NNREL_OFFSET, t.DELTA_LIDX_TO_NS,
+            SCALE_TYPE_NS0_TO_NS1.get(t.NGS), SCALE_TYPE_NS0_TO_NS2.get(t.NGS),
+        )
+        return hashlib.sha1(repr(tables).encode('utf-8')).hexdigest()
+
+    def get_path(self):
+        if SCALE_NAME_INDEX_DIR is None:
+            return None
+        return os.path.join(SCALE_NAME_INDEX_DIR, f'scale_names_{self._tuning.NGS}.json')
+
+    def load(self):
+        path = self.get_path()
+        if path is None or not os.path.isfile(path):
+            return self
+
+        # unreadable or outdated files are simply ignored, and will be overwritten on next `save`
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data['fingerprint'] != self.get_fingerprint():
+                return self
+            for key, order, scale_types, offsets in data['index']:
+                scale_types = [tuple(scale_type) for scale_type in scale_types]
+                offsets = [tuple(offset) for offset in offsets]
+                self._index.setdefault(tuple(key), (order, scale_types, offsets))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        return self
+
+    def save(self):
+        path = self.get_path()
+        if path is None or not self._dirty:
+            return self
+
+        data = dict(
+            fingerprint=self.get_fingerprint(),
+            index=[[list(key), *entry] for key, entry in self._index.items()],
+        )
+
+        # write to a temporary file first, so that an interrupted `save` never leaves a broken index
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._dirty = False
+        return self
+
+    def clear(self):
+        # clear current index and its persisted file
+        self._index = dict()
+        self._dirty = False
+        path = self.get_path()
+        if path is not None and os.path.isfile(path):
+            os.remove(path)
+        return self
+
+
+# scale-class indexes of all used tunings
+_SCALE_NAME_INDEXES = dict()
+
+
+def get_scale_name_index(tuning=None):
+    t = get_tuning(tuning)
+    if t not in _SCALE_NAME_INDEXES:
+        _SCALE_NAME_INDEXES[t] = ScaleNameIndex(t)
+    return _SCALE_NAME_INDEXES[t]
+
+
+@atexit.register
+def _save_scale_name_indexes():
+    # persisting is only an optimization, e.g. a read-only `SCALE_NAME_INDEX_DIR` is not an error
+    for index in _SCALE_NAME_INDEXES.values():
+        try:
+            index.save()
+        except OSError:
+            pass
 
 
 class Chord(object):
     @staticmethod
-    def chord_name_to_notes(chord_name):
-        bass = []
-        body = []
-        tension = []
+    def chord_name_to_notes(chord_name, tuning=None):
+        # note vectors are cached per (root, chord type, tension type, bass), see `_chord_to_note_vectors`
+        t = get_tuning(tuning)
+        vectors = _chord_to_note_vectors(*_chord_name_parser(chord_name, t), t)
 
-        par1 = chord_name_parser(chord_name)
-        bass_name = par1['bass_name']
-        root_name = par1['root_name']
-        chord_type = par1['chord_type']
-        tension_type = par1['tension_type']
-
-        # bass note
-        if bass_name:
-            bass.append(Note(bass_name) - Interval().set_vector(N, M))
-            bass[0].set_message(br357t='B')
-
-        # r357 notes
-        root = Note(root_name)
-        intervals = [Interval().from_r357t(r357) for r357 in chord_type.split('.')]
-        body.extend([root + interval for interval in intervals])
-        for note, interval in zip(body, intervals):
-            note.set_message(br357t=interval.get_r357t())
-
-        # tension notes
-        if tension_type:
-            ts = tension_type_parser(tension_type)
-            intervals = [Interval().from_r357t(t) for t in ts]
-            tension.extend([root + interval for interval in intervals])
-            for note, interval in zip(tension, intervals):
-                note.set_message(br357t=interval.get_r357t())
+        bass, body, tension = [
+            [Note._new(named_nnrel, accidental, register, {'br357t': br357t}, t) for named_nnrel, accidental, register, br357t in part]
+            for part in vectors
+        ]
 
         return bass, body, tension
 
@@ -1230,6 +1979,7 @@ class Chord(object):
     def extract_parts_from_notes(notes):
         # make note in notes unique (regardless of registers)
         notes = unique(notes, key=lambda note: note.get_nnrel())
+        step_length = notes[0].get_tuning().STEP_LENGTH_CHD_LIN if notes else STEP_LENGTH_CHD_LIN
 
         bass = []
         body = []
@@ -1239,12 +1989,12 @@ class Chord(object):
             # sort intervals from root by 3rd degree
             # if multiple degree types are contained, regard the smaller one as tension
             itvs = [(note - root).normalize() for note in notes]
-            if sum([(itv.get_delta_lidx() + 1) % STEP_LENGTH_CHD_LIN for itv in itvs]) > n_base_chord_notes:
-                n_base_chord_notes = sum([(itv.get_delta_lidx() + 1) % STEP_LENGTH_CHD_LIN for itv in itvs])
+            if sum([(itv.get_delta_lidx() + 1) % step_length for itv in itvs]) > n_base_chord_notes:
+                n_base_chord_notes = sum([(itv.get_delta_lidx() + 1) % step_length for itv in itvs])
 
                 itvs.sort(key=lambda itv: (itv.get_delta_lidx(), -itv.get_delta_nnabs()))
 
-                body_itvs = [itv for itv in unique(itvs, key=lambda itv: itv.get_delta_lidx()) if itv.get_delta_lidx() % STEP_LENGTH_CHD_LIN == 0]
+                body_itvs = [itv for itv in unique(itvs, key=lambda itv: itv.get_delta_lidx()) if itv.get_delta_lidx() % step_length == 0]
                 tension_itvs = [itv for itv in itvs if itv not in body_itvs]
 
                 bass = [notes[0], ]
@@ -1255,11 +2005,17 @@ class Chord(object):
 
         return bass, body, tension
 
-    def __init__(self, chord_name=DEFAULT_CHORD_NAME):
-        self._bass, self._body, self._tension = self.chord_name_to_notes(chord_name)
+    def __init__(self, chord_name=None, tuning=None):
+        # the tuning of a chord follows its notes (see `Chord.set_notes`)
+        self._tuning = get_tuning(tuning)
+
+        if chord_name is None:
+            chord_name = self._tuning.DEFAULT_CHORD_NAME
+
+        self._bass, self._body, self._tension = self.chord_name_to_notes(chord_name, self._tuning)
 
         # print options initialization
-        self._printoptions = dict(ns=DEFAULT_CHORD_NS, show_register=False)
+        self._printoptions = dict(ns=self._tuning.DEFAULT_CHORD_NS, show_register=False)
 
     def __str__(self):
         bass_names = [note.get_name(self._printoptions['show_register']) for note in self._bass]
@@ -1282,6 +2038,15 @@ class Chord(object):
         return len(self._bass) + len(self._body) + len(self._tension)
 
     def set_notes(self, bass=None, body=None, tension=None):
+        # adopt the tuning of given notes, e.g. `Chord().set_notes(body=notes_19_tet)` is a 19-TET chord
+        notes = [note for part in [bass, body, tension] if part is not None for note in part if isinstance(note, Note)]
+        if notes:
+            if any([note.get_tuning() is not notes[0].get_tuning() for note in notes]):
+                raise ValueError('Notes of a chord must have the same tuning!')
+            if notes[0].get_tuning() is not self._tuning:
+                self._tuning = notes[0].get_tuning()
+                self._printoptions['ns'] = self._tuning.DEFAULT_CHORD_NS
+
         if bass is not None:
             self._bass = [note.set_message(br357t='B') for note in bass if isinstance(note, Note)]
 
@@ -1299,6 +2064,9 @@ class Chord(object):
 
         return self
 
+    def get_tuning(self):
+        return self._tuning
+
     def get_notes(self, return_bass=True, tension_only=False):
         if tension_only:
             return self._tension
@@ -1325,13 +2093,16 @@ class Chord(object):
         return [note - self[0] for note in self.get_notes(return_bass=use_bass)]
 
     @ngs_checker(['12.7.5'])
-    def get_negative_chord(self, key_center=DEFAULT_KEY_CENTER):
-        phrygian_p5_tonic = Note(key_center) + Interval('P5')
+    def get_negative_chord(self, key_center=None):
+        t = self._tuning
+        key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
+        phrygian_p5_tonic = Note(key_center, t) + Interval('P5', t)
 
-        bass_itvs = [note - Note(key_center) for note in self._bass]
+        bass_itvs = [note - Note(key_center, t) for note in self._bass]
         bass_itvs_neg_rev = [-itv for itv in reversed(bass_itvs)]
 
-        main_itvs = [note - Note(key_center) for note in self._body + self._tension]
+        main_itvs = [note - Note(key_center, t) for note in self._body + self._tension]
         main_itvs_neg_rev = [-itv for itv in reversed(main_itvs)]
 
         body_bool = [(itv - main_itvs_neg_rev[0]).normalize().get_delta_lidx() in [0, 2, 4, 6] for itv in main_itvs_neg_rev]
@@ -1341,47 +2112,51 @@ class Chord(object):
         body = [phrygian_p5_tonic + itv for itv, b in zip(main_itvs_neg_rev, body_bool) if b]
         tension = [phrygian_p5_tonic + itv for itv, b in zip(main_itvs_neg_rev, tension_bool) if b]
 
-        return Chord().set_notes(bass=bass, body=body, tension=tension)
+        return Chord(tuning=t).set_notes(bass=bass, body=body, tension=tension)
 
     @ngs_checker(['12.7.5', '19.11.8'])
     def get_sorted_chord(self):
         notes = self._bass + self._body + self._tension
         bass_new, body_new, tension_new = self.extract_parts_from_notes(notes)
-        return Chord().set_notes(bass=bass_new, body=body_new, tension=tension_new)
+        return Chord(tuning=self._tuning).set_notes(bass=bass_new, body=body_new, tension=tension_new)
 
     @ngs_checker(['12.7.5'])
-    def get_major_converged_chord(self, key_center=DEFAULT_KEY_CENTER):
+    def get_major_converged_chord(self, key_center=None):
+        t = self._tuning
+        key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
         # movements for [bII, bVI, bIII, bVII, IV, I, V, II, VI, III, VII, #IV]
-        movements = [Interval('-m2'), Interval('-m2'), Interval('m2'), Interval('M2'), Interval('-m2'),
-                     Interval('P1'), Interval('P1'),
-                     Interval('M2'), Interval('-M2'), Interval('P1'), Interval('m2'), Interval('m2')]
+        movements = [Interval(name, t) for name in ['-m2', '-m2', 'm2', 'M2', '-m2', 'P1', 'P1', 'M2', '-M2', 'P1', 'm2', 'm2']]
+        key_gidx = Note(key_center, t).get_gidx()
         bass_new = [
-            (bass + movements[(bass.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (bass + movements[(bass.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
                 key_center) for bass in self._bass]
         body_new = [
-            (body + movements[(body.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (body + movements[(body.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
                 key_center) for body in self._body]
         tension_new = [(tension + movements[
-            (tension.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (tension.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
             key_center) for tension in self._tension]
-        return Chord().set_notes(bass=bass_new, body=body_new, tension=tension_new)
+        return Chord(tuning=t).set_notes(bass=bass_new, body=body_new, tension=tension_new)
 
     @ngs_checker(['12.7.5'])
-    def get_minor_converged_chord(self, key_center=DEFAULT_KEY_CENTER):
+    def get_minor_converged_chord(self, key_center=None):
+        t = self._tuning
+        key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
         # movements for [bII, bVI, bIII, bVII, IV, I, V, II, VI, III, VII, #IV]
-        movements = [Interval('-m2'), Interval('-m2'), Interval('P1'), Interval('M2'), Interval('-M2'),
-                     Interval('P1'), Interval('P1'),
-                     Interval('m2'), Interval('-M2'), Interval('-m2'), Interval('m2'), Interval('m2')]
+        movements = [Interval(name, t) for name in ['-m2', '-m2', 'P1', 'M2', '-M2', 'P1', 'P1', 'm2', '-M2', '-m2', 'm2', 'm2']]
+        key_gidx = Note(key_center, t).get_gidx()
         bass_new = [
-            (bass + movements[(bass.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (bass + movements[(bass.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
                 key_center) for bass in self._bass]
         body_new = [
-            (body + movements[(body.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (body + movements[(body.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
                 key_center) for body in self._body]
         tension_new = [(tension + movements[
-            (tension.get_gidx() - Note(key_center).get_gidx() + 5) % 12]).get_enharmonic_note_by_key_center(
+            (tension.get_gidx() - key_gidx + 5) % 12]).get_enharmonic_note_by_key_center(
             key_center) for tension in self._tension]
-        return Chord().set_notes(bass=bass_new, body=body_new, tension=tension_new)
+        return Chord(tuning=t).set_notes(bass=bass_new, body=body_new, tension=tension_new)
 
     def get_name(self, type_only=False):
         if all([not self._bass, not self._body, not self._tension]):
@@ -1390,7 +2165,7 @@ class Chord(object):
         body_type, tension_type, bass_type = self.notes_to_chord_type(self._bass, self._body, self._tension)
 
         if self._printoptions['ns'] == 1:
-            body_type = chord_type_convertor(body_type, 0, 1)
+            body_type = self._tuning.chord_type_convertor(body_type, 0, 1)
 
         chord_type = body_type + tension_type + bass_type
 
@@ -1403,7 +2178,8 @@ class Chord(object):
                 whitespace = ' '
             return f"{self._body[0].get_name(show_register=self._printoptions['show_register'])}{whitespace}{chord_type}"
 
-    def get_scale(self, use_bass=True, max_order=2, ns=DEFAULT_ALTERED_DIATONIC_SCALE_NS):
+    @analysis_cached(lambda self: [[note.get_vector() for note in notes] for notes in [self._bass, self._body, self._tension]])
+    def get_scale(self, use_bass=True, max_order=2, ns=None):
         """
         get all possible background scale of current chord, e.g.
 
@@ -1425,6 +2201,20 @@ class Chord(object):
 
         use `AlteredDiatonicScale` to get information about these scales
         """
+        return list(self.iter_scales(use_bass, max_order, ns))
+
+    def iter_scales(self, use_bass=True, max_order=2, ns=None):
+        """
+        generator version of `Chord.get_scale`, scale names are yielded once found, e.g. first 3 background scales of EM9:
+
+        list(islice(Chord('EM9').iter_scales(), 3))
+
+        unused degrees are filled in one by one as integers, and a branch is cut as soon as its notes are not strictly
+        increasing, or a lower bound of its order (distances of filled degrees only) is greater than `max_order`
+        """
+        t = self._tuning
+        ns = t.DEFAULT_ALTERED_DIATONIC_SCALE_NS if ns is None else ns
+
         if use_bass:
             notes = self.get_notes(return_bass=True)
         else:
@@ -1441,67 +2231,83 @@ class Chord(object):
             if note < notes_normed[0]:
                 note.add_register(1)
 
-        # get unused notes, e.g. [E0, F#0, G#0, (A0), B0, (C1), D#1] -> [A0, C1], and indices of their left note, e.g. A0 -> 2, C1 -> 4
         notes_named_nnrels = [note.get_named_nnrel() for note in notes_normed]
-        notes_nnabs_closed = [int(note) for note in notes_normed] + [int(notes_normed[0]) + N]
+        notes_nnabs_closed = [int(note) for note in notes_normed] + [int(notes_normed[0]) + t.N]
 
-        ds_name = f'{notes_normed[0].get_name(show_register=True)} {NAMED_STR_LIN[0]}-mode'
-        all_notes = list(DiatonicScale(ds_name))
+        ds_name = f'{notes_normed[0].get_name(show_register=True)} {t.NAMED_STR_LIN[0]}-mode'
+        all_notes = list(DiatonicScale(ds_name, t))
 
-        unused_notes, indices, idx = [], [], -1
+        # chords like [C, Eb, E, G] (Eb and E are on the same degree) have no background scale
+        if len(unique(notes_named_nnrels)) < len(notes_named_nnrels):
+            return
+
+        # get nnabs range (relative to chord root) of every degree, unused notes are between their left and right notes,
+        # e.g. [E0, F#0, G#0, (A0), B0, (C1), D#1] -> A0: (5, 7); C1: (8, 11)
+        root_nnabs = int(notes_normed[0])
+        chord_nnabs = dict([(note.get_named_nnrel(), int(note) - root_nnabs) for note in notes_normed])
+        nnabs_ranges, idx = [], -1
         for note in all_notes:
-            if note.get_named_nnrel() in notes_named_nnrels:
+            if note.get_named_nnrel() in chord_nnabs:
                 idx += 1
+                cur_nnabs = chord_nnabs[note.get_named_nnrel()]
+                nnabs_ranges.append(range(cur_nnabs, cur_nnabs + 1))
             else:
-                unused_notes.append(note)
-                indices.append(idx)
+                nnabs_ranges.append(range(notes_nnabs_closed[idx] - root_nnabs + 1, notes_nnabs_closed[idx + 1] - root_nnabs))
+
+        # distances of every degree to the diatonic scale under all transpositions and rotations, for all possible nnabs
+        # (sum of them over all degrees is a lower bound of scale order, see `AlteredDiatonicScale.distance_0`)
+        N, M = t.N, t.M
+        ds_nnabs = np.array(DiatonicScale(tuning=t).get_nnabs_list())
+        shifts = np.arange(N)[:, None]  # [N, 1]
+        degree_distances = []
+        for degree, nnabs_range in enumerate(nnabs_ranges):
+            rotated_ds_nnabs = ds_nnabs[(degree + np.arange(M)) % M][None, :]  # [1, M]
+            delta = (np.array(list(nnabs_range))[:, None, None] - rotated_ds_nnabs + shifts) % N  # [R, N, M]
+            degree_distances.append(np.minimum(delta, N - delta))
+
+        base_nnabs = [int(note) - root_nnabs for note in all_notes]
+        index = get_scale_name_index(t)
+        scale_names = set()
+
+        def _fill(degree, nnabs_list, distances):
+            # fill in degrees one by one, a branch is cut if it is not strictly increasing, or its order bound is too high
+            if degree == M:
+                if index.get(tuple([nnabs % N for nnabs in nnabs_list]))[0] > max_order:
+                    return
+                cur_ads = AlteredDiatonicScale(ds_name, t).set_printoptions(ns=ns)
+                for k, (nnabs, base) in enumerate(zip(nnabs_list, base_nnabs)):
+                    cur_ads[k].add_accidental(nnabs - base)
+                for scale_name in cur_ads.get_name():
+                    if scale_name not in scale_names:
+                        scale_names.add(scale_name)
+                        yield scale_name
+                return
+
+            for i, nnabs in enumerate(nnabs_ranges[degree]):
+                # filter out scales like [C, D, E, F, G, Ab, Bbbb] (Ab == Bbbb)
+                if nnabs_list and nnabs <= nnabs_list[-1]:
+                    continue
+                cur_distances = distances + degree_distances[degree][i]
+                if cur_distances.min() > max_order:
+                    continue
+                yield from _fill(degree + 1, nnabs_list + [nnabs], cur_distances)
 
-        # get accidental range of unused notes, e.g. A0: (0, 2); C1: (0, 3)
-        accidental_ranges = []  # corresponds to `unused_names`
-        for cur_note, idx in zip(unused_notes, indices):
-            cur_nnabs = int(cur_note)
-            accidental_ranges.append(range(notes_nnabs_closed[idx] - cur_nnabs + 1, notes_nnabs_closed[idx + 1] - cur_nnabs))
+        yield from _fill(0, [], np.zeros((N, M), dtype=int))
 
-        # add accidentals to unused notes, put them into chord and get scale
-        scale_names = []
-        for accidentals in product(*accidental_ranges):
-            cur_scale = notes_normed + [copy(note).add_accidental(accidental) for note, accidental in zip(unused_notes, accidentals)]
-            cur_scale = circular_sorted(cur_scale, 0, key=lambda x: x.get_named_nnrel())
 
-            cur_r357ts = [(note - cur_scale[0]).get_r357t() for note in cur_scale]
-            altered_r357ts = [r357t for r357t in cur_r357ts]
-            altered_notes = '(' + ', '.join(altered_r357ts) + ')'
+class SlashChord(object):
+    def __init__(self, nu, de):
+        """
+        a slash chord class
 
-            cur_scale_name = f'{str(notes_normed[0])} {NAMED_STR_LIN[0]}-mode{altered_notes}'
-
-            cur_ads = AlteredDiatonicScale(cur_scale_name).set_printoptions(ns=ns)
-
-            # filter out scales like [C, D, E, F, G, Ab, Bbbb] (Ab == Bbbb)
-            if True in [itv <= 0 for itv in cur_ads.get_intervals_seq()]:
-                continue
-
-            # filter out order > `max_order` scales
-            if cur_ads.get_order() > max_order:
-                continue
-
-            scale_names.extend(cur_ads.get_name())
-
-        return unique(scale_names)
-
-
-class SlashChord(object):
-    def __init__(self, nu, de):
-        """
-        a slash chord class
-
-        :param nu: numerator chord
-        :param de: denominator chord
-        """
-        self._nu = nu
-        self._de = de
+        :param nu: numerator chord
+        :param de: denominator chord
+        """
+        self._nu = nu
+        self._de = de
 
         # print options initialization
-        self._printoptions = dict(ns=DEFAULT_CHORD_NS, show_register=False)
+        self._printoptions = dict(ns=nu.get_tuning().DEFAULT_CHORD_NS, show_register=False)
 
     def __str__(self):
         return f'{self._nu.get_name()}/{self._de.get_name()}'
@@ -1542,7 +2348,7 @@ class SlashChord(object):
     def get_intervals_cum(self):
         return [note - self[0] for note in self]
 
-    def get_negative_chord(self, key_center=DEFAULT_KEY_CENTER):
+    def get_negative_chord(self, key_center=None):
         return SlashChord(self._nu.get_negative_chord(key_center=key_center), self._de.get_negative_chord(
             key_center=key_center))
 
@@ -1577,28 +2383,25 @@ class ChordProgression(object):
     def get_next(self):
         return self._next.get_notes(return_bass=True, tension_only=False)
 
-    def get_bg_scale(self, max_order=2, ns=DEFAULT_ALTERED_DIATONIC_SCALE_NS):
-        notes = [*self._prev, *self._next]
+    def get_bg_scale(self, max_order=2, ns=None):
+        # notes of both chords with distinct nnrels and distinct named notes (enharmonic notes are tried on conflicts)
         notes_used = []
-        notes_drop = []
+        used_nnrels = set()
+        used_named_nnrels = set()
 
-        for note in notes:
-            used_nnrels = [n.get_nnrel() for n in notes_used]
-            used_named_nnrels = [n.get_named_nnrel() for n in notes_used]
+        for note in [*self._prev, *self._next]:
             if note.get_nnrel() in used_nnrels:
-                notes_drop.append(note)
                 continue
             elif note.get_named_nnrel() in used_named_nnrels:
-                if note.get_enharmonic_note().get_named_nnrel() in used_named_nnrels:
-                    notes_drop.append(note)
+                note = note.get_enharmonic_note()
+                if note.get_named_nnrel() in used_named_nnrels:
                     continue
-                else:
-                    notes_used.append(note.get_enharmonic_note())
-            else:
-                notes_used.append(note)
-        ch = Chord().set_notes(body=notes_used)
 
-        print(f'used: {notes_used}\ndrop: {notes_drop}')
+            notes_used.append(note)
+            used_nnrels.add(notes_used[-1].get_nnrel())
+            used_named_nnrels.add(notes_used[-1].get_named_nnrel())
+
+        ch = Chord(tuning=self._prev.get_tuning()).set_notes(body=notes_used)
 
         return ch.get_scale(max_order=max_order, ns=ns)
 
@@ -1610,110 +2413,1339 @@ class ChordProgression(object):
 
 
 ''' ----------------------------------------------------------------------------------------- '''
-''' ************************************** jazz harmony ************************************* '''
+''' *********************** vectorized music theory classes (numpy based) ******************* '''
 ''' ----------------------------------------------------------------------------------------- '''
 
 
-class ChordScale(AlteredDiatonicScale):
-    @ngs_checker(['12.7.5'])
-    def __init__(self, scale_name):
-        super().__init__(scale_name)
+@lru_cache(maxsize=None)
+def _get_lookup_arrays(tuning):
+    # lookup tables for vectorized calculations, e.g. (in '12.7.5') named_nnrel_lin[1] = 2, nnrel_to_lidx[2] = 1
+    named_nnrel_lin = np.array(tuning.NAMED_NNREL_LIN)
+    nnrel_to_lidx = np.array([tuning.NNREL_TO_LIDX.get(nnrel, -1) for nnrel in range(tuning.N)])
+    return named_nnrel_lin, nnrel_to_lidx
 
-        self._chord_notes = [0, 2, 4, 6]
-        self._tension_notes = [k for k in range(7) if k not in self._chord_notes]
 
-        self._refresh()
+def _unique_vectors(arrays):
+    """
+    distinct integer vectors of same-shaped `arrays`, packed into one integer per vector (much faster than `np.unique(axis=0)`)
+
+    :return: list of distinct vectors (tuples), and flat indices of every element into this list
+    """
+    arrays = [np.ravel(a) for a in arrays]
+    if not arrays[0].size:
+        return [], np.zeros((0, ), dtype=int)
+
+    mins = [int(a.min()) for a in arrays]
+    sizes = [int(a.max()) - m + 1 for a, m in zip(arrays, mins)]
+
+    packed = np.zeros_like(arrays[0])
+    for a, m, size in zip(arrays, mins, sizes):
+        packed = packed * size + (a - m)
+    unique_packed, inverse = np.unique(packed, return_inverse=True)
+
+    vectors = []
+    for size, m in zip(reversed(sizes), reversed(mins)):
+        vectors.append(unique_packed % size + m)
+        unique_packed = unique_packed // size
+
+    return list(zip(*[v.tolist() for v in reversed(vectors)])), inverse.ravel()
+
+
+class NoteArray(object):
+    def __init__(self, notes=(), tuning=None):
+        """
+        columnar (structure of arrays) version of `Note`, all methods work on whole arrays at once
+        `notes` is a list of `Note` instances or note names, use `set_vector` for arrays of any shape
+        """
+        notes = list(notes)
+        if tuning is None and notes and isinstance(notes[0], Note):
+            tuning = notes[0].get_tuning()
+        self._tuning = get_tuning(tuning)
+
+        if any([isinstance(note, Note) and note.get_tuning() is not self._tuning for note in notes]):
+            raise ValueError('Notes of a `NoteArray` must have the same tuning!')
+
+        vectors = [note.get_vector() if isinstance(note, Note) else Note.note_name_to_note_vector(note, self._tuning) for note in notes]
+        vectors = np.array(vectors, dtype=int).reshape(-1, 3)
+
+        self._named_nnrel = vectors[:, 0]
+        self._accidental = vectors[:, 1]
+        self._register = vectors[:, 2]
+
+    @classmethod
+    def _new(cls, named_nnrel, accidental, register, tuning=DEFAULT_TUNING):
+        # create a note array from (valid) integer arrays directly
+        note_array = object.__new__(cls)
+        note_array._named_nnrel, note_array._accidental, note_array._register = np.broadcast_arrays(named_nnrel, accidental, register)
+        note_array._tuning = tuning
+        return note_array
+
+    def __str__(self):
+        return str(self.get_name())
 
     def __repr__(self):
-        return '\n'.join([f"ChordScale('{scale_name}')" for scale_name in self.get_name()])
+        return f'NoteArray({self.get_name().tolist()})'
 
-    def _get_info(self):
-        # [D, E, F, G, A, B, C]
-        itvs = [n - self[0] for n in self]  # [P1, M2, m3, P4, P5, M6, m7]
-        itvs_abs = [int(i) for i in itvs]  # [0, 2, 3, 5, 7, 9, 10]
-        itvs_rel = [i % 12 for i in itvs_abs]  # [0, 2, 3, 5, 7, 9, 10] (?)
-        r357ts = [i.get_r357t() for i in itvs]
-        labels = [''] * len(r357ts)
-        fake_dom7 = False
-        fake_m7 = False
-
-        # add "[CN]" to every base chord note
-        for i in self._chord_notes:
-            labels[i] = '[CN]'
-
-        # add "[TN]" to every tension note
-        for i in self._tension_notes:
-            labels[i] = '[TN]'
-
-        # if it contains dom7 chord (include enharmonic equivalents)
-        if all([na in itvs_rel for na in [4, 10]]):
-            # if it contains real dom7 chord
-            if '3' in r357ts and 'b7' in r357ts:
-                # half tone above base chord note, but available because of dom7 base chord
-                for idx in range(1, len(itvs_abs)):
-                    if any([itvs_abs[idx] - itvs_abs[j] == 1 for j in self._chord_notes]):
-                        labels[idx] = '[OK]'
-                # avoid_type_0: tonic note in dom7 chord
-                if 5 in itvs_rel:
-                    idx = itvs_rel.index(5)
-                    labels[idx] = '[A0]'
-
-            # if it contains fake dom7 chord
+    def __len__(self):
+        return len(self._named_nnrel)
+
+    def __getitem__(self, item):
+        named_nnrel, accidental, register = self._named_nnrel[item], self._accidental[item], self._register[item]
+        if np.ndim(named_nnrel) == 0:
+            return Note._new(int(named_nnrel), int(accidental), int(register), tuning=self._tuning)
+        else:
+            return NoteArray._new(named_nnrel, accidental, register, self._tuning)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __sub__(self, other):
+        # `NoteArray` - `NoteArray` (or `Note`) = `IntervalArray`
+        if isinstance(other, (NoteArray, Note)):
+            if other.get_tuning() is not self._tuning:
+                raise ValueError('Notes of different tunings cannot be subtracted!')
+            other = NoteArray._new(*other.get_vector(), self._tuning) if isinstance(other, Note) else other
+            delta_nnabs = self.get_nnabs() - other.get_nnabs()
+            delta_lidx = self.get_lidx() - other.get_lidx()
+            return IntervalArray._new(delta_nnabs, delta_lidx, self._tuning)
+        # `NoteArray` - `IntervalArray` (or `Interval`) = `NoteArray`
+        elif isinstance(other, (IntervalArray, Interval)):
+            return self + (-other)
+        else:
+            raise TypeError('`NoteArray` can only subtract a `NoteArray`, `Note`, `IntervalArray` or `Interval`!')
+
+    def __add__(self, other):
+        # `NoteArray` + `IntervalArray` (or `Interval`) = `NoteArray`, shapes are broadcast
+        if isinstance(other, (IntervalArray, Interval)):
+            t = self._tuning
+            if other.get_tuning() is not t:
+                raise ValueError('`NoteArray` can only add intervals of the same tuning!')
+            named_nnrel_lin, nnrel_to_lidx = _get_lookup_arrays(t)
+            delta_nnabs, delta_lidx = other.get_vector()
+            new_lidx = nnrel_to_lidx[self._named_nnrel] + delta_lidx
+            new_named_nnrel = named_nnrel_lin[new_lidx % t.M]
+            new_register = self._register + new_lidx // t.M
+            new_accidental = self.get_nnabs() + delta_nnabs - new_named_nnrel - t.N * new_register
+            return NoteArray._new(new_named_nnrel, new_accidental, new_register, t)
+        else:
+            raise TypeError('`NoteArray` can only add an `IntervalArray` or an `Interval`!')
+
+    def __eq__(self, other):
+        if isinstance(other, (NoteArray, Note)):
+            named_nnrel, accidental, register = other.get_vector()
+            same_tuning = other.get_tuning() is self._tuning
+            return (self._named_nnrel == named_nnrel) & (self._accidental == accidental) & (self._register == register) & same_tuning
+        else:
+            return self.get_nnabs() == other
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    def set_vector(self, named_nnrel=None, accidental=None, register=None):
+        # set note vectors manually, arguments are integer arrays (of any broadcastable shapes)
+        if named_nnrel is not None:
+            named_nnrel = np.asarray(named_nnrel, dtype=int)
+            n, nnrel_to_lidx = self._tuning.N, _get_lookup_arrays(self._tuning)[1]
+            if np.any(nnrel_to_lidx[named_nnrel % n] < 0) or np.any((named_nnrel < 0) | (named_nnrel >= n)):
+                raise ValueError('Given `named_nnrel` does not correspond to a named note. Please choose another one!')
+            self._named_nnrel = named_nnrel
+        if accidental is not None:
+            self._accidental = np.asarray(accidental, dtype=int)
+        if register is not None:
+            self._register = np.asarray(register, dtype=int)
+
+        self._named_nnrel, self._accidental, self._register = np.broadcast_arrays(self._named_nnrel, self._accidental, self._register)
+
+        return self
+
+    def get_tuning(self):
+        return self._tuning
+
+    def get_vector(self):
+        return self._named_nnrel, self._accidental, self._register
+
+    def get_shape(self):
+        return self._named_nnrel.shape
+
+    def get_notes(self):
+        return [Note._new(*vector, tuning=self._tuning) for vector in zip(*[a.ravel().tolist() for a in self.get_vector()])]
+
+    def get_nnabs(self):
+        return self._named_nnrel + self._accidental + self._register * self._tuning.N
+
+    def get_named_nnrel(self):
+        return self._named_nnrel
+
+    def get_nnrel(self):
+        return self._named_nnrel + self._accidental
+
+    def get_accidental(self):
+        return self._accidental
+
+    def get_register(self):
+        return self._register
+
+    def get_lidx(self):
+        # absolute index of named notes in linear order, e.g. (in '12.7.5') 'D1' -> 1 + 7 = 8
+        return _get_lookup_arrays(self._tuning)[1][self._named_nnrel] + self._register * self._tuning.M
+
+    def get_gidx(self):
+        t = self._tuning
+        return ((self._named_nnrel - t.S) * t.M) % t.N + self._accidental * t.M + t.GIDX_OFFSET
+
+    def get_frequency(self):
+        t = self._tuning
+        return t.C3 * (t.T ** (self.get_nnabs() - t.N * 3))
+
+    def get_name(self, show_register=True, use_latex=False):
+        # only distinct note vectors are formatted, then names are scattered back to the original shape
+        keys, inverse = _unique_vectors(self.get_vector())
+        names = np.array([Note._new(*vector, tuning=self._tuning).get_name(show_register, use_latex) for vector in keys], dtype=object)
+        return names[inverse].reshape(self.get_shape())
+
+    def from_nnabs(self, nnabs, key_center=None):
+        t = self._tuning
+        nnabs = np.asarray(nnabs, dtype=int)
+
+        named_nnrel = np.full_like(nnabs, t.NAMED_NNREL_LIN[0])
+        accidental = nnabs % t.N - named_nnrel
+        register = nnabs // t.N
+
+        note_array = NoteArray._new(named_nnrel, accidental, register, t).get_enharmonic_note_by_key_center(key_center)
+        self._named_nnrel, self._accidental, self._register = note_array.get_vector()
+
+        return self
+
+    def add_gidx(self, n=0):
+        t = self._tuning
+        gidx = self.get_gidx() + n
+        accidental = (gidx - t.GIDX_OFFSET) // t.M
+        named_nnrel = (t.G * (gidx - t.GIDX_OFFSET - accidental * t.M) + t.S) % t.N
+        self._named_nnrel, self._accidental, self._register = np.broadcast_arrays(named_nnrel, accidental, self._register)
+        return self
+
+    def add_accidental(self, n=0):
+        self._named_nnrel, self._accidental, self._register = np.broadcast_arrays(self._named_nnrel, self._accidental + n, self._register)
+        return self
+
+    def add_register(self, n=0):
+        self._named_nnrel, self._accidental, self._register = np.broadcast_arrays(self._named_nnrel, self._accidental, self._register + n)
+        return self
+
+    def get_enharmonic_note_by_key_center(self, key_center=None):
+        t = self._tuning
+        key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
+        gidx_left = Note(key_center, t).get_gidx() - (t.N - 1) // 2
+        gidx_self = self.get_gidx()
+        span = (gidx_self - gidx_left) // t.N * t.N
+
+        note_out = NoteArray._new(*self.get_vector(), t).add_gidx(-span)
+
+        # when key_center = C: B#0 -> C1 (not C0)
+        # when key_center = B#: C1 -> B#0 (not B#1)
+        register_change = np.where(span == 0, 0, self.get_nnrel() // t.N - note_out.get_nnrel() // t.N)
+
+        return note_out.add_register(register_change)
+
+
+class IntervalArray(object):
+    def __init__(self, intervals=(), tuning=None):
+        """
+        columnar (structure of arrays) version of `Interval`, all methods work on whole arrays at once
+        `intervals` is a list of `Interval` instances or interval names, use `set_vector` for arrays of any shape
+        """
+        intervals = list(intervals)
+        if tuning is None and intervals and isinstance(intervals[0], Interval):
+            tuning = intervals[0].get_tuning()
+        self._tuning = get_tuning(tuning)
+
+        if any([isinstance(interval, Interval) and interval.get_tuning() is not self._tuning for interval in intervals]):
+            raise ValueError('Intervals of an `IntervalArray` must have the same tuning!')
+
+        vectors = [interval.get_vector() if isinstance(interval, Interval) else Interval.interval_name_to_interval_vector(interval, tuning=self._tuning) for interval in intervals]
+        vectors = np.array(vectors, dtype=int).reshape(-1, 2)
+
+        self._delta_nnabs = vectors[:, 0]
+        self._delta_lidx = vectors[:, 1]
+
+    @classmethod
+    def _new(cls, delta_nnabs, delta_lidx, tuning=DEFAULT_TUNING):
+        # create an interval array from integer arrays directly
+        interval_array = object.__new__(cls)
+        interval_array._delta_nnabs, interval_array._delta_lidx = np.broadcast_arrays(delta_nnabs, delta_lidx)
+        interval_array._tuning = tuning
+        return interval_array
+
+    def __str__(self):
+        return str(self.get_name())
+
+    def __repr__(self):
+        return f'IntervalArray({self.get_name().tolist()})'
+
+    def __len__(self):
+        return len(self._delta_nnabs)
+
+    def __getitem__(self, item):
+        delta_nnabs, delta_lidx = self._delta_nnabs[item], self._delta_lidx[item]
+        if np.ndim(delta_nnabs) == 0:
+            return Interval._new(int(delta_nnabs), int(delta_lidx), self._tuning)
+        else:
+            return IntervalArray._new(delta_nnabs, delta_lidx, self._tuning)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __add__(self, other):
+        # `IntervalArray` + `NoteArray` (or `Note`) = `NoteArray`
+        if isinstance(other, (NoteArray, Note)):
+            other = NoteArray._new(*other.get_vector(), other.get_tuning()) if isinstance(other, Note) else other
+            return other + self
+        # `IntervalArray` + `IntervalArray` (or `Interval`) = `IntervalArray`
+        elif isinstance(other, (IntervalArray, Interval)):
+            if other.get_tuning() is not self._tuning:
+                raise ValueError('Intervals of different tunings cannot be added!')
+            delta_nnabs, delta_lidx = other.get_vector()
+            return IntervalArray._new(self._delta_nnabs + delta_nnabs, self._delta_lidx + delta_lidx, self._tuning)
+        else:
+            raise TypeError('`IntervalArray` can only add a `NoteArray`, `Note`, `IntervalArray` or `Interval`!')
+
+    def __sub__(self, other):
+        if isinstance(other, (IntervalArray, Interval)):
+            if other.get_tuning() is not self._tuning:
+                raise ValueError('Intervals of different tunings cannot be subtracted!')
+            delta_nnabs, delta_lidx = other.get_vector()
+            return IntervalArray._new(self._delta_nnabs - delta_nnabs, self._delta_lidx - delta_lidx, self._tuning)
+        else:
+            raise TypeError('`IntervalArray` can only subtract an `IntervalArray` or an `Interval`!')
+
+    def __mul__(self, other):
+        return IntervalArray._new(self._delta_nnabs * other, self._delta_lidx * other, self._tuning)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __neg__(self):
+        return IntervalArray._new(-self._delta_nnabs, -self._delta_lidx, self._tuning)
+
+    def __abs__(self):
+        sgn = np.sign(self._delta_lidx)
+        return IntervalArray._new(sgn * self._delta_nnabs, sgn * self._delta_lidx, self._tuning)
+
+    def __eq__(self, other):
+        if isinstance(other, (IntervalArray, Interval)):
+            delta_nnabs, delta_lidx = other.get_vector()
+            same_tuning = other.get_tuning() is self._tuning
+            return (self._delta_nnabs == delta_nnabs) & (self._delta_lidx == delta_lidx) & same_tuning
+        else:
+            return self._delta_nnabs == other
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    def set_vector(self, delta_nnabs=None, delta_lidx=None):
+        # set interval vectors manually, arguments are integer arrays (of any broadcastable shapes)
+        if delta_nnabs is not None:
+            self._delta_nnabs = np.asarray(delta_nnabs, dtype=int)
+        if delta_lidx is not None:
+            self._delta_lidx = np.asarray(delta_lidx, dtype=int)
+
+        self._delta_nnabs, self._delta_lidx = np.broadcast_arrays(self._delta_nnabs, self._delta_lidx)
+
+        return self
+
+    def get_tuning(self):
+        return self._tuning
+
+    def get_vector(self):
+        return self._delta_nnabs, self._delta_lidx
+
+    def get_shape(self):
+        return self._delta_nnabs.shape
+
+    def get_intervals(self):
+        return [Interval._new(*vector, self._tuning) for vector in zip(self._delta_nnabs.ravel().tolist(), self._delta_lidx.ravel().tolist())]
+
+    def get_delta_nnabs(self):
+        return self._delta_nnabs
+
+    def get_delta_lidx(self):
+        return self._delta_lidx
+
+    def _format(self, formatter):
+        # only distinct interval vectors are formatted, then names are scattered back to the original shape
+        keys, inverse = _unique_vectors(self.get_vector())
+        names = np.array([formatter(Interval._new(*vector, self._tuning)) for vector in keys], dtype=object)
+        return names[inverse].reshape(self.get_shape())
+
+    def get_name(self):
+        return self._format(lambda interval: interval.get_name())
+
+    def get_r357t(self, use_latex=False):
+        return self._format(lambda interval: interval.get_r357t(use_latex))
+
+    def normalize(self):
+        t = self._tuning
+        delta_register = self._delta_lidx // t.M
+        self._delta_lidx = self._delta_lidx % t.M
+        self._delta_nnabs = self._delta_nnabs - t.N * delta_register
+        return self
+
+
+def _stack_scales(scales, others=None):
+    # [K_1, M] and [K_2, M] nnabs arrays of 2 groups of scales (`others` defaults to `scales`), and their tuning
+    scales = list(scales)
+    others = scales if others is None else list(others)
+
+    for scale in scales + others:
+        if not isinstance(scale, DiatonicScale):
+            raise TypeError('scales must be of type `DiatonicScale`!')
+    tunings = set([scale._tuning for scale in scales + others])
+    if len(tunings) > 1:
+        raise ValueError('Scales of different tunings cannot be compared!')
+    t = tunings.pop() if tunings else DEFAULT_TUNING
+
+    a = np.array([scale.get_nnabs_list() for scale in scales], dtype=int).reshape((-1, t.M))
+    b = np.array([scale.get_nnabs_list() for scale in others], dtype=int).reshape((-1, t.M))
+
+    return a, b, t
+
+
+def distance_matrix_0(scales, others=None, return_offsets=False, max_block_bytes=2 ** 26):
+    """
+    structural distances (see `AlteredDiatonicScale.distance_0`) of every scale in `scales` to every scale in `others`
+
+    :param scales: K_1 scales (instances of `DiatonicScale` class or its subclass)
+    :param others: K_2 scales, default: `scales` itself
+    :param return_offsets: return the first (in row-major order) least-distance rotations of every 2 scales
+    :param max_block_bytes: memory budget of a block, every pair of scales takes `N ** 2 * M` integers, so blocks of
+                            higher temperaments hold fewer scales (distances are computed in place, one block at a time)
+
+    :return: [K_1, K_2] distance matrix (and [K_1, K_2, 2] offsets)
+    """
+    a, b, t = _stack_scales(scales, others)
+    N, M = t.N, t.M
+    x = np.arange(N)
+    chunk_size = max(1, int(np.sqrt(max_block_bytes / (N * N * M * np.dtype(int).itemsize))))
+
+    # all sorted rotations of every scale
+    ax = np.sort((a[:, None, :] + x[None, :, None]) % N, axis=-1)  # [K_1, N, M]
+    bx = np.sort((b[:, None, :] + x[None, :, None]) % N, axis=-1)  # [K_2, N, M]
+
+    distances = np.zeros((len(a), len(b)), dtype=int)
+    offsets = np.zeros((len(a), len(b), 2), dtype=int)
+
+    for i in range(0, len(a), chunk_size):
+        for j in range(0, len(b), chunk_size):
+            delta = ax[i:i+chunk_size, None, :, None, :] - bx[None, j:j+chunk_size, None, :, :]  # [c_1, c_2, N, N, M]
+            # (N - |2 * |delta| - N|) // 2, without temporaries of the block size
+            np.abs(delta, out=delta)
+            delta *= 2
+            delta -= N
+            np.abs(delta, out=delta)
+            np.subtract(N, delta, out=delta)
+            delta //= 2
+            ds = delta.sum(axis=-1)
+            ds = ds.reshape(ds.shape[:2] + (N * N, ))  # [c_1, c_2, N * N]
+
+            idx = np.argmin(ds, axis=-1)
+            distances[i:i+chunk_size, j:j+chunk_size] = np.take_along_axis(ds, idx[..., None], axis=-1)[..., 0]
+            offsets[i:i+chunk_size, j:j+chunk_size] = np.stack(np.divmod(idx, N), axis=-1)
+
+    if return_offsets:
+        return distances, offsets
+    else:
+        return distances
+
+
+def distance_matrix_1(scales, others=None, return_self_left_offsets=False, chunk_size=256):
+    """
+    enharmonic distances (see `AlteredDiatonicScale.distance_1`) of every scale in `scales` to every scale in `others`
+
+    :param scales: K_1 scales (instances of `DiatonicScale` class or its subclass)
+    :param others: K_2 scales, default: `scales` itself
+    :param return_self_left_offsets: return the first least-distance left offsets of scales in `scales`
+    :param chunk_size: scales per block on both axes, every block takes about `chunk_size ** 2 * M ** 2` integers
+
+    :return: [K_1, K_2] distance matrix (and [K_1, K_2] left offsets)
+    """
+    a, b, t = _stack_scales(scales, others)
+    N, M = t.N, t.M
+
+    # all left rotations of every scale in `scales`
+    a = a[:, (np.arange(M)[:, None] + np.arange(M)[None, :]) % M] % N  # [K_1, M, M]
+    b = b % N  # [K_2, M]
+
+    distances = np.zeros((len(a), len(b)), dtype=int)
+    left_offsets = np.zeros((len(a), len(b)), dtype=int)
+
+    for i in range(0, len(a), chunk_size):
+        for j in range(0, len(b), chunk_size):
+            delta = a[i:i+chunk_size, None, :, :] - b[None, j:j+chunk_size, None, :]  # [c_1, c_2, M, M]
+            ds = np.sum((N - np.abs(2 * np.abs(delta) - N)) // 2, axis=-1)  # [c_1, c_2, M]
+
+            idx = np.argmin(ds, axis=-1)
+            distances[i:i+chunk_size, j:j+chunk_size] = np.take_along_axis(ds, idx[..., None], axis=-1)[..., 0]
+            left_offsets[i:i+chunk_size, j:j+chunk_size] = idx
+
+    if return_self_left_offsets:
+        return distances, left_offsets
+    else:
+        return distances
+
+
+def check_metric(distances, chunk_size=64):
+    """
+    check symmetry and triangle inequalities of a [K, K] distance matrix
+
+    :return: [?, 2] index pairs (i, j) where d(i, j) != d(j, i), and
+             [?, 3] index triples (i, j, k) where d(i, j) + d(j, k) < d(i, k)
+    """
+    distances = np.asarray(distances)
+    K = len(distances)
+
+    asymmetric_pairs = np.argwhere(distances != distances.T)
+
+    violations = [np.zeros((0, 3), dtype=int)]
+    for i in range(0, K, chunk_size):
+        d_ij, d_ik = distances[i:i+chunk_size, :, None], distances[i:i+chunk_size, None, :]
+        violation = np.argwhere(d_ij + distances[None, :, :] < d_ik)  # [c, K, K]
+        violation[:, 0] += i
+        violations.append(violation)
+
+    return asymmetric_pairs, np.concatenate(violations)
+
+
+class ScaleBank(object):
+    def __init__(self, scale_types=None, tonics=None, modes=None, tuning=None):
+        """
+        all (tonic, scale type, mode) combinations of altered diatonic scales, stored as [K, M] integer arrays
+        scale `k` of the bank equals `AlteredDiatonicScale(f'{tonic} {scale_type}').set_scale_tonic_deg(mode, st_register)`,
+        where `st_register` is the register of `tonic`, and k = (tonic_idx * len(scale_types) + type_idx) * len(modes) + mode_idx
+
+        :param scale_types: scale types (with alterations), default: all heptatonic scale types of `tuning`, or the
+                            unaltered diatonic scale (whose modes are all diatonic modes) if they are not known
+        :param tonics: scale tonic names of parent scales, default: all named notes
+        :param modes: degrees of parent scales used as mode tonics, default: all degrees
+        """
+        t = get_tuning(tuning)
+        self._tuning = t
+        if scale_types is None:
+            scale_types = t.ALL_SCALE_TYPES if t.ALL_SCALE_TYPES else [f'{t.NAMED_STR_LIN[0]}-mode']
+        self._scale_types = list(scale_types)
+        self._tonics = list(t.NAMED_STR_LIN if tonics is None else tonics)
+        self._modes = [mode % t.M for mode in (range(t.M) if modes is None else modes)]
+        self._printoptions = dict(ns=t.DEFAULT_ALTERED_DIATONIC_SCALE_NS, show_register=False)
+
+        # parent scales on the first named note, one construction per scale type, [S, M]
+        base_tonic = Note(t.NAMED_STR_LIN[0], t)
+        parents = [AlteredDiatonicScale(f'{base_tonic.get_name(show_register=False)} {scale_type}', t) for scale_type in self._scale_types]
+        parents = NoteArray._new(
+            np.array([scale.get_named_nnrel_list() for scale in parents], dtype=int).reshape((-1, t.M)),
+            np.array([scale.get_accidental_list() for scale in parents], dtype=int).reshape((-1, t.M)),
+            np.array([scale.get_register_list() for scale in parents], dtype=int).reshape((-1, t.M)),
+            t
+        )
+
+        # transpose parent scales to every tonic, [T, S, M]
+        tonic_notes = NoteArray(self._tonics, t)
+        delta_nnabs, delta_lidx = (tonic_notes - base_tonic).get_vector()
+        parents = parents[None, :, :] + IntervalArray._new(delta_nnabs[:, None, None], delta_lidx[:, None, None], t)
+
+        # rotate to every mode, and refresh registers like `set_scale_tonic_deg`, [T, S, P, M]
+        rotation = (np.array(self._modes, dtype=int)[:, None] + np.arange(t.M)[None, :]) % t.M
+        named_nnrel = parents.get_named_nnrel()[:, :, rotation]
+        accidental = parents.get_accidental()[:, :, rotation]
+        nnrel = named_nnrel + accidental
+        register = tonic_notes.get_register()[:, None, None, None] + (nnrel < nnrel[..., :1])
+
+        self._named_nnrel = named_nnrel.reshape((-1, t.M))
+        self._accidental = accidental.reshape((-1, t.M))
+        self._register = register.reshape((-1, t.M))
+
+    def __str__(self):
+        return f'ScaleBank({len(self._tonics)} tonics x {len(self._scale_types)} scale types x {len(self._modes)} modes)'
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return len(self._named_nnrel)
+
+    def __getitem__(self, item):
+        # materialize scale `item` as an `AlteredDiatonicScale`
+        tonic_idx, type_idx, mode_idx = [int(idx) for idx in np.unravel_index(item % len(self), self.get_shape())]
+        tonic = self._tonics[tonic_idx]
+        scale = AlteredDiatonicScale(f'{tonic} {self._scale_types[type_idx]}', self._tuning)
+        return scale.set_scale_tonic_deg(self._modes[mode_idx], Note(tonic, self._tuning).get_register()).set_printoptions(**self._printoptions)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def set_printoptions(self, ns=None, show_register=None):
+        if ns is not None:
+            self._printoptions['ns'] = ns
+
+        if show_register is not None:
+            self._printoptions['show_register'] = show_register
+
+        return self
+
+    def get_tuning(self):
+        return self._tuning
+
+    def get_shape(self):
+        # (T, S, P), the bank is a flattened array of this shape
+        return len(self._tonics), len(self._scale_types), len(self._modes)
+
+    def get_tonics(self):
+        return self._tonics
+
+    def get_scale_types(self):
+        return self._scale_types
+
+    def get_modes(self):
+        return self._modes
+
+    def get_indices(self):
+        # tonic, scale type and mode indices of every scale, [K] each
+        return np.unravel_index(np.arange(len(self)), self.get_shape())
+
+    def get_notes(self):
+        return NoteArray._new(self._named_nnrel, self._accidental, self._register, self._tuning)
+
+    def get_nnabs(self):
+        return self.get_notes().get_nnabs()
+
+    def get_scale_class_keys(self):
+        # transposition-normalized nnrels in degree order (see `AlteredDiatonicScale.get_scale_class_key`), [K, M]
+        nnrel = self._named_nnrel + self._accidental
+        return (nnrel - nnrel[:, :1]) % self._tuning.N
+
+    def get_intervals_cum(self):
+        notes = self.get_notes()
+        return notes - notes[:, :1]
+
+    def get_chord(self, root_degree, n_notes, step_length=None):
+        """
+        chords (see `DiatonicScale.get_chord`) of all scales at once
+
+        :param root_degree: an integer, or an integer array of shape [K] (one root degree per scale)
+        :return: [K, `n_notes`] `NoteArray`
+        """
+        t = self._tuning
+        step_length = t.STEP_LENGTH_CHD_LIN if step_length is None else step_length
+
+        idx = np.asarray(root_degree, dtype=int)[..., None] % t.M + step_length * np.arange(n_notes)
+        rows = np.arange(len(self))[:, None]
+        return NoteArray._new(
+            self._named_nnrel[rows, idx % t.M],
+            self._accidental[rows, idx % t.M],
+            self._register[rows, idx % t.M] + idx // t.M,
+            t
+        )
+
+    def get_chord_name(self, root_degree, n_notes, step_length=None, type_only=False):
+        # only distinct chords are named, then names are scattered back to all scales, [K]
+        chords = self.get_chord(root_degree, n_notes, step_length)
+        vectors = np.concatenate(chords.get_vector(), axis=-1)
+        keys, inverse = np.unique(vectors, axis=0, return_inverse=True)
+
+        n = chords.get_shape()[-1]
+        names = np.empty(len(keys), dtype=object)
+        for i, key in enumerate(keys.tolist()):
+            notes = [Note._new(*vector, tuning=self._tuning) for vector in zip(key[:n], key[n:2*n], key[2*n:])]
+            names[i] = Chord(tuning=self._tuning).set_notes(body=notes).get_name(type_only)
+        return names[inverse.ravel()]
+
+    def get_order(self):
+        keys, inverse = np.unique(self.get_scale_class_keys(), axis=0, return_inverse=True)
+        index = get_scale_name_index(self._tuning)
+        orders = np.array([index.get(tuple(key))[0] for key in keys.tolist()], dtype=int)
+        return orders[inverse.ravel()]
+
+    def get_name(self, type_only=False):
+        """
+        names (see `AlteredDiatonicScale.get_name`) of all scales at once, scale types are looked up only once for
+        every distinct (scale class, tonic nnrel) pair
+
+        :return: [K] object array of name lists
+        """
+        t = self._tuning
+        ns = self._printoptions['ns'] if self._printoptions['ns'] in [1, 2] else 0
+
+        tonic_nnrel = self._named_nnrel[:, 0] + self._accidental[:, 0]
+        pairs = np.concatenate([self.get_scale_class_keys(), (tonic_nnrel % t.N)[:, None]], axis=-1)
+        keys, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        scale_types = [AlteredDiatonicScale._get_scale_types(tuple(key[:-1]), key[-1], t) for key in keys.tolist()]
+        tonic_names = self.get_notes()[:, 0].get_name(show_register=self._printoptions['show_register'])
+
+        names = np.empty(len(self), dtype=object)
+        for k in range(len(self)):
+            if type_only:
+                names[k] = unique([scale_type[ns] for scale_type in scale_types[inverse[k]]])
             else:
-                fake_dom7 = True
-                for idx in range(1, len(itvs_abs)):
-                    # avoid_type_1: half tone above base chord note
-                    if any([itvs_abs[idx] - itvs_abs[j] == 1 for j in self._chord_notes]):
-                        labels[idx] = '[A1]'
-                    # avoid_type_1: half tone below M7
-                    if '7' in r357ts:
-                        idx_maj7 = r357ts.index('7')
-                        if itvs_abs[idx_maj7] - itvs_abs[idx] == 1:
-                            labels[idx] = '[A1]'
-
-        # if it contains m7 / m7-5 chord (include enharmonic equivalents)
-        if all([na in itvs_rel for na in [3, 10]]):
-            # if it contains real m7 / m7-5 chord
-            if 'b3' in r357ts and 'b7' in r357ts:
-                # avoid_type_1: half tone above base chord note
-                for idx in range(1, len(itvs_abs)):
-                    if any([itvs_abs[idx] - itvs_abs[j] == 1 for j in self._chord_notes]):
-                        labels[idx] = '[A1]'
-                # avoid_type_2: dorian / locrian 13th
-                if 9 in itvs_rel:
-                    idx = itvs_rel.index(9)
-                    labels[idx] = '[A2]'
-
-            # if it contains fake m7 / m7-5 chord
+                names[k] = unique([tonic_names[k] + ' ' + scale_type[ns] for scale_type in scale_types[inverse[k]]])
+        return names
+
+
+CHORD_PROGRESSION_CATALOGUE_COLUMNS = ['root_movement', 'type_prev', 'type_next', 'mode_type', 'scale_type', 'mode', 'order', 'class']
+
+
+def _chord_progression_catalogue_chunk(args):
+    # columns of all chord progressions in one parent scale, used by `iter_chord_progression_catalogue`
+    class_idx, scale_type, tonic, modes, n_notes, tuning = args
+    t = tuning
+    M = t.M
+
+    parent = AlteredDiatonicScale(f'{tonic} {scale_type}', t)
+    chords = [Chord(tuning=t).set_notes(body=parent.get_chord(root_degree=deg, n_notes=n_notes)) for deg in range(M)]
+    mode_types = ScaleBank([scale_type], [tonic], modes, t).get_name(type_only=True)
+    tonic_lidx = t.NNREL_TO_LIDX[parent[0].get_named_nnrel()]
+    order = parent.get_order()
+
+    columns = {column: [] for column in ['root_movement', 'type_prev', 'type_next', 'mode_type', 'mode']}
+    for mode, mode_type in zip(modes, mode_types):
+        for deg in range(1, M):
+            root_movement, type_prev, type_next = ChordProgression(chords[mode], chords[(mode + deg) % M]).get_movement()
+            columns['root_movement'].append(root_movement)
+            columns['type_prev'].append(type_prev)
+            columns['type_next'].append(type_next)
+            columns['mode_type'].append(mode_type[0])
+            columns['mode'].append(t.NAMED_STR_LIN[(tonic_lidx + mode) % M])
+
+    n_rows = len(columns['root_movement'])
+    columns = {column: np.array(values, dtype=object) for column, values in columns.items()}
+    columns['scale_type'] = np.full(n_rows, scale_type, dtype=object)
+    columns['order'] = np.full(n_rows, order, dtype=int)
+    columns['class'] = np.full(n_rows, class_idx, dtype=int)
+
+    return {column: columns[column] for column in CHORD_PROGRESSION_CATALOGUE_COLUMNS}
+
+
+def iter_chord_progression_catalogue(scale_types=None, tonic=None, modes=None, n_notes=4, tuning=None, processes=1):
+    """
+    catalogue of diatonic chord progressions (see `ChordProgression.get_movement`): for every parent scale
+    `AlteredDiatonicScale(f'{tonic} {scale_type}')`, chords on degree `mode` move to chords on all other degrees
+
+    one chunk (a dict of [?] column arrays, see `CHORD_PROGRESSION_CATALOGUE_COLUMNS`) is yielded per scale type (class),
+    so memory is bounded by one scale class; chunks can be computed by `processes` worker processes (still in order)
+
+    :param scale_types: default: all heptatonic scale types of `tuning` (if known)
+    :param tonic: tonic of parent scales, default: the first named note in generative order (e.g. 'F' in '12.7.5')
+    :param modes: degrees of parent scales, default: all degrees in generative order (e.g. [0, 4, 1, 5, 2, 6, 3])
+    """
+    t = get_tuning(tuning)
+    scale_types = list(t.ALL_SCALE_TYPES if scale_types is None else scale_types)
+    tonic = t.NAMED_STR_GEN[0] if tonic is None else tonic
+
+    if modes is None:
+        step = (t.NNREL_TO_LIDX[t.NAMED_NNREL_GEN[1]] - t.NNREL_TO_LIDX[t.NAMED_NNREL_GEN[0]]) % t.M
+        modes = [(step * k) % t.M for k in range(t.M)]
+    modes = [mode % t.M for mode in modes]
+
+    args = [(i, scale_type, tonic, modes, n_notes, t) for i, scale_type in enumerate(scale_types)]
+
+    if processes is None or processes <= 1:
+        for arg in args:
+            yield _chord_progression_catalogue_chunk(arg)
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            yield from pool.imap(_chord_progression_catalogue_chunk, args)
+
+
+def write_chord_progression_catalogue(path, scale_types=None, tonic=None, modes=None, n_notes=4, tuning=None, processes=1):
+    """
+    stream the catalogue of `iter_chord_progression_catalogue` to a csv file chunk by chunk
+
+    :return: number of rows written
+    """
+    n_rows = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CHORD_PROGRESSION_CATALOGUE_COLUMNS)
+        for chunk in iter_chord_progression_catalogue(scale_types, tonic, modes, n_notes, tuning, processes):
+            rows = list(zip(*[chunk[column].tolist() for column in CHORD_PROGRESSION_CATALOGUE_COLUMNS]))
+            writer.writerows(rows)
+            n_rows += len(rows)
+    return n_rows
+
+
+class ChordNameIndex(object):
+    def __init__(self, chord_types=None, tuning=None):
+        """
+        index from pitch class sets (bitmasks, bit `k` for nnrel `k`) and bass pitch classes to ranked chord names
+
+        every chord type (naming scheme 0) is compiled to a bitmask, then transposed to all `N` roots; inversions (bass in
+        chord) and slash chords (bass out of chord) are indexed too, so identification is a dict lookup (bitmasks are
+        python integers, `N` is not limited)
+
+        candidates of a (bitmask, bass) pair are ranked by: common named types (tertian, or with a 5th and at most 4 notes,
+        e.g. 6th and sus chords) > other named types (quartal, pentatonic, ...) > unnamed types (names in
+        `CHORD_TYPE_NS0_TO_NS1` of `tuning`, all types are named if no names are defined), then root position > inversion >
+        slash chord, then by the order of `chord_types`, then by the distance from bass to root; `get_names` drops unnamed
+        types and names with double accidentals if there are other candidates
+
+        :param chord_types: chord types in naming scheme 0, default: all chord types in `CHORD_TYPE_NS0_TO_NS1` of `tuning`
+                            and all triads and 7th chords of all scale types (diatonic modes if not known), see
+                            `ChordNameIndex._get_default_chord_types` for their order
+        """
+        t = get_tuning(tuning)
+        self._tuning = t
+        self._chord_types = unique(self._get_default_chord_types(t) if chord_types is None else list(chord_types))
+        self._templates = [compile_chord_type(chord_type, '', t)[0] for chord_type in self._chord_types]
+
+        named_types = CHORD_TYPE_NS0_TO_NS1.get(t.NGS, dict())
+        self._named = [not named_types or chord_type in named_types for chord_type in self._chord_types]
+        tiers = [(0 if self._is_common_type(chord_type) else 1) if named else 2 for chord_type, named in zip(self._chord_types, self._named)]
+
+        index = dict()
+        for type_idx, template in enumerate(self._templates):
+            tier = tiers[type_idx]
+            offsets = unique([delta_nnabs % t.N for delta_nnabs, delta_lidx, br357t in template])
+            for root in range(t.N):
+                mask = sum([1 << ((root + offset) % t.N) for offset in offsets])
+                index.setdefault((mask, None), []).append(((tier, 0, type_idx, 0), root, type_idx, None))
+                for k, offset in enumerate(offsets):
+                    bass = (root + offset) % t.N
+                    index.setdefault((mask, bass), []).append(((tier, 0 if k == 0 else 1, type_idx, (root - bass) % t.N), root, type_idx, k))
+                for bass in range(t.N):
+                    if not mask >> bass & 1:
+                        index.setdefault((mask | 1 << bass, bass), []).append(((tier, 2, type_idx, (root - bass) % t.N), root, type_idx, -1))
+
+        self._index = {key: tuple([entry[1:] for entry in sorted(entries)]) for key, entries in index.items()}
+        self._names = dict()
+
+    @staticmethod
+    def _is_tertian_type(chord_type):
+        # all notes on odd degrees, e.g. 'R.3.5.b7.9'
+        return all([int(re.sub(r'\D', '', r357) or '1') % 2 == 1 for r357 in chord_type.split('.')])
+
+    @staticmethod
+    def _is_common_type(chord_type):
+        # tertian types, and types with a 5th and at most 4 notes (6th, sus and add chords)
+        r357s = chord_type.split('.')
+        return ChordNameIndex._is_tertian_type(chord_type) or (any([re.sub(r'\D', '', r357) == '5' for r357 in r357s]) and len(r357s) <= 4)
+
+    @staticmethod
+    def _get_default_chord_types(tuning):
+        """
+        named chord types of `tuning`, and triads and 7th chords on every degree of every scale type (without double
+        accidentals), in naming scheme 0; named types go first, then tertian types (only odd degrees), then types of fewer
+        accidentals (alternative spellings, whose names end with '(!)', go after other named types)
+        """
+        t = tuning
+        named_types = CHORD_TYPE_NS0_TO_NS1.get(t.NGS, dict())
+        scale_types = t.ALL_SCALE_TYPES if t.ALL_SCALE_TYPES else [f'{s}-mode' for s in t.NAMED_STR_LIN]
+        bank = ScaleBank(scale_types, [t.NAMED_STR_LIN[0]], [0], t)
+
+        chord_types = list(named_types.keys())
+        for n_notes in [3, 4]:
+            for degree in range(t.M):
+                chords = bank.get_chord(degree, n_notes)
+                r357s = (chords - chords[:, :1]).normalize().get_r357t()
+                chord_types.extend(['.'.join(unique(row)) for row in r357s.tolist() if all([len(r357) < 3 for r357 in row])])
+        chord_types = unique(chord_types)
+
+        def _rank(k):
+            chord_type = chord_types[k]
+            n_accidentals = chord_type.count('#') + chord_type.count('b')
+            tertian = ChordNameIndex._is_tertian_type(chord_type)
+            if chord_type in named_types:
+                return 0, named_types[chord_type][0].endswith('(!)'), not tertian, n_accidentals, k
             else:
-                fake_m7 = True
-                for idx in range(1, len(itvs_abs)):
-                    # avoid_type_1: half tone above 7th chord note
-                    if any([itvs_abs[idx] - itvs_abs[j] == 1 for j in self._chord_notes]):
-                        labels[idx] = '[A1]'
-                    # avoid_type_1: half tone below M7
-                    if '7' in r357ts:
-                        idx_maj7 = r357ts.index('7')
-                        if itvs_abs[idx_maj7] - itvs_abs[idx] == 1:
-                            labels[idx] = '[A1]'
-
-        # if it not contain dom7, m7 and m7-5
-        if not (all([na in itvs_rel for na in [4, 10]]) or all([na in itvs_rel for na in [3, 10]])):
-            # avoid_type_1: half tone above 7th chord note
-            for idx in range(1, len(itvs_abs)):
-                if any([itvs_abs[idx] - itvs_abs[j] == 1 for j in self._chord_notes]):
+                return 1, False, not tertian, n_accidentals, k
+
+        return [chord_types[k] for k in sorted(range(len(chord_types)), key=_rank)]
+
+    def __len__(self):
+        return len(self._index)
+
+    def get_tuning(self):
+        return self._tuning
+
+    def get_chord_types(self):
+        return self._chord_types
+
+    def get_mask(self, notes):
+        # bitmask of notes (`Note` instances or nnabs integers)
+        N = self._tuning.N
+        mask = 0
+        for note in notes:
+            mask |= 1 << (int(note) % N)
+        return mask
+
+    def get(self, mask, bass=None):
+        """
+        ranked candidates of a pitch class set, every candidate is (root nnrel, chord type, bass), where bass is `None`
+        (not a slash chord), the index of bass in chord type, or -1 (bass out of chord)
+        """
+        entries = self._index.get((mask, bass if bass is None else bass % self._tuning.N), ())
+        return [(root, self._chord_types[type_idx], k) for root, type_idx, k in entries]
+
+    def get_names(self, mask, bass=None, key_center=None, ns=None):
+        """
+        ranked chord names of a pitch class set, roots (and bass out of chord) are named by `key_center`; names of every
+        (bitmask, bass, key center, ns) are remembered, unknown sets are named by `Chord.extract_parts_from_notes` once
+        """
+        t = self._tuning
+        ns = t.DEFAULT_CHORD_NS if ns is None else ns
+        bass = bass if bass is None else bass % t.N
+        key = (mask, bass, key_center, ns)
+
+        if key not in self._names:
+            names, preferred = [], []
+            for root, type_idx, k in self._index.get((mask, bass), ()):
+                root_note = Note(tuning=t).from_nnabs(root, key_center)
+                chord_type = t.chord_type_convertor(self._chord_types[type_idx], 0, 1) if ns == 1 else self._chord_types[type_idx]
+
+                if k is None or k == 0:
+                    bass_note = None
+                elif k > 0:
+                    delta_nnabs, delta_lidx, br357t = self._templates[type_idx][k]
+                    bass_note = root_note + Interval._new(delta_nnabs, delta_lidx, t)
+                else:
+                    bass_note = Note(tuning=t).from_nnabs(bass, key_center)
+                bass_type = '' if bass_note is None else '/' + bass_note.get_name(show_register=False)
+
+                names.append(f"{root_note.get_name(show_register=False)}{'' if ns == 1 else ' '}{chord_type}{bass_type}")
+                # unnamed types and double accidentals (e.g. 'Ebdim7/Dbb') are only kept if there is nothing else
+                if self._named[type_idx] and all([abs(note.get_accidental()) < 2 for note in [root_note, bass_note] if note is not None]):
+                    preferred.append(names[-1])
+            names = preferred if preferred else names
+
+            if not names and mask:
+                nnrels = [nnrel for nnrel in range(t.N) if mask >> nnrel & 1]
+                if bass is not None:
+                    nnrels = [bass] + [nnrel + t.N for nnrel in nnrels if nnrel < bass] + [nnrel for nnrel in nnrels if nnrel > bass]
+                    nnrels.sort()
+                notes = [Note(tuning=t).from_nnabs(nnrel, key_center) for nnrel in nnrels]
+                chord_bass, chord_body, chord_tension = Chord.extract_parts_from_notes(notes)
+                names.append(Chord(tuning=t).set_notes(chord_bass, chord_body, chord_tension).set_printoptions(ns=ns).get_name())
+
+            self._names[key] = unique(names)
+
+        return self._names[key]
+
+    def identify(self, notes, key_center=None, use_bass=True, ns=None):
+        # ranked chord names of a played voicing (`Note` instances or nnabs integers), the lowest note is bass
+        if not notes:
+            return []
+        bass = min([int(note) for note in notes]) if use_bass else None
+        return self.get_names(self.get_mask(notes), bass, key_center, ns)
+
+
+_CHORD_NAME_INDEXES = dict()
+
+
+def get_chord_name_index(tuning=None):
+    # default chord name index of a tuning (built on first use)
+    t = get_tuning(tuning)
+    if t not in _CHORD_NAME_INDEXES:
+        _CHORD_NAME_INDEXES[t] = ChordNameIndex(tuning=t)
+    return _CHORD_NAME_INDEXES[t]
+
+
+def get_voice_leading_distance(nnrels_1, nnrels_2, tuning=None):
+    """
+    minimal total motion (in nnrel steps) moving pitch class set `nnrels_1` to `nnrels_2`, every note of both sets is used,
+    notes of the smaller set are doubled if sizes differ; only crossing-free voice leadings (cyclic shifts of sorted
+    pitch classes) are compared, which contain a minimal one
+    """
+    N = get_tuning(tuning).N
+    a = np.array(sorted(set([nnrel % N for nnrel in nnrels_1])), dtype=int)
+    b = np.array(sorted(set([nnrel % N for nnrel in nnrels_2])), dtype=int)
+    if not a.size or not b.size:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+
+    # all doublings of the smaller set, [C, m]
+    m = len(a)
+    doublings = [sorted(list(b) + [b[k] for k in ks]) for ks in combinations_with_replacement(range(len(b)), m - len(b))]
+    b = np.array(doublings, dtype=int)
+
+    # all cyclic shifts, [C, m (shift), m]
+    shifts = (np.arange(m)[:, None] + np.arange(m)[None, :]) % m
+    delta = np.abs(a[None, None, :] - b[:, shifts]) % N
+    return int(np.minimum(delta, N - delta).sum(axis=-1).min())
+
+
+def _get_chord_key(chord):
+    # hashable note vectors of bass, body and tension notes
+    return tuple([tuple([note.get_vector() for note in part]) for part in [chord._bass, chord._body, chord._tension]])
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _analyse_chord_pair(prev_key, next_key, tuning, max_order, ns, bg_scale):
+    # analysis of 2 chords (see `analyse_progressions`), chords are given by `_get_chord_key`
+    t = tuning
+    chords = []
+    for key in [prev_key, next_key]:
+        bass, body, tension = [[Note._new(*vector, tuning=t) for vector in part] for part in key]
+        chords.append(Chord(tuning=t).set_notes(bass=bass, body=body, tension=tension))
+
+    cp = ChordProgression(*chords)
+    root_movement = cp.get_movement()[0]
+    root_step = (chords[1][0].get_nnrel() - chords[0][0].get_nnrel()) % t.N
+
+    nnrels_prev = set([note.get_nnrel() % t.N for note in chords[0]])
+    nnrels_next = set([note.get_nnrel() % t.N for note in chords[1]])
+    common_tones = len(nnrels_prev & nnrels_next)
+    voice_leading = get_voice_leading_distance(nnrels_prev, nnrels_next, t)
+
+    bg_scales = tuple(cp.get_bg_scale(max_order, ns)) if bg_scale else ()
+
+    return root_movement, root_step, common_tones, voice_leading, bg_scales
+
+
+def analyse_progressions(progressions, max_order=2, ns=None, bg_scale=True):
+    """
+    analyse every pair of adjacent chords in a progression (a list of `Chord` instances) or in a list of progressions
+
+    pairs are analysed once (LRU cache by note vectors, shared by all calls), results are [P] arrays of all P pairs:
+    'progression', 'position' (index of the first chord), 'root_movement' (normalized interval names), 'root_step'
+    (nnrel steps), 'common_tones' (number of common pitch classes), 'voice_leading' (see `get_voice_leading_distance`)
+    and 'bg_scales' (tuples of shared background scale names, see `ChordProgression.get_bg_scale`)
+    """
+    if progressions and isinstance(progressions[0], Chord):
+        progressions = [progressions]
+
+    keys = []
+    progression_idx = []
+    positions = []
+    for i, progression in enumerate(progressions):
+        chord_keys = [(chord.get_tuning(), _get_chord_key(chord)) for chord in progression]
+        for k, ((t, prev_key), (_, next_key)) in enumerate(zip(chord_keys[:-1], chord_keys[1:])):
+            keys.append((prev_key, next_key, t))
+            progression_idx.append(i)
+            positions.append(k)
+
+    # distinct pairs
+    pair_idx = dict()
+    inverse = np.array([pair_idx.setdefault(key, len(pair_idx)) for key in keys], dtype=int)
+    results = [_analyse_chord_pair(prev_key, next_key, t, max_order, ns, bg_scale) for prev_key, next_key, t in pair_idx]
+    results = list(zip(*results)) if results else [()] * 5
+
+    bg_scales = np.empty(len(results[4]), dtype=object)
+    for k, names in enumerate(results[4]):
+        bg_scales[k] = names
+
+    return dict(
+        progression=np.array(progression_idx, dtype=int),
+        position=np.array(positions, dtype=int),
+        root_movement=np.array(results[0], dtype=object)[inverse],
+        root_step=np.array(results[1], dtype=int)[inverse],
+        common_tones=np.array(results[2], dtype=int)[inverse],
+        voice_leading=np.array(results[3], dtype=int)[inverse],
+        bg_scales=bg_scales[inverse],
+    )
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _get_voicing_candidates(chord_key, tuning, n_voices, low, high, max_span, keep_bass):
+    """
+    all voicings of a chord (see `_get_chord_key`) with `n_voices` distinct pitches in nnabs range [`low`, `high`],
+    notes keep their spelling and only registers are changed
+
+    when the chord has more pitch classes than `n_voices`, only the most important ones are required: bass, root,
+    3rd and 7th, tensions, then 5th; when `keep_bass`, the lowest voice is the bass (or the root)
+
+    :return: [K, `n_voices`] nnabs array, and K tuples of note vectors
+    """
+    t = tuning
+    bass, body, tension = chord_key
+    M = t.M
+
+    def _rank(vector):
+        lidx = (t.NNREL_TO_LIDX[vector[0]] - t.NNREL_TO_LIDX[body[0][0]]) % M
+        return 0 if lidx == 0 else 1 if lidx in [2, M - 1] else 3 if lidx == 4 else 2
+
+    # one spelled note per pitch class, sorted by importance
+    vectors = sorted(body + tension, key=_rank)
+    vectors = list(bass) + vectors if bass else vectors
+    vectors = unique(vectors, key=lambda vector: (vector[0] + vector[1]) % t.N)
+    pcs = [(vector[0] + vector[1]) % t.N for vector in vectors]
+    bass_pc = pcs[0]
+    required = set(pcs[:n_voices])
+
+    # all pitches in range
+    pitches = []
+    for pc, (named_nnrel, accidental, register) in zip(pcs, vectors):
+        for register in range((low - named_nnrel - accidental) // t.N, (high - named_nnrel - accidental) // t.N + 1):
+            nnabs = named_nnrel + accidental + register * t.N
+            if low <= nnabs <= high:
+                pitches.append((nnabs, pc, (named_nnrel, accidental, register)))
+    pitches.sort()
+
+    nnabs_list = []
+    vectors_list = []
+    for voicing in combinations(pitches, n_voices):
+        if keep_bass and voicing[0][1] != bass_pc:
+            continue
+        if max_span is not None and voicing[-1][0] - voicing[0][0] > max_span:
+            continue
+        if not required.issubset([pc for nnabs, pc, vector in voicing]):
+            continue
+        nnabs_list.append([nnabs for nnabs, pc, vector in voicing])
+        vectors_list.append(tuple([vector for nnabs, pc, vector in voicing]))
+
+    return np.array(nnabs_list, dtype=int).reshape((-1, n_voices)), tuple(vectors_list)
+
+
+def get_voicing_candidates(chord, n_voices=4, low=None, high=None, max_span=None, keep_bass=True):
+    # all voicings of `chord` (see `_get_voicing_candidates`), `low` and `high` are note names or notes
+    t = chord.get_tuning()
+    low = int(Note(f'{t.NAMED_STR_LIN[0]}2' if low is None else low, t))
+    high = int(Note(f'{t.NAMED_STR_LIN[0]}4' if high is None else high, t))
+    nnabs_array, vectors_list = _get_voicing_candidates(_get_chord_key(chord), t, n_voices, low, high, max_span, keep_bass)
+    return [[Note._new(*vector, tuning=t) for vector in vectors] for vectors in vectors_list]
+
+
+def solve_voice_leading(chords, n_voices=4, low=None, high=None, max_span=None, keep_bass=True, beam_width=None, return_cost=False):
+    """
+    voicings of a chord sequence with minimal total motion (sum of nnabs steps of all voices, voices never cross),
+    solved by dynamic programming (Viterbi) over voicing candidates (see `get_voicing_candidates`)
+
+    every step takes O(K ** 2) time for K candidates per chord, so the sequence is solved in linear time; when
+    `beam_width` is given, only the best `beam_width` voicings of every chord are extended (O(`beam_width` * K))
+
+    :param low: lowest note (name or `Note`), default: (first named note) 2
+    :param high: highest note (name or `Note`), default: (first named note) 4
+    :param max_span: maximal nnabs distance between the lowest and the highest voice, default: no limit
+    :return: list of voicings (lists of notes, from low to high), (and total motion)
+    """
+    chords = list(chords)
+    if not chords:
+        return ([], 0) if return_cost else []
+
+    t = chords[0].get_tuning()
+    if any([chord.get_tuning() is not t for chord in chords]):
+        raise ValueError('Chords of a voice leading must have the same tuning!')
+
+    low = int(Note(f'{t.NAMED_STR_LIN[0]}2' if low is None else low, t))
+    high = int(Note(f'{t.NAMED_STR_LIN[0]}4' if high is None else high, t))
+
+    candidates = []
+    for chord in chords:
+        candidates.append(_get_voicing_candidates(_get_chord_key(chord), t, n_voices, low, high, max_span, keep_bass))
+        if not candidates[-1][1]:
+            raise ValueError(f'No voicing of {chord.get_name()} in given range!')
+
+    # forward pass, `alive` are indices of extended voicings of previous chord
+    costs = np.zeros(len(candidates[0][1]), dtype=int)
+    pointers = []
+    for (prev, _), (next, _) in zip(candidates[:-1], candidates[1:]):
+        alive = np.arange(len(prev))
+        if beam_width is not None and len(alive) > beam_width:
+            alive = np.argpartition(costs, beam_width - 1)[:beam_width]
+
+        total = costs[alive, None] + np.abs(prev[alive, None, :] - next[None, :, :]).sum(axis=-1)  # [A, K]
+        idx = np.argmin(total, axis=0)
+        costs = total[idx, np.arange(len(next))]
+        pointers.append(alive[idx])
+
+    # backward pass
+    k = int(np.argmin(costs))
+    cost = int(costs[k])
+    path = [k]
+    for pointer in reversed(pointers):
+        k = int(pointer[k])
+        path.append(k)
+    path.reverse()
+
+    voicings = [[Note._new(*vector, tuning=t) for vector in candidates[i][1][k]] for i, k in enumerate(path)]
+
+    if return_cost:
+        return voicings, cost
+    else:
+        return voicings
+
+
+''' ----------------------------------------------------------------------------------------- '''
+''' ************************************** jazz harmony ************************************* '''
+''' ----------------------------------------------------------------------------------------- '''
+
+
+@lru_cache(maxsize=None)
+def _get_avoid_note_intervals(tuning):
+    # delta nnabs of intervals used by avoid note rules, e.g. (in '12.7.5') half tone = m2 = 1, dom7 = {M3, m7} = {4, 10}
+    return dict([(name, Interval(name, tuning).get_delta_nnabs()) for name in ['m2', 'm3', 'M3', 'P4', 'M6', 'm7']])
+
+
+def _get_avoid_note_info(delta_nnabs_list, chord_notes, tuning):
+    """
+    avoid note labels of a chord scale, given by delta nnabs of its degrees (from scale tonic) and degrees of chord notes
+
+    :return: labels of degrees, long list (labels and br357ts of all `N` nnrels), if fake dom7, if fake m7
+    """
+    t = tuning
+    itvs = _get_avoid_note_intervals(t)
+    M = len(delta_nnabs_list)
+
+    itvs_abs = list(delta_nnabs_list)  # [0, 2, 3, 5, 7, 9, 10]
+    itvs_rel = [i % t.N for i in itvs_abs]  # [0, 2, 3, 5, 7, 9, 10] (?)
+    r357ts = [Interval._new(delta_nnabs, k, t).get_r357t() for k, delta_nnabs in enumerate(itvs_abs)]
+    fake_dom7 = False
+    fake_m7 = False
+
+    # add "[CN]" to every base chord note, and "[TN]" to every tension note
+    labels = ['[CN]' if k in chord_notes else '[TN]' for k in range(M)]
+
+    # half tone above base chord note, and half tone below M7
+    chord_itvs_abs = set([itvs_abs[j] for j in chord_notes])
+    above_chord_note = [itvs_abs[idx] - itvs['m2'] in chord_itvs_abs for idx in range(M)]
+    if '7' in r357ts:
+        below_maj7 = [itvs_abs[r357ts.index('7')] - itvs_abs[idx] == itvs['m2'] for idx in range(M)]
+    else:
+        below_maj7 = [False] * M
+
+    # if it contains dom7 / m7 / m7-5 chord (include enharmonic equivalents)
+    itvs_rel_set = set(itvs_rel)
+    has_dom7 = itvs['M3'] % t.N in itvs_rel_set and itvs['m7'] % t.N in itvs_rel_set
+    has_m7 = itvs['m3'] % t.N in itvs_rel_set and itvs['m7'] % t.N in itvs_rel_set
+
+    if has_dom7:
+        # if it contains real dom7 chord
+        if '3' in r357ts and 'b7' in r357ts:
+            # half tone above base chord note, but available because of dom7 base chord
+            for idx in range(1, M):
+                if above_chord_note[idx]:
+                    labels[idx] = '[OK]'
+            # avoid_type_0: tonic note in dom7 chord
+            if itvs['P4'] % t.N in itvs_rel_set:
+                labels[itvs_rel.index(itvs['P4'] % t.N)] = '[A0]'
+
+        # if it contains fake dom7 chord
+        else:
+            fake_dom7 = True
+            # avoid_type_1: half tone above base chord note, or half tone below M7
+            for idx in range(1, M):
+                if above_chord_note[idx] or below_maj7[idx]:
                     labels[idx] = '[A1]'
-                # avoid_type_1: half tone below M7
-                if '7' in r357ts:
-                    idx_maj7 = r357ts.index('7')
-                    if itvs_abs[idx_maj7] - itvs_abs[idx] == 1:
-                        labels[idx] = '[A1]'
 
-        long_list = ['x'] * 12
-        for i, n in enumerate(itvs_rel):
-            long_list[n] = labels[i] + ' ' + r357ts[i]
+    if has_m7:
+        # if it contains real m7 / m7-5 chord
+        if 'b3' in r357ts and 'b7' in r357ts:
+            # avoid_type_1: half tone above base chord note
+            for idx in range(1, M):
+                if above_chord_note[idx]:
+                    labels[idx] = '[A1]'
+            # avoid_type_2: dorian / locrian 13th
+            if itvs['M6'] % t.N in itvs_rel_set:
+                labels[itvs_rel.index(itvs['M6'] % t.N)] = '[A2]'
+
+        # if it contains fake m7 / m7-5 chord
+        else:
+            fake_m7 = True
+            # avoid_type_1: half tone above 7th chord note, or half tone below M7
+            for idx in range(1, M):
+                if above_chord_note[idx] or below_maj7[idx]:
+                    labels[idx] = '[A1]'
+
+    # if it not contain dom7, m7 and m7-5
+    if not (has_dom7 or has_m7):
+        # avoid_type_1: half tone above 7th chord note, or half tone below M7
+        for idx in range(1, M):
+            if above_chord_note[idx] or below_maj7[idx]:
+                labels[idx] = '[A1]'
+
+    long_list = ['x'] * t.N
+    for i, n in enumerate(itvs_rel):
+        long_list[n] = labels[i] + ' ' + r357ts[i]
+
+    return tuple(labels), tuple(long_list), fake_dom7, fake_m7
+
+
+_AVOID_NOTE_TABLES = dict()
+
+
+def get_avoid_note_table(tuning=None):
+    """
+    avoid note table of a tuning: (delta nnabs of scale degrees, bitmask of chord note degrees) -> avoid note info
+    (see `_get_avoid_note_info`); all modes of all scale types with 7th chords are precomputed, other keys are added
+    on first use
+    """
+    t = get_tuning(tuning)
+    if t not in _AVOID_NOTE_TABLES:
+        table = dict()
+        if t.ALL_SCALE_TYPES:
+            chord_notes = [(t.STEP_LENGTH_CHD_LIN * k) % t.M for k in range(4)]
+            chord_mask = sum([1 << k for k in chord_notes])
+            delta_nnabs = ScaleBank(tonics=[t.NAMED_STR_LIN[0]], tuning=t).get_intervals_cum().get_delta_nnabs()
+            for delta_nnabs_list in set([tuple(row) for row in delta_nnabs.tolist()]):
+                table[(delta_nnabs_list, chord_mask)] = _get_avoid_note_info(delta_nnabs_list, chord_notes, t)
+        _AVOID_NOTE_TABLES[t] = table
+    return _AVOID_NOTE_TABLES[t]
+
+
+def get_avoid_note_labels(delta_nnabs_list, chord_notes, tuning=None):
+    # avoid note info of a chord scale (see `_get_avoid_note_info`), looked up in the avoid note table
+    t = get_tuning(tuning)
+    table = get_avoid_note_table(t)
+    key = (tuple(delta_nnabs_list), sum([1 << k for k in set(chord_notes)]))
+    if key not in table:
+        table[key] = _get_avoid_note_info(key[0], sorted(set(chord_notes)), t)
+    labels, long_list, fake_dom7, fake_m7 = table[key]
+    return list(labels), list(long_list), fake_dom7, fake_m7
+
+
+def label_chord_scales(scale_types=None, tonic=None, modes=None, chord_notes=None, tuning=None):
+    """
+    avoid note labels of all modes of all scale types at once, rows are scales of `ScaleBank(scale_types, [tonic], modes)`,
+    `scale_types` defaults to all heptatonic scale types of `tuning` (or the diatonic scale if not known)
+
+    :return: dict of 'scale_type' [K] (indices), 'mode' [K], 'labels' [K, M], 'long_list' [K, N], 'fake_dom7' [K] and
+             'fake_m7' [K]
+    """
+    t = get_tuning(tuning)
+    chord_notes = [(t.STEP_LENGTH_CHD_LIN * k) % t.M for k in range(4)] if chord_notes is None else chord_notes
+    if scale_types is None:
+        scale_types = t.ALL_SCALE_TYPES if t.ALL_SCALE_TYPES else [f'{t.NAMED_STR_LIN[0]}-mode']
+    bank = ScaleBank(scale_types, [t.NAMED_STR_LIN[0] if tonic is None else tonic], modes, t)
+
+    keys, inverse = np.unique(bank.get_intervals_cum().get_delta_nnabs(), axis=0, return_inverse=True)
+    infos = [get_avoid_note_labels(key, chord_notes, t) for key in keys.tolist()]
+
+    labels = np.array([info[0] for info in infos], dtype=object).reshape((-1, t.M))
+    long_list = np.array([info[1] for info in infos], dtype=object).reshape((-1, t.N))
+    fake_dom7 = np.array([info[2] for info in infos], dtype=bool)
+    fake_m7 = np.array([info[3] for info in infos], dtype=bool)
+
+    inverse = inverse.ravel()
+    tonic_idx, type_idx, mode_idx = bank.get_indices()
+    return dict(
+        scale_type=type_idx,
+        mode=np.array(bank.get_modes(), dtype=int)[mode_idx],
+        labels=labels[inverse],
+        long_list=long_list[inverse],
+        fake_dom7=fake_dom7[inverse],
+        fake_m7=fake_m7[inverse],
+    )
+
+
+class ChordScale(AlteredDiatonicScale):
+    def __init__(self, scale_name, tuning=None):
+        super().__init__(scale_name, tuning)
+
+        t = self._tuning
+        self._chord_notes = [(t.STEP_LENGTH_CHD_LIN * k) % t.M for k in range(4)]
+        self._tension_notes = [k for k in range(t.M) if k not in self._chord_notes]
+
+        self._refresh()
+
+    def __repr__(self):
+        return '\n'.join([f"ChordScale('{scale_name}')" for scale_name in self.get_name()])
 
-        return labels, long_list, fake_dom7, fake_m7
+    def _get_info(self):
+        # labels are looked up in the avoid note table of current tuning (see `get_avoid_note_table`)
+        delta_nnabs_list = [interval.get_delta_nnabs() for interval in self.get_intervals_cum()]
+        return get_avoid_note_labels(delta_nnabs_list, self._chord_notes, self._tuning)
 
     def _refresh(self):
         labels, long_list, fake_dom7, fake_m7 = self._get_info()
@@ -1726,8 +3758,8 @@ class ChordScale(AlteredDiatonicScale):
         self._fake_m7 = fake_m7
 
     def set_chord_notes(self, chord_notes=(0, 2, 4, 6)):
-        self._chord_notes = chord_notes
-        self._tension_notes = [k for k in range(7) if k not in self._chord_notes]
+        self._chord_notes = list(chord_notes)
+        self._tension_notes = [k for k in range(self._tuning.M) if k not in self._chord_notes]
         self._refresh()
 
         return self
@@ -1772,38 +3804,128 @@ class MyFraction(Fraction):
             raise TypeError
 
 
+def get_gidx_batch(chords, tuning=None):
+    """
+    pack a batch of chords (lists of notes, of any lengths) into a padded [B, L] gidx array and a [B, L] boolean mask
+    of valid entries, the input of `get_span_batch()`, `get_polar_batch()` and `get_mass_center_batch()`; pass the same
+    `tuning` to them (gidxs are taken mod its `N`)
+    """
+    chords = [list(chord) for chord in chords]
+    t = get_tuning(tuning if tuning is not None or not chords or not chords[0] else chords[0][0].get_tuning())
+    L = max([len(chord) for chord in chords], default=0)
+
+    vectors = np.zeros((len(chords), L, 3), dtype=int)
+    vectors[:, :, 0] = t.NAMED_NNREL_LIN[0]
+    mask = np.zeros((len(chords), L), dtype=bool)
+    for b, chord in enumerate(chords):
+        if chord:
+            vectors[b, :len(chord)] = [note.get_vector() for note in chord]
+            mask[b, :len(chord)] = True
+
+    gidxs = NoteArray._new(vectors[..., 0], vectors[..., 1], vectors[..., 2], t).get_gidx()
+    return gidxs, mask
+
+
+def _get_sorted_gidx_batch(gidxs, mask, N):
+    # pitch classes (gidx mod N) of every row in ascending order, padded entries repeat the first valid entry, so they
+    # only add zero-width gaps; `gaps[:, k]` is the (cyclic) distance from `sorted_gidxs[:, k]` to the next pitch class
+    gidxs = np.where(mask, gidxs, np.take_along_axis(gidxs, np.argmax(mask, axis=-1)[:, None], axis=-1)) % N
+    sorted_gidxs = np.sort(gidxs, axis=-1)
+    gaps = np.diff(np.concatenate([sorted_gidxs, sorted_gidxs[:, :1] + N], axis=-1), axis=-1)
+    return gidxs, sorted_gidxs, gaps
+
+
+def _as_gidx_batch(gidxs, mask):
+    gidxs = np.asarray(gidxs, dtype=int)
+    mask = np.ones(gidxs.shape, dtype=bool) if mask is None else np.broadcast_to(np.asarray(mask, dtype=bool), gidxs.shape)
+    if gidxs.ndim == 1:
+        return gidxs[None, :], mask[None, :], True
+    return gidxs, mask, False
+
+
+def get_span_batch(gidxs, mask=None, enharmonic=False, tuning=None):
+    """
+    vectorized `get_span()`, `gidxs` is a [L] gidx array or a padded [B, L] batch (see `get_gidx_batch()`),
+    returns an integer (for [L]) or a [B] array
+    """
+    N = get_tuning(tuning).N
+    gidxs, mask, squeeze = _as_gidx_batch(gidxs, mask)
+
+    if enharmonic:
+        spans = N - _get_sorted_gidx_batch(gidxs, mask, N)[2].max(axis=-1)
+    else:
+        spans = np.where(mask, gidxs, np.iinfo(int).min).max(axis=-1) - np.where(mask, gidxs, np.iinfo(int).max).min(axis=-1)
+
+    return int(spans[0]) if squeeze else spans
+
+
+def get_polar_batch(gidxs, mask=None, enharmonic=False, tuning=None):
+    """
+    vectorized `get_polar()`, returns column indices `(bottoms, tops)` of polar note pairs, each of shape [B, P] and
+    padded with -1 (there may be several pairs when `enharmonic=True`, in the same order as `get_polar()`),
+    or of shape [P] for a [L] gidx array
+    """
+    N = get_tuning(tuning).N
+    gidxs, mask, squeeze = _as_gidx_batch(gidxs, mask)
+    B, L = gidxs.shape
+
+    if enharmonic:
+        gidxs, sorted_gidxs, gaps = _get_sorted_gidx_batch(gidxs, mask, N)
+        # every largest gap gives a pair: the pitch class after the gap is the bottom, the one before it is the top
+        is_pole = (gaps == gaps.max(axis=-1, keepdims=True)) & (gaps > 0)
+        order = np.argsort(~is_pole, axis=-1, kind='stable')
+        P = max(int(is_pole.sum(axis=-1).max(initial=0)), 1)
+        order, valid = order[:, :P], np.take_along_axis(is_pole, order[:, :P], axis=-1)
+
+        # map pitch classes back to the first column holding them
+        first_column = lambda pcs: np.argmax((gidxs[:, None, :] == pcs[:, :, None]) & mask[:, None, :], axis=-1)
+        tops = first_column(np.take_along_axis(sorted_gidxs, order, axis=-1))
+        bottoms = first_column(np.take_along_axis(sorted_gidxs, (order + 1) % L, axis=-1))
+        bottoms, tops = np.where(valid, bottoms, -1), np.where(valid, tops, -1)
+    else:
+        bottoms = np.argmin(np.where(mask, gidxs, np.iinfo(int).max), axis=-1)[:, None]
+        tops = np.argmax(np.where(mask, gidxs, np.iinfo(int).min), axis=-1)[:, None]
+        bottoms, tops = np.where(mask.any(axis=-1, keepdims=True), bottoms, -1), np.where(mask.any(axis=-1, keepdims=True), tops, -1)
+
+    return (bottoms[0], tops[0]) if squeeze else (bottoms, tops)
+
+
+def get_mass_center_batch(gidxs, mask=None):
+    # mean gidx of every row (the "color" of `get_color()`), returns a float (for [L]) or a [B] array
+    gidxs, mask, squeeze = _as_gidx_batch(gidxs, mask)
+    mass_centers = np.where(mask, gidxs, 0).sum(axis=-1) / np.maximum(mask.sum(axis=-1), 1)
+    return float(mass_centers[0]) if squeeze else mass_centers
+
+
 def get_span(notes, enharmonic=False):
+    N = notes[0].get_tuning().N
     gidxs = [note.get_gidx() for note in notes]
     if enharmonic:
-        gidxs = sorted(unique([gidx % N for gidx in gidxs]))
+        gidxs = sorted(set([gidx % N for gidx in gidxs]))
         gidxs_closed = [*gidxs, gidxs[0] + N]
-        gidxs_delta = [j - i for i, j in zip(gidxs_closed[:-1], gidxs_closed[1:])]
-        return N - max(gidxs_delta)
+        return N - max([j - i for i, j in zip(gidxs_closed[:-1], gidxs_closed[1:])])
     else:
         return max(gidxs) - min(gidxs)
 
 
 def get_polar(notes, enharmonic=False):
+    N = notes[0].get_tuning().N
     gidxs = [note.get_gidx() for note in notes]
     if enharmonic:
         gidxs_original = [gidx % N for gidx in gidxs]
-        gidxs = sorted(unique(gidxs_original))
+        gidxs = sorted(set(gidxs_original))
         gidxs_closed = [*gidxs, gidxs[0] + N]
         gidxs_delta = [j - i for i, j in zip(gidxs_closed[:-1], gidxs_closed[1:])]
+        delta_max = max(gidxs_delta)
 
-        indices_max = []
-        for idx, gidx in enumerate(gidxs_delta):
-            if gidx == max(gidxs_delta):
-                indices_max.append(idx)
-        indices_min = [s + 1 for s in indices_max]
-
-        max_polar_gidxs = [gidxs_closed[idx] for idx in indices_max]
-        min_polar_gidxs = [gidxs_closed[idx] for idx in indices_min]
-
-        indices_min = [gidxs_original.index(gidx % N) for gidx in max_polar_gidxs]
-        indices_max = [gidxs_original.index(gidx % N) for gidx in min_polar_gidxs]
+        # first note of every pitch class
+        indices = dict()
+        for idx, gidx in enumerate(gidxs_original):
+            indices.setdefault(gidx, idx)
 
-        return [(notes[idx_min], notes[idx_max]) for idx_min, idx_max in zip(indices_max, indices_min)]
+        # the pitch class after every largest gap is the bottom, the one before it is the top
+        indices_max = [idx for idx, delta in enumerate(gidxs_delta) if delta == delta_max]
+        return [(notes[indices[gidxs_closed[idx + 1] % N]], notes[indices[gidxs_closed[idx]]]) for idx in indices_max]
     else:
         idx_min = gidxs.index(min(gidxs))
         idx_max = gidxs.index(max(gidxs))
@@ -1819,9 +3941,12 @@ def get_color(notes, use_fraction=True):
         return sum(gidxs) / len(gidxs)
 
 
-def get_chromatic_polar_notes(key_center=DEFAULT_KEY_CENTER):
-    inf = Note(key_center).add_gidx(-((N - 1) // 2))
-    sup = Note(key_center).add_gidx(N // 2)
+def get_chromatic_polar_notes(key_center=None, tuning=None):
+    t = get_tuning(tuning)
+    key_center = t.DEFAULT_KEY_CENTER if key_center is None else key_center
+
+    inf = Note(key_center, t).add_gidx(-((t.N - 1) // 2))
+    sup = Note(key_center, t).add_gidx(t.N // 2)
     return inf, sup
 
 
@@ -1867,8 +3992,9 @@ def get_functions(notes):
 def get_sorted_chords(ads):
     c_note = get_characteristic_note(ads)
 
-    chords_3 = [Chord().set_notes(body=ads.get_chord(k, 3)) for k in range(M)]
-    chords_4 = [Chord().set_notes(body=ads.get_chord(k, 4)) for k in range(M)]
+    t = ads.get_tuning()
+    chords_3 = [Chord(tuning=t).set_notes(body=ads.get_chord(k, 3)) for k in range(t.M)]
+    chords_4 = [Chord(tuning=t).set_notes(body=ads.get_chord(k, 4)) for k in range(t.M)]
 
     chords_c, chords_t, chords_r = [], [], []
     if chords_3[0].get_name(type_only=True) == 'm':
@@ -1895,6 +4021,137 @@ def get_sorted_chords(ads):
     return chords_c, chords_t, chords_r
 
 
+TENSION_TABLE_COLUMNS = ['chord_name', 'chord_notes', 'chord_root', 'chord_span', 'chord_lower_pole', 'chord_upper_pole',
+                         'chord_mass_center', 'tension_note', 'tension_position', 'new_span', 'tension_type']
+
+
+def _get_tension_line(tuning):
+    # all notes of at most one accidental in generative order, e.g. (in '12.7.5') Gb, Db, ..., F, C, ..., B, F#, ..., A#
+    t = tuning
+    return [Note(t.NAMED_STR_GEN[0], t).add_gidx(k) for k in range(-(t.N - t.M), t.N)]
+
+
+def _tension_table_chunk(args):
+    # columns of one chord type on all roots against all candidate notes, used by `iter_tension_table`
+    chord_type, roots, notes, ns, tuning = args
+    t = tuning
+    N, M, G = t.N, t.M, t.G
+
+    # chord notes, [R, L]; candidate notes, [K]
+    template = compile_chord_type(chord_type, '', t)[0]
+    intervals = IntervalArray._new(np.array([v[0] for v in template]), np.array([v[1] for v in template]), t)
+    roots = NoteArray._new(*[v[:, None] for v in roots.get_vector()], t)
+    chords = roots + intervals
+    R, L, K = len(roots), len(intervals), len(notes)
+
+    chord_gidxs = chords.get_gidx()
+    chord_pcs = chords.get_nnrel() % N
+    note_pcs = notes.get_nnrel() % N
+    root_pcs = chord_pcs[:, :1]
+
+    # span and poles of chords, [R]
+    chord_spans = get_span_batch(chord_gidxs, enharmonic=True, tuning=t)
+    bottoms, tops = get_polar_batch(chord_gidxs, enharmonic=True, tuning=t)
+    chord_mass_centers = np.trunc(get_mass_center_batch(chord_gidxs)).astype(int)
+
+    # spans of chords with every candidate note, [R, K]
+    gidxs_ex = np.concatenate([np.repeat(chord_gidxs[:, None, :], K, axis=1), np.broadcast_to(notes.get_gidx()[None, :, None], (R, K, 1))], axis=-1)
+    new_spans = get_span_batch(gidxs_ex.reshape(R * K, L + 1), enharmonic=True, tuning=t).reshape(R, K)
+
+    # tension types, from the most unacceptable to the most acceptable, [R, K]
+    itvs = (note_pcs[None, :, None] - chord_pcs[:, None, :]) % N
+    is_m3 = (chords - chords[:, :1]).normalize() == Interval('m3', t)
+    minor = is_m3.any(axis=-1)[:, None]
+    m2 = _get_avoid_note_intervals(t)['m2']
+    m2_above_r5 = np.isin((note_pcs[None, :] - root_pcs - m2) % N, [0, G])
+    conditions = [
+        # chord notes // [T0], red
+        (itvs == 0).any(axis=-1),
+        # m2 above avoids (except dominant 7th chord, minor chord R, P5) // [T5], black
+        (itvs == m2).any(axis=-1) & (chord_spans < M - 1)[:, None] & (~minor | ~m2_above_r5),
+        # natural and altered at same time // [T4], gray
+        (notes.get_named_nnrel()[None, :, None] == chords.get_named_nnrel()[:, None, :]).any(axis=-1),
+        # m2 above minor chord R, P5 // [T3], blue
+        minor & m2_above_r5,
+        # enlarge span // [T2], orange
+        new_spans > chord_spans[:, None],
+    ]
+    tension_types = np.select(conditions, ['T0', 'T5', 'T4', 'T3', 'T2'], 'T1').astype(object)
+
+    # names are formatted per chord (or per note) and repeated over rows
+    chord_type_name = t.chord_type_convertor(chord_type, 0, 1) if ns == 1 else chord_type
+    note_names = chords.get_name(show_register=False)
+    root_names = note_names[:, 0]
+    pole = lambda indices: [', '.join([note_names[r, k] for k in row if k >= 0]) for r, row in enumerate(indices.tolist())]
+    mass_centers = NoteArray([t.NAMED_STR_GEN[0]], t).add_gidx(chord_mass_centers).get_name(show_register=False)
+    per_chord = {
+        'chord_name': [f"{root_name}{'' if ns == 1 else ' '}{chord_type_name}" for root_name in root_names.tolist()],
+        'chord_notes': [', '.join(row) for row in note_names.tolist()],
+        'chord_root': root_names.tolist(),
+        'chord_span': chord_spans.tolist(),
+        'chord_lower_pole': pole(bottoms),
+        'chord_upper_pole': pole(tops),
+        'chord_mass_center': mass_centers.tolist(),
+    }
+    columns = {column: np.repeat(np.array(values, dtype=object), K) for column, values in per_chord.items()}
+    columns['chord_span'] = np.repeat(chord_spans, K)
+    columns['tension_note'] = np.tile(notes.get_name(show_register=False), R)
+    columns['tension_position'] = (notes[None, :] - chords[:, 0][:, None]).normalize().get_r357t().ravel()
+    columns['new_span'] = new_spans.ravel()
+    columns['tension_type'] = tension_types.ravel()
+
+    return {column: columns[column] for column in TENSION_TABLE_COLUMNS}
+
+
+def iter_tension_table(chord_types=None, roots=None, notes=None, ns=None, tuning=None):
+    """
+    tension classification of candidate notes against chords: T0 (chord notes), T5 (avoid notes, m2 above chord notes),
+    T4 (natural and altered at same time), T3 (m2 above minor chord R, P5), T2 (available, enlarges span of chord)
+    and T1 (available)
+
+    one chunk (a dict of [R * K] column arrays, see `TENSION_TABLE_COLUMNS`) is yielded per chord type, rows are
+    roots x candidate notes
+
+    :param chord_types: chord types in naming scheme 0, default: all chord types in `CHORD_TYPE_NS0_TO_NS1` of `tuning`
+                        (or the chord types of `ChordNameIndex` if no names are defined)
+    :param roots: roots of chords (note names or `Note` instances), default: same as `notes`
+    :param notes: candidate notes, default: all notes of at most one accidental, e.g. (in '12.7.5') 'Gb' to 'A#' on the
+                  line of fifths
+    """
+    t = get_tuning(tuning)
+    ns = t.DEFAULT_CHORD_NS if ns is None else ns
+    if chord_types is None:
+        chord_types = list(CHORD_TYPE_NS0_TO_NS1.get(t.NGS, dict()).keys()) or ChordNameIndex._get_default_chord_types(t)
+    notes = NoteArray(_get_tension_line(t) if notes is None else notes, t)
+    roots = notes if roots is None else NoteArray(roots, t)
+
+    for chord_type in chord_types:
+        yield _tension_table_chunk((chord_type, roots, notes, ns, t))
+
+
+def get_tension_table(chord_types=None, roots=None, notes=None, ns=None, tuning=None):
+    # all chunks of `iter_tension_table` in one table
+    chunks = list(iter_tension_table(chord_types, roots, notes, ns, tuning))
+    return {column: np.concatenate([chunk[column] for chunk in chunks]) for column in TENSION_TABLE_COLUMNS}
+
+
+def write_tension_table(path, chord_types=None, roots=None, notes=None, ns=None, tuning=None):
+    """
+    stream the table of `iter_tension_table` to a csv file chunk by chunk
+
+    :return: number of rows written
+    """
+    n_rows = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(TENSION_TABLE_COLUMNS)
+        for chunk in iter_tension_table(chord_types, roots, notes, ns, tuning):
+            rows = list(zip(*[chunk[column].tolist() for column in TENSION_TABLE_COLUMNS]))
+            writer.writerows(rows)
+            n_rows += len(rows)
+    return n_rows
+
+
 ''' ----------------------------------------------------------------------------------------- '''
 ''' *************************************** deprecated ************************************** '''
 ''' ----------------------------------------------------------------------------------------- '''
@@ -2014,3 +4271,106 @@ def circular_permutation_with_repetition(n, ns):
 
     # circular permutation with repetition
     return sum([_phi(d)*_f(n//d)//_prod([_f(n_k//d) for n_k in ns]) for d in ds])//n
+
+
+def get_scale_class_count(tuning=None):
+    # number of `M`-note scale classes in `N`-TET, i.e. binary necklaces of `M` ones and `N - M` zeros
+    t = get_tuning(tuning)
+    return circular_permutation_with_repetition(t.N, [t.M, t.N - t.M])
+
+
+def get_canonical_steps(nnrel_list, tuning=None):
+    """
+    canonical step vector of a scale class, which is the lexicographically least rotation of the step vector, e.g.
+
+    (in '12.7.5') [E, F#, G#, A, B, C#, D#] -> (2, 2, 1, 2, 2, 2, 1) -> (1, 2, 2, 1, 2, 2, 2)
+
+    it's hashable, and same for all modes and transpositions of a scale, so it can be used as a key of scale classes
+    """
+    N = get_tuning(tuning).N
+    nnrel_list = sorted([nnrel % N for nnrel in nnrel_list])
+    steps = [n2 - n1 for n1, n2 in zip(nnrel_list, nnrel_list[1:] + [nnrel_list[0] + N])]
+    return min([tuple(steps[k:] + steps[:k]) for k in range(len(steps))])
+
+
+def iter_scale_classes(tuning=None):
+    """
+    enumerate canonical step vectors (see `get_canonical_steps`) of all `M`-note scale classes in `N`-TET, e.g.
+
+    (in '12.7.5') (1, 1, 1, 1, 1, 1, 6), (1, 1, 1, 1, 1, 2, 5), ..., (1, 2, 2, 1, 2, 2, 2), ...
+
+    step vectors are generated as necklaces (FKM algorithm) of positive integers whose sum is `N`, in lexicographic
+    order, so every scale class is yielded exactly once without comparing to others
+    """
+    t = get_tuning(tuning)
+    N, M = t.N, t.M
+
+    # `steps[1:]` is current prenecklace, `steps[0]` is a sentinel of the least step
+    steps = [1] * (M + 1)
+
+    def _fkm(k, p, s):
+        # fill `steps[k]`, `p` is the period of `steps[1:k]`, `s` is the sum of `steps[1:k]`
+        if k > M:
+            if M % p == 0 and s == N:
+                yield tuple(steps[1:])
+            return
+
+        # all steps are not less than the first one, and the last step must make the sum `N`
+        v_min = steps[k - p]
+        v_max = N - s - (M - k) * (steps[1] if k > 1 else v_min)
+        if k == M:
+            v_min = max(v_min, N - s)
+
+        for v in range(v_min, v_max + 1):
+            steps[k] = v
+            yield from _fkm(k + 1, p if v == steps[k - p] else k, s + v)
+
+    yield from _fkm(1, 1, 0)
+
+
+def _name_scale_classes(args):
+    # order and lowest-order scale types of scale classes (canonical modes), used by `iter_named_scale_classes`
+    steps_list, tuning = args
+    index = get_scale_name_index(tuning)
+
+    out = []
+    for steps in steps_list:
+        scale_class_key = tuple(np.cumsum((0, ) + steps[:-1]).tolist())
+        out.append((steps, scale_class_key, index.get(scale_class_key)))
+
+    return out
+
+
+def iter_named_scale_classes(tuning=None, processes=1, chunk_size=256):
+    """
+    enumerate all `M`-note scale classes in `N`-TET with their orders and lowest-order scale types (ns 0/1/2), e.g.
+
+    (in '12.7.5') ((1, 2, 2, 1, 2, 2, 2), 0, [('B-mode', 'Locrian', 'Locrian')])
+
+    scale types are of the canonical mode (starting with the least step), the searching of them can be distributed to
+    `processes` worker processes, every `chunk_size` scale classes at a time (results are still in enumerating order)
+    """
+    t = get_tuning(tuning)
+
+    def _chunks():
+        chunk = []
+        for steps in iter_scale_classes(t):
+            chunk.append(steps)
+            if len(chunk) == chunk_size:
+                yield chunk, t
+                chunk = []
+        if chunk:
+            yield chunk, t
+
+    if processes is None or processes <= 1:
+        for args in _chunks():
+            for steps, scale_class_key, (order, scale_types, offsets) in _name_scale_classes(args):
+                yield steps, order, scale_types
+    else:
+        # entries searched by workers are merged into the index of this process (and persisted with it)
+        index = get_scale_name_index(t)
+        with multiprocessing.Pool(processes) as pool:
+            for results in pool.imap(_name_scale_classes, _chunks()):
+                for steps, scale_class_key, entry in results:
+                    index.add(scale_class_key, entry)
+                    yield steps, entry[0], entry[1]